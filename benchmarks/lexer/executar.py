@@ -0,0 +1,173 @@
+"""
+Benchmark de vazão dos lexers.
+
+Gera (ou lê) um corpus .cd e mede, para cada implementação, tokens/s, MB/s e
+pico de memória (RSS). `analise_lexica_afd` (fora do conjunto padrão) é o
+`analise_lexica` de `analisador_lexico.py`, que agora é o LexerAFD mais a
+conversão para o `Token` antigo. Cada implementação roda em um subprocesso próprio para
+que o pico de RSS de uma não contamine a outra. O resultado sai em JSON para
+acompanhar regressões ao longo do tempo.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.lexer.executar --tamanho 1M --repeticoes 3 --json resultado.json
+    python -m benchmarks.lexer.executar --arquivo examples/avancados/advanced.cd --impl Lexer LexerAFD
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.lexer.gerador_corpus import GeradorCorpus, interpretar_mix, interpretar_tamanho
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def _analise_lexica_afd(fonte: str) -> int:
+    # `analise_lexica` hoje delega ao front-end único (LexerAFD) e só converte
+    # os tokens para o formato antigo: mede o LexerAFD mais a conversão, não o
+    # lexer legado que existia antes.
+    from src.lexer.analisador_lexico import analise_lexica
+    tokens = analise_lexica(fonte)
+    if tokens and tokens[-1].tipo == 'LEXICAL_ERROR':
+        raise RuntimeError(f"analise_lexica parou em erro léxico: {tokens[-1]}")
+    return len(tokens)
+
+
+def _lexer(nome_classe: str) -> Callable[[str], int]:
+    def executar(fonte: str) -> int:
+        import src.lexer as lexer
+        from src.utils.erros import ErrorHandler
+        return len(getattr(lexer, nome_classe)(fonte, ErrorHandler(buffered=True)).tokenize_all())
+    return executar
+
+
+def _token_buffer(fonte: str) -> int:
+    from src.lexer import LexerAFD, TokenBuffer
+    from src.utils.erros import ErrorHandler
+    return len(TokenBuffer.tokenizar(fonte, ErrorHandler(buffered=True), lexer_cls=LexerAFD))
+
+
+IMPLEMENTACOES: Dict[str, Callable[[str], int]] = {
+    'analise_lexica_afd': _analise_lexica_afd,
+    'Lexer': _lexer('Lexer'),
+    'LexerRegexMestre': _lexer('LexerRegexMestre'),
+    'LexerAFD': _lexer('LexerAFD'),
+    'TokenBuffer': _token_buffer,
+}
+PADRAO = ['Lexer', 'LexerRegexMestre', 'LexerAFD']
+
+
+def pico_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é em KB no Linux e em bytes no macOS
+    return pico // 1024 if sys.platform == 'darwin' else pico
+
+
+def medir(impl: str, arquivo: str, repeticoes: int) -> dict:
+    """Executa `impl` sobre `arquivo` no processo atual e retorna as métricas."""
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        fonte = f.read()
+    tamanho_mb = len(fonte.encode('utf-8')) / (1 << 20)
+    funcao = IMPLEMENTACOES[impl]
+
+    tempos = []
+    tokens = 0
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        tokens = funcao(fonte)
+        tempos.append(time.perf_counter() - inicio)
+
+    melhor = min(tempos)
+    return {
+        'impl': impl,
+        'tokens': tokens,
+        'segundos': melhor,
+        'segundos_todos': tempos,
+        'tokens_por_s': tokens / melhor if melhor else None,
+        'mb_por_s': tamanho_mb / melhor if melhor else None,
+        'rss_pico_kb': pico_rss_kb(),
+    }
+
+
+def medir_em_subprocesso(impl: str, arquivo: str, repeticoes: int) -> dict:
+    cmd = [sys.executable, '-m', 'benchmarks.lexer.executar', '--interno', impl,
+           '--arquivo', arquivo, '--repeticoes', str(repeticoes)]
+    proc = subprocess.run(cmd, cwd=RAIZ, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return {'impl': impl, 'erro': proc.stderr.strip().splitlines()[-1] if proc.stderr else 'falhou'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark de vazão dos lexers do Codon")
+    ap.add_argument('--arquivo', help="fonte .cd existente (em vez de gerar um corpus)")
+    ap.add_argument('--tamanho', default='1M', help="tamanho do corpus gerado (ex.: 256K, 4M)")
+    ap.add_argument('--mix', default='', help="pesos por categoria, ex.: identificadores=6,bio=2")
+    ap.add_argument('--semente', type=int, default=0)
+    ap.add_argument('--tamanho-bio', type=int, default=60)
+    ap.add_argument('--repeticoes', type=int, default=3)
+    ap.add_argument('--impl', nargs='+', default=PADRAO, choices=sorted(IMPLEMENTACOES))
+    ap.add_argument('--json', help="grava o relatório neste arquivo (padrão: stdout)")
+    ap.add_argument('--interno', help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.interno:
+        print(json.dumps(medir(args.interno, args.arquivo, args.repeticoes)))
+        return
+
+    temporario = None
+    if args.arquivo:
+        arquivo = os.path.abspath(args.arquivo)
+        corpus = {'arquivo': arquivo}
+    else:
+        mix = interpretar_mix(args.mix)
+        fonte = GeradorCorpus(mix, args.semente, args.tamanho_bio).gerar(interpretar_tamanho(args.tamanho))
+        temporario = tempfile.NamedTemporaryFile('w', suffix='.cd', encoding='utf-8', delete=False)
+        with temporario:
+            temporario.write(fonte)
+        arquivo = temporario.name
+        corpus = {'gerado': True, 'semente': args.semente, 'mix': mix, 'tamanho_bio': args.tamanho_bio}
+    corpus['bytes'] = os.path.getsize(arquivo)
+
+    try:
+        resultados: List[dict] = []
+        for impl in args.impl:
+            r = medir_em_subprocesso(impl, arquivo, args.repeticoes)
+            resultados.append(r)
+            if 'erro' in r:
+                print(f"{impl:<18} ERRO: {r['erro']}", file=sys.stderr)
+            else:
+                print(f"{impl:<18} {r['tokens']:>9} tokens  {r['tokens_por_s']:>12,.0f} tok/s  "
+                      f"{r['mb_por_s']:>7.2f} MB/s  RSS {r['rss_pico_kb']} KB", file=sys.stderr)
+    finally:
+        if temporario is not None:
+            os.unlink(arquivo)
+
+    relatorio = {
+        'benchmark': 'lexer',
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'repeticoes': args.repeticoes,
+        'corpus': corpus,
+        'resultados': resultados,
+    }
+    saida = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            f.write(saida + '\n')
+    else:
+        print(saida)
+
+
+if __name__ == '__main__':
+    main()
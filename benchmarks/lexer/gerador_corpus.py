@@ -0,0 +1,181 @@
+"""
+Gerador de fontes .cd sintéticos para benchmarks do lexer.
+
+Produz funções com declarações, atribuições, laços, condicionais e chamadas
+a `print`, seguindo a gramática de `docs/gramatica-formal-atualizada.md`. A
+proporção de cada categoria de token é controlada por `mix`. O corpus usa
+apenas construções que o antigo `analise_lexica` também reconhecia
+(comentários `/" ... "/` ficam no fim da linha, sem `[`/`]`/`!`), para que
+resultados de antes e depois do front-end único sejam comparáveis.
+
+Uso:
+    python -m benchmarks.lexer.gerador_corpus --tamanho 1M --saida corpus.cd
+"""
+import argparse
+import random
+from typing import Dict, Optional
+
+MIX_PADRAO: Dict[str, int] = {
+    'identificadores': 6,
+    'numeros': 3,
+    'strings': 2,
+    'comentarios': 2,
+    'bio': 1,
+}
+
+_OPERADORES = ['+', '-', '*', '/', '%', '==', '!=', '<', '>', '<=', '>=', '&&', '||']
+_ATRIBUICOES = ['=', '+=', '-=', '*=']
+_PALAVRAS = ['alfa', 'beta', 'gama', 'delta', 'conc', 'volume', 'amostra', 'indice',
+             'fator', 'total', 'placa', 'poco', 'leitura', 'seq', 'gene', 'codon']
+_ALFABETOS = {'dna': 'ACGT', 'rna': 'ACGU', 'prot': 'ACDEFGHIKLMNPQRSTVWY'}
+
+
+def interpretar_tamanho(texto: str) -> int:
+    """'512K', '4M', '1G' ou bytes."""
+    texto = texto.strip().upper().rstrip('B')
+    mult = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}.get(texto[-1:], 1)
+    return int(float(texto.rstrip('KMG')) * mult)
+
+
+def interpretar_mix(texto: str) -> Dict[str, int]:
+    """'identificadores=6,bio=2' -> dict, partindo de MIX_PADRAO."""
+    mix = dict(MIX_PADRAO)
+    for item in filter(None, texto.split(',')):
+        nome, _, peso = item.partition('=')
+        if nome not in mix:
+            raise ValueError(f"Categoria desconhecida no mix: {nome!r}")
+        mix[nome] = int(peso)
+    return mix
+
+
+class GeradorCorpus:
+    def __init__(self, mix: Optional[Dict[str, int]] = None, semente: int = 0,
+                 tamanho_bio: int = 60, expoentes: bool = True):
+        self.mix = dict(MIX_PADRAO if mix is None else mix)
+        self.rnd = random.Random(semente)
+        self.tamanho_bio = tamanho_bio
+        # o parser ainda não aceita FLOAT_EXP; desligue para gerar fontes analisáveis
+        self.expoentes = expoentes
+        self._categorias = [c for c, p in self.mix.items() if p > 0]
+        self._pesos = [self.mix[c] for c in self._categorias]
+
+    # ---------- átomos ----------
+
+    def identificador(self) -> str:
+        r = self.rnd
+        nome = r.choice(_PALAVRAS)
+        if r.random() < 0.5:
+            nome += f"_{r.randint(0, 99)}"
+        return nome
+
+    def numero(self) -> str:
+        r = self.rnd
+        forma = r.randint(0, 2 if self.expoentes else 1)
+        if forma == 0:
+            return str(r.randint(0, 100000))
+        if forma == 1:
+            return f"{r.randint(0, 999)}.{r.randint(0, 999)}"
+        return f"{r.randint(1, 9)}.{r.randint(0, 99)}e{r.choice(['', '-', '+'])}{r.randint(1, 12)}"
+
+    def string(self) -> str:
+        palavras = ' '.join(self.rnd.choice(_PALAVRAS) for _ in range(self.rnd.randint(1, 6)))
+        return f'"{palavras}"'
+
+    def bio(self) -> str:
+        prefixo = self.rnd.choice(list(_ALFABETOS))
+        n = self.rnd.randint(self.tamanho_bio // 2, self.tamanho_bio * 3 // 2)
+        return prefixo + '"' + ''.join(self.rnd.choices(_ALFABETOS[prefixo], k=n)) + '"'
+
+    def comentario(self) -> str:
+        texto = ' '.join(self.rnd.choice(_PALAVRAS) for _ in range(self.rnd.randint(2, 8)))
+        return self.rnd.choice([f'// {texto}', f'/" {texto} "/'])
+
+    # ---------- construções ----------
+
+    def operando(self) -> str:
+        cat = self.rnd.choices(self._categorias, self._pesos)[0]
+        if cat == 'numeros':
+            return self.numero()
+        if cat == 'strings':
+            return self.string()
+        if cat == 'bio':
+            return self.bio()
+        return self.identificador()
+
+    def expressao(self, profundidade: int = 0) -> str:
+        r = self.rnd
+        if profundidade > 2 or r.random() < 0.4:
+            return self.operando()
+        esq = self.expressao(profundidade + 1)
+        dir_ = self.expressao(profundidade + 1)
+        if r.random() < 0.2:
+            return f"({esq} {r.choice(_OPERADORES)} {dir_})"
+        return f"{esq} {r.choice(_OPERADORES)} {dir_}"
+
+    def instrucao(self, recuo: str) -> str:
+        r = self.rnd
+        tipo = r.randint(0, 5)
+        if tipo == 0:
+            linha = f"var {self.identificador()} = {self.expressao()};"
+        elif tipo == 1:
+            linha = f"{self.identificador()} {r.choice(_ATRIBUICOES)} {self.expressao()};"
+        elif tipo == 2:
+            linha = f"print({self.expressao()});"
+        elif tipo == 3:
+            linha = (f"if ({self.expressao()}) {{\n{recuo}    {self.identificador()} = {self.expressao()};\n"
+                     f"{recuo}}} else {{\n{recuo}    print({self.operando()});\n{recuo}}}")
+        elif tipo == 4:
+            linha = (f"while ({self.identificador()} < {self.numero()}) {{\n"
+                     f"{recuo}    {self.identificador()} += 1;\n{recuo}}}")
+        else:
+            linha = f"{self.identificador()}({self.expressao()}, {self.operando()});"
+        if 'comentarios' in self._categorias and r.random() < self.mix['comentarios'] / sum(self._pesos):
+            linha += ' ' + self.comentario()
+        return recuo + linha
+
+    def funcao(self) -> str:
+        r = self.rnd
+        params = ', '.join(f"{self.identificador()}: int" for _ in range(r.randint(0, 3)))
+        corpo = '\n'.join(self.instrucao('    ') for _ in range(r.randint(3, 12)))
+        return f"function {self.identificador()}({params}): int {{\n{corpo}\n    return 0;\n}}\n"
+
+    def gerar(self, tamanho: int) -> str:
+        partes = []
+        total = 0
+        while total < tamanho:
+            f = self.funcao()
+            partes.append(f)
+            total += len(f.encode('utf-8'))
+        return '\n'.join(partes)
+
+    def gerar_linhas(self, linhas: int) -> str:
+        """Como `gerar`, mas para quando o fonte atinge `linhas` linhas."""
+        partes = []
+        total = 0
+        while total < linhas:
+            f = self.funcao()
+            partes.append(f)
+            total += f.count('\n') + 1
+        return '\n'.join(partes)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument('--tamanho', default='1M', help="tamanho aproximado (ex.: 256K, 4M)")
+    ap.add_argument('--mix', default='', help="pesos por categoria, ex.: identificadores=6,bio=2")
+    ap.add_argument('--semente', type=int, default=0)
+    ap.add_argument('--tamanho-bio', type=int, default=60, help="bases médias por literal biológico")
+    ap.add_argument('--saida', default='-')
+    args = ap.parse_args(argv)
+
+    texto = GeradorCorpus(interpretar_mix(args.mix), args.semente, args.tamanho_bio).gerar(
+        interpretar_tamanho(args.tamanho))
+    if args.saida == '-':
+        print(texto)
+    else:
+        with open(args.saida, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(texto)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""
+Benchmark de vazão e alocação do parser.
+
+Mede `Parser.parse` (os tokens são gerados antes, fora da medição) sobre a
+árvore `examples/` e sobre programas sintéticos de 10^3 a 10^6 linhas, e
+reporta, para cada entrada: linhas/s, nós da AST/s, pico de memória do parse
+via tracemalloc e os locais que mais alocaram. Com `--perfil DIR`, grava um
+dump do cProfile por entrada em DIR e resume o tempo por regra da gramática
+(`_instrucao_if`, `_exp_primaria_ou_acesso`...). O relatório sai em JSON para
+comparar antes/depois de cada mudança no parser.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.parser.executar --linhas 1K 10K 100K --json antes.json
+    python -m benchmarks.parser.executar --linhas 1M --sem-exemplos --parser iterativo
+    python -m benchmarks.parser.executar --linhas 10K --perfil perfis/
+"""
+import argparse
+import cProfile
+import gc
+import json
+import os
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.lexer.gerador_corpus import GeradorCorpus
+from benchmarks.parser.memoria_ast import contar_nos
+from src.frontend import tokenizar
+from src.lexer.analisador_lexico_completo import TokenStreamIndexado
+from src.parser.ast.ast_base import Parser, Programa
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.parser.ast.parser_iterativo import ParserIterativo
+from src.utils.erros import ErrorHandler
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+EXAMPLES_DIR = os.path.join(RAIZ, 'examples')
+DIR_PARSER = os.path.join(RAIZ, 'src', 'parser')
+
+PARSERS = {'base': Parser, 'pratt': ParserPratt, 'iterativo': ParserIterativo}
+
+# Uma entrada é uma lista de (nome, fonte); os exemplos viram uma entrada só.
+Entrada = List[Tuple[str, str]]
+
+
+def interpretar_linhas(texto: str) -> int:
+    """'1K', '100K', '1M' ou um inteiro."""
+    texto = texto.strip().upper()
+    mult = {'K': 10 ** 3, 'M': 10 ** 6}.get(texto[-1:], 1)
+    return int(float(texto.rstrip('KM')) * mult)
+
+
+def carregar_exemplos(diretorio: str = EXAMPLES_DIR) -> Entrada:
+    fontes = []
+    for raiz, dirs, nomes in os.walk(diretorio):
+        dirs.sort()
+        for nome in sorted(nomes):
+            if nome.endswith('.cd'):
+                with open(os.path.join(raiz, nome), 'r', encoding='utf-8') as f:
+                    fontes.append((os.path.relpath(os.path.join(raiz, nome), RAIZ), f.read()))
+    return fontes
+
+
+def contar_linhas(fonte: str) -> int:
+    return fonte.count('\n') + (not fonte.endswith('\n'))
+
+
+def _analisar_todos(parser_cls, tokenizados) -> Tuple[List[Programa], int]:
+    programas, erros = [], 0
+    for tokens in tokenizados:
+        eh = ErrorHandler(buffered=True)
+        programas.append(parser_cls(TokenStreamIndexado(tokens), eh).parse())
+        erros += len(eh.errors)
+    return programas, erros
+
+
+def medir_alocacoes(parser_cls, tokenizados, top: int) -> Tuple[int, List[dict]]:
+    """Pico de memória durante o parse e os `top` locais com mais bytes vivos no fim."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        programas = _analisar_todos(parser_cls, tokenizados)
+        pico = tracemalloc.get_traced_memory()[1] - base
+        foto = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del programas
+    foto = foto.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    locais = [
+        {'local': f"{os.path.relpath(s.traceback[0].filename, RAIZ)}:{s.traceback[0].lineno}",
+         'bytes': s.size, 'blocos': s.count}
+        for s in foto.statistics('lineno')[:top]
+    ]
+    return pico, locais
+
+
+def perfil_por_regra(parser_cls, tokenizados, destino: Optional[str]) -> List[dict]:
+    """Roda o parse sob cProfile e resume as funções do pacote `src/parser` (as regras)."""
+    perfil = cProfile.Profile()
+    perfil.runcall(_analisar_todos, parser_cls, tokenizados)
+    if destino:
+        perfil.dump_stats(destino)
+    regras = []
+    for (arquivo, _, funcao), (_, chamadas, proprio, acumulado, _) in pstats.Stats(perfil).stats.items():
+        if os.path.abspath(arquivo).startswith(DIR_PARSER):
+            # o invólucro de `_com_span` aparece uma vez só, somando todas as regras decoradas
+            funcao = '<_com_span>' if funcao == 'envolvida' else funcao
+            regras.append({'regra': funcao, 'arquivo': os.path.relpath(arquivo, RAIZ), 'chamadas': chamadas,
+                           'proprio_s': proprio, 'acumulado_s': acumulado})
+    regras.sort(key=lambda r: r['proprio_s'], reverse=True)
+    return regras
+
+
+def medir(nome: str, fontes: Entrada, parser_cls, repeticoes: int, top: int,
+          perfil_dir: Optional[str]) -> dict:
+    tokenizados = [tokenizar(fonte, ErrorHandler(buffered=True)) for _, fonte in fontes]
+    linhas = sum(contar_linhas(fonte) for _, fonte in fontes)
+
+    tempos = []
+    programas, erros = [], 0
+    for _ in range(repeticoes):
+        gc.collect()
+        inicio = time.perf_counter()
+        programas, erros = _analisar_todos(parser_cls, tokenizados)
+        tempos.append(time.perf_counter() - inicio)
+    nos = sum(contar_nos(p) for p in programas)
+    del programas
+
+    pico, locais = medir_alocacoes(parser_cls, tokenizados, top)
+    melhor = min(tempos)
+    resultado = {
+        'entrada': nome,
+        'arquivos': len(fontes),
+        'linhas': linhas,
+        'tokens': sum(len(t) for t in tokenizados),
+        'nos': nos,
+        'erros_sintaticos': erros,
+        'segundos': melhor,
+        'segundos_todos': tempos,
+        'linhas_por_s': linhas / melhor if melhor else None,
+        'nos_por_s': nos / melhor if melhor else None,
+        'pico_bytes': pico,
+        'top_alocacoes': locais,
+    }
+    if perfil_dir is not None:
+        os.makedirs(perfil_dir, exist_ok=True)
+        destino = os.path.join(perfil_dir, f"{nome}.prof")
+        resultado['perfil'] = destino
+        resultado['regras'] = perfil_por_regra(parser_cls, tokenizados, destino)
+    return resultado
+
+
+def _imprimir(r: dict, top: int):
+    print(f"{r['entrada']:<12} {r['linhas']:>9} linhas {r['nos']:>10} nós  "
+          f"{r['linhas_por_s']:>12,.0f} linhas/s {r['nos_por_s']:>12,.0f} nós/s  "
+          f"pico {r['pico_bytes'] / (1 << 20):8.2f} MB", file=sys.stderr)
+    for a in r['top_alocacoes'][:top]:
+        print(f"    {a['bytes'] / 1024:10.1f} KB {a['blocos']:>9} blocos  {a['local']}", file=sys.stderr)
+    for regra in r.get('regras', [])[:top]:
+        print(f"    {regra['proprio_s']:8.3f}s próprio {regra['acumulado_s']:8.3f}s acumulado "
+              f"{regra['chamadas']:>9} chamadas  {regra['regra']}", file=sys.stderr)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark de vazão e alocação do parser do Codon")
+    ap.add_argument('--linhas', nargs='*', default=['1K', '10K', '100K'],
+                    help="tamanhos dos programas sintéticos (ex.: 1K 100K 1M)")
+    ap.add_argument('--arquivo', nargs='*', default=[], help="fontes .cd extras, uma entrada cada")
+    ap.add_argument('--sem-exemplos', action='store_true', help="não mede a árvore examples/")
+    ap.add_argument('--parser', default='pratt', choices=sorted(PARSERS))
+    ap.add_argument('--semente', type=int, default=0)
+    ap.add_argument('--repeticoes', type=int, default=3)
+    ap.add_argument('--top', type=int, default=10, help="locais de alocação/regras listados")
+    ap.add_argument('--perfil', metavar='DIR', help="grava um .prof do cProfile por entrada em DIR")
+    ap.add_argument('--json', help="grava o relatório neste arquivo (padrão: stdout)")
+    args = ap.parse_args(argv)
+
+    entradas: Dict[str, Entrada] = {}
+    if not args.sem_exemplos:
+        entradas['exemplos'] = carregar_exemplos()
+    for caminho in args.arquivo:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            entradas[os.path.splitext(os.path.basename(caminho))[0]] = [(caminho, f.read())]
+    for texto in args.linhas:
+        gerador = GeradorCorpus(semente=args.semente, expoentes=False)
+        entradas[f"sintetico_{texto}"] = [(texto, gerador.gerar_linhas(interpretar_linhas(texto)))]
+
+    parser_cls = PARSERS[args.parser]
+    resultados = []
+    for nome, fontes in entradas.items():
+        r = medir(nome, fontes, parser_cls, args.repeticoes, args.top, args.perfil)
+        _imprimir(r, args.top)
+        resultados.append(r)
+
+    relatorio = {
+        'benchmark': 'parser',
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'parser': parser_cls.__name__,
+        'repeticoes': args.repeticoes,
+        'semente': args.semente,
+        'resultados': resultados,
+    }
+    saida = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            f.write(saida + '\n')
+    else:
+        print(saida)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark de memória da AST.
+
+Analisa um programa gerado (ou um .cd existente) e mede, com tracemalloc,
+quanto ocupa a árvore com os nós atuais (dataclasses com __slots__ e span)
+comparada à mesma árvore reconstruída com dataclasses equivalentes sem
+__slots__ e sem campos de posição (o layout anterior). As duas árvores são
+construídas pelo mesmo conversor e compartilham os valores das folhas, então
+a diferença medida é só a dos nós e das listas.
+
+Uso (na raiz do projeto):
+    python -m benchmarks.parser.memoria_ast --tamanho 4M
+    python -m benchmarks.parser.memoria_ast --arquivo examples/avancados/advanced.cd --json memoria.json
+"""
+import argparse
+import dataclasses
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks.lexer.gerador_corpus import GeradorCorpus, interpretar_tamanho
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.analisador_lexico_completo import TokenStreamIndexado
+from src.parser.ast import ast_base
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.utils.erros import ErrorHandler
+
+
+def classes_sem_slots():
+    """Dataclasses comuns com os mesmos campos próprios de cada nó (sem line/col/span)."""
+    espelhos = {}
+    for nome in dir(ast_base):
+        cls = getattr(ast_base, nome)
+        if isinstance(cls, type) and issubclass(cls, ast_base.ASTNode) and cls is not ast_base.ASTNode:
+            campos = [(f.name, f.type) for f in dataclasses.fields(cls) if not f.kw_only]
+            espelhos[cls] = dataclasses.make_dataclass(nome, campos)
+    return espelhos
+
+
+def reconstruir(valor, classes):
+    """Copia a árvore trocando cada nó pela classe de `classes` (None = mesma classe)."""
+    if isinstance(valor, ast_base.ASTNode):
+        cls = type(valor)
+        args = [reconstruir(getattr(valor, f.name), classes) for f in dataclasses.fields(cls) if not f.kw_only]
+        novo = (classes or {}).get(cls, cls)(*args)
+        if classes is None:
+            novo.line, novo.col, novo.span_start, novo.span_end = (
+                valor.line, valor.col, valor.span_start, valor.span_end)
+        return novo
+    if isinstance(valor, list):
+        return [reconstruir(v, classes) for v in valor]
+    if isinstance(valor, tuple):
+        return tuple(reconstruir(v, classes) for v in valor)
+    return valor
+
+
+def contar_nos(valor) -> int:
+    pilha, total = [valor], 0
+    while pilha:
+        v = pilha.pop()
+        if isinstance(v, ast_base.ASTNode):
+            total += 1
+            pilha.extend(getattr(v, f.name) for f in dataclasses.fields(v))
+        elif isinstance(v, (list, tuple)):
+            pilha.extend(v)
+    return total
+
+
+def medir_bytes(construir) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        arvore = construir()
+        depois = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del arvore
+    return depois - antes
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Memória da AST do Codon (nós com e sem __slots__)")
+    ap.add_argument('--arquivo', help="fonte .cd existente (em vez de gerar um corpus)")
+    ap.add_argument('--tamanho', default='1M', help="tamanho do corpus gerado (ex.: 256K, 4M)")
+    ap.add_argument('--semente', type=int, default=0)
+    ap.add_argument('--json', help="grava o relatório neste arquivo (padrão: stdout)")
+    args = ap.parse_args(argv)
+
+    if args.arquivo:
+        with open(args.arquivo, 'r', encoding='utf-8') as f:
+            fonte = f.read()
+        corpus = {'arquivo': args.arquivo}
+    else:
+        fonte = GeradorCorpus(semente=args.semente, expoentes=False).gerar(interpretar_tamanho(args.tamanho))
+        corpus = {'gerado': True, 'semente': args.semente}
+    corpus['bytes'] = len(fonte.encode('utf-8'))
+
+    eh = ErrorHandler(buffered=True)
+    programa = ParserPratt(TokenStreamIndexado(LexerAFD(fonte, eh)), eh).parse()
+    if eh.has_errors():
+        print(f"[AVISO] {len(eh.errors)} erro(s) ao analisar o corpus", file=sys.stderr)
+
+    espelhos = classes_sem_slots()
+    com_slots = medir_bytes(lambda: reconstruir(programa, None))
+    sem_slots = medir_bytes(lambda: reconstruir(programa, espelhos))
+    nos = contar_nos(programa)
+
+    print(f"{nos} nós  com __slots__: {com_slots / (1 << 20):.2f} MB ({com_slots / nos:.1f} B/nó)  "
+          f"sem __slots__: {sem_slots / (1 << 20):.2f} MB ({sem_slots / nos:.1f} B/nó)  "
+          f"redução {sem_slots / com_slots:.2f}x", file=sys.stderr)
+
+    relatorio = {
+        'benchmark': 'memoria_ast',
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'corpus': corpus,
+        'nos': nos,
+        'bytes_com_slots': com_slots,
+        'bytes_sem_slots': sem_slots,
+        'reducao': sem_slots / com_slots if com_slots else None,
+    }
+    saida = json.dumps(relatorio, indent=2, ensure_ascii=False)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            f.write(saida + '\n')
+    else:
+        print(saida)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,24 +7,108 @@ Permite executar 'codon run <arquivo>' de qualquer lugar.
 import sys
 import os
 
+def comando_lote(cmd, args):
+    """Executa 'codon lex' / 'codon check' sobre vários arquivos ou diretórios."""
+    from src.lote import executar_lote
+
+    jobs = None
+    max_erros = None
+    quiet = False
+    semantica = False
+    dir_semantico = None
+    cache = True
+    caminhos = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ('--jobs', '-j') and i + 1 < len(args):
+            jobs = int(args[i + 1])
+            i += 1
+        elif arg.startswith('--jobs='):
+            jobs = int(arg.split('=', 1)[1])
+        elif arg == '--max-errors' and i + 1 < len(args):
+            max_erros = int(args[i + 1])
+            i += 1
+        elif arg.startswith('--max-errors='):
+            max_erros = int(arg.split('=', 1)[1])
+        elif arg in ('--quiet', '-q'):
+            quiet = True
+        elif arg == '--semantic':
+            semantica = True
+        elif arg == '--no-cache':
+            cache = False
+        else:
+            caminhos.append(arg)
+        i += 1
+
+    inexistentes = [c for c in caminhos if not os.path.exists(c)]
+    if inexistentes:
+        for c in inexistentes:
+            print(f"[ERRO] Arquivo não encontrado: {c}")
+        sys.exit(1)
+
+    if semantica and cache:
+        # estado da análise incremental, ao lado do cache de ASTs
+        from src.semantic.incremental import diretorio_padrao
+        dir_semantico = diretorio_padrao()
+
+    resultados = executar_lote(caminhos, modo=cmd, jobs=jobs, max_erros=max_erros,
+                               semantica=semantica, dir_semantico=dir_semantico)
+
+    total_tokens = 0
+    total_erros = 0
+    for r in resultados:
+        total_tokens += r.tokens
+        total_erros += len(r.diagnosticos)
+        for d in r.diagnosticos:
+            print(f"{r.arquivo}:{d}")
+
+    if not quiet:
+        print(f"[INFO] {len(resultados)} arquivo(s), {total_tokens} tokens, {total_erros} erro(s)")
+    if total_erros:
+        sys.exit(1)
+
 def main():
     """Entry point para o comando 'codon' instalado globalmente."""
     # Importa a função de compilação
     from src.compilador import compile_cd
+    from src.utils.erros import CompilationError
+
+    def compilar(run):
+        try:
+            return compile_cd(arquivo, run=run, cache=cache, estrito=estrito,
+                              otimizar=otimizar)
+        except CompilationError as e:
+            # os diagnósticos já foram impressos pela etapa que falhou
+            print(f"[ERRO] Falha na compilação: {e}", file=sys.stderr)
+            sys.exit(1)
     
     def print_help():
         print("Uso:")
         print("  codon run <arquivo.cd>     # Compila e executa")
         print("  codon build <arquivo.cd>   # Apenas compila (imprime LLVM IR)")
         print("  codon build <arquivo.cd> --quiet  # Sem mensagens informativas")
+        print("  codon run|build <arquivo.cd> --no-cache  # Não usa o cache de ASTs em disco")
+        print("  codon run|build <arquivo.cd> --strict    # Erros semânticos interrompem a compilação")
+        print("  codon run|build <arquivo.cd> -O          # Dobra expressões constantes antes do codegen")
+        print("  codon lex <arquivos/dirs...> [--jobs N] [--max-errors N]    # Tokeniza em lote (só diagnósticos)")
+        print("  codon check <arquivos/dirs...> [--jobs N] [--max-errors N]  # Tokeniza e analisa a sintaxe em lote")
+        print("  codon check <arquivos/dirs...> --semantic [--no-cache]  # + análise semântica incremental")
     
     if len(sys.argv) < 3:
         print_help()
         sys.exit(1)
     
     cmd = sys.argv[1]
+    if cmd in ("lex", "check"):
+        comando_lote(cmd, sys.argv[2:])
+        return
+
     arquivo = sys.argv[2]
     quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    cache = '--no-cache' not in sys.argv
+    estrito = '--strict' in sys.argv
+    otimizar = '-O' in sys.argv or '--optimize' in sys.argv
     
     # Converte para caminho absoluto para funcionar de qualquer diretório
     if not os.path.isabs(arquivo):
@@ -44,7 +128,7 @@ def main():
             print(f"[INFO] Caminho: {arquivo}")
             print("")
         
-        compile_cd(arquivo, run=True)
+        compilar(run=True)
     elif cmd == "build":
         # Mensagem informativa
         if not quiet:
@@ -52,7 +136,7 @@ def main():
             print(f"[INFO] Caminho: {arquivo}")
             print("[INFO] Gerando LLVM IR...")
         
-        ir = compile_cd(arquivo, run=False)
+        ir = compilar(run=False)
         
         # Verifica se compilou com sucesso
         if isinstance(ir, str):
@@ -8,6 +8,28 @@ from src.parser.ast.ast_base import (
     InstrucaoBreak, InstrucaoContinue, LiteralArray, InstrucaoLoopInfinito,
     DeclaracaoClasse, CriacaoClasse, AcessoCampo, InstrucaoLoopForEach, LiteralRange, CriacaoArray2D, LiteralTuple, DeclaracaoEnum, CriacaoMapa
 )
+from src.semantic.tipos import (
+    BIOLOGICOS, BOOL, DECIMAL, FLOAT, INT, N_PRIMITIVOS, NUMERICOS, STRING, TEXTUAIS, por_id, tipo
+)
+
+# Tipos LLVM dos nomes de tipo com representação própria, pelo id no universo
+# de tipos; os demais (classes e enums à parte) são ponteiros i8*
+_TIPOS_LLVM: Dict[int, ir.Type] = {
+    DECIMAL.id: ir.DoubleType(), FLOAT.id: ir.DoubleType(), tipo('double').id: ir.DoubleType(),
+    STRING.id: ir.IntType(8).as_pointer(), BOOL.id: ir.IntType(1), INT.id: ir.IntType(32),
+}
+
+
+def _classe(esq, dir_) -> Optional[str]:
+    if esq in BIOLOGICOS | TEXTUAIS and dir_ in BIOLOGICOS | TEXTUAIS:
+        return 'string'
+    if esq in NUMERICOS and dir_ in NUMERICOS:
+        return 'int' if esq is dir_ is INT else 'float'
+    return None
+
+
+# Classe de operação ('string', 'float', 'int' ou None) por par de primitivos
+_CLASSE_OPERANDOS = [_classe(por_id(e), por_id(d)) for e in range(N_PRIMITIVOS) for d in range(N_PRIMITIVOS)]
 
 
 class LLVMCodeGenerator:
@@ -25,8 +47,8 @@ class LLVMCodeGenerator:
         # Generics: rastreia declarações genéricas e instanciações
         self.generic_functions: Dict[str, DeclaracaoFuncao] = {}  # nome -> declaração
         self.generic_classes: Dict[str, DeclaracaoClasse] = {}  # nome -> declaração
-        self.instantiated_functions: Dict[Tuple[str, Tuple[str, ...]], str] = {}  # (nome, tipos) -> nome_mangled
-        self.instantiated_classes: Dict[Tuple[str, Tuple[str, ...]], str] = {}  # (nome, tipos) -> nome_mangled
+        self.instantiated_functions: Dict[Tuple[str, Tuple[int, ...]], str] = {}  # (nome, ids dos tipos) -> nome_mangled
+        self.instantiated_classes: Dict[Tuple[str, Tuple[int, ...]], str] = {}  # (nome, ids dos tipos) -> nome_mangled
 
     # -------------------------
     # Entrada: gerar código LLVM IR para o programa
@@ -532,68 +554,51 @@ class LLVMCodeGenerator:
             # Gera operandos
             lhs = self._gen_expr(expr.esquerda)
             rhs = self._gen_expr(expr.direita)
-            
-            # Normaliza tipos: se um é double e outro int, converte int para double
-            if isinstance(lhs.type, ir.DoubleType) and isinstance(rhs.type, ir.IntType):
-                rhs = self.builder.sitofp(rhs, ir.DoubleType())
-            elif isinstance(rhs.type, ir.DoubleType) and isinstance(lhs.type, ir.IntType):
-                lhs = self.builder.sitofp(lhs, ir.DoubleType())
-            
+
+            # Classe dos operandos ('string', 'float' ou 'int'): vem das anotações
+            # da análise semântica; sem elas, dos tipos LLVM já gerados
+            classe = self._classe_operandos(expr) or self._classe_por_tipo_ir(lhs, rhs)
+            if classe == 'float':
+                # int -> double no operando que ainda for inteiro
+                if isinstance(lhs.type, ir.IntType):
+                    lhs = self.builder.sitofp(lhs, ir.DoubleType())
+                if isinstance(rhs.type, ir.IntType):
+                    rhs = self.builder.sitofp(rhs, ir.DoubleType())
+
             op = expr.operador
 
             if op == '+':
                 # Concatenação de strings / biológicos (todos i8*)
-                if isinstance(lhs.type, ir.PointerType) and isinstance(rhs.type, ir.PointerType) and \
-                   isinstance(lhs.type.pointee, ir.IntType) and lhs.type.pointee.width == 8 and \
-                   isinstance(rhs.type.pointee, ir.IntType) and rhs.type.pointee.width == 8:
+                if classe == 'string':
                     return self._concat_strings(lhs, rhs)
-                if isinstance(lhs.type, ir.DoubleType):
+                if classe == 'float':
                     return self.builder.fadd(lhs, rhs)
                 return self.builder.add(lhs, rhs)
             elif op == "-":
-                if isinstance(lhs.type, ir.DoubleType):
+                if classe == 'float':
                     return self.builder.fsub(lhs, rhs)
                 return self.builder.sub(lhs, rhs)
             elif op == "*":
-                if isinstance(lhs.type, ir.DoubleType):
+                if classe == 'float':
                     return self.builder.fmul(lhs, rhs)
                 return self.builder.mul(lhs, rhs)
             elif op == "/":
-                if isinstance(lhs.type, ir.DoubleType):
+                if classe == 'float':
                     return self.builder.fdiv(lhs, rhs)
                 return self.builder.sdiv(lhs, rhs)
             elif op == "%":
-                if isinstance(lhs.type, ir.DoubleType):
+                if classe == 'float':
                     return self.builder.frem(lhs, rhs)
                 return self.builder.srem(lhs, rhs)
             elif op in ("==", "!=", "<", "<=", ">", ">="):
-                # Detecta se é comparação de strings, float ou inteira
-                if isinstance(lhs.type, ir.PointerType) and lhs.type.pointee == ir.IntType(8):
-                    # Comparação de strings usando strcmp
-                    if op in ("==", "!="):
-                        strcmp_result = self._call_strcmp(lhs, rhs)
-                        # strcmp retorna 0 se iguais
-                        if op == "==":
-                            return self.builder.icmp_signed("==", strcmp_result, ir.Constant(ir.IntType(32), 0))
-                        else:  # !=
-                            return self.builder.icmp_signed("!=", strcmp_result, ir.Constant(ir.IntType(32), 0))
-                    else:
-                        # Comparações <, <=, >, >= também com strcmp
-                        strcmp_result = self._call_strcmp(lhs, rhs)
-                        cmp_map = {"<": "<", "<=": "<=", ">": ">", ">=": ">="}
-                        return self.builder.icmp_signed(cmp_map[op], strcmp_result, ir.Constant(ir.IntType(32), 0))
-                elif isinstance(lhs.type, ir.DoubleType):
-                    fcmp_map = {
-                        "==": "==", "!=": "!=", "<": "<", "<=": "<=",
-                        ">": ">", ">=": ">="
-                    }
-                    return self.builder.fcmp_ordered(fcmp_map[op], lhs, rhs)
+                if classe == 'string':
+                    # Comparação de strings usando strcmp (retorna 0 se iguais)
+                    strcmp_result = self._call_strcmp(lhs, rhs)
+                    return self.builder.icmp_signed(op, strcmp_result, ir.Constant(ir.IntType(32), 0))
+                elif classe == 'float':
+                    return self.builder.fcmp_ordered(op, lhs, rhs)
                 else:
-                    cmp_map = {
-                        "==": "==", "!=": "!=", "<": "<", "<=": "<=",
-                        ">": ">", ">=": ">="
-                    }
-                    return self.builder.icmp_signed(cmp_map[op], lhs, rhs)
+                    return self.builder.icmp_signed(op, lhs, rhs)
             elif op == "&&":
                 # Short-circuit AND: se lhs é falso, retorna falso sem avaliar rhs
                 return self._gen_logical_and(expr.esquerda, expr.direita)
@@ -1534,7 +1539,7 @@ class LLVMCodeGenerator:
     def _instantiate_generic_function(self, func_name: str, type_args: Tuple[str, ...]) -> str:
         """Instancia uma versão concreta de uma função genérica com os tipos dados."""
         # Verifica se já foi instanciada
-        key = (func_name, type_args)
+        key = (func_name, tuple(tipo(t).id for t in type_args))
         if key in self.instantiated_functions:
             return self.instantiated_functions[key]
         
@@ -1588,7 +1593,7 @@ class LLVMCodeGenerator:
     def _instantiate_generic_class(self, class_name: str, type_args: Tuple[str, ...]) -> str:
         """Instancia uma versão concreta de uma classe genérica com os tipos dados."""
         # Verifica se já foi instanciada
-        key = (class_name, type_args)
+        key = (class_name, tuple(tipo(t).id for t in type_args))
         if key in self.instantiated_classes:
             return self.instantiated_classes[key]
         
@@ -1818,6 +1823,26 @@ class LLVMCodeGenerator:
             self.enums: Dict[str, Dict[str,int]] = {}
         self.enums[decl.nome] = {nome: valor for (nome, valor) in decl.membros}
 
+    def _classe_operandos(self, expr: ExpressaoBinaria) -> Optional[str]:
+        """
+        'string', 'float' ou 'int' pelos tipos que o `SemanticAnalyzer` anotou
+        nos operandos; None se algum não foi anotado ou não se encaixa.
+        """
+        esq = tipo(expr.esquerda.tipo_resolvido)
+        dir_ = tipo(expr.direita.tipo_resolvido)
+        if esq is None or dir_ is None or esq.id >= N_PRIMITIVOS or dir_.id >= N_PRIMITIVOS:
+            return None
+        return _CLASSE_OPERANDOS[esq.id * N_PRIMITIVOS + dir_.id]
+
+    @staticmethod
+    def _classe_por_tipo_ir(lhs, rhs) -> str:
+        """Mesma classificação de `_classe_operandos`, pelos tipos LLVM (AST sem anotações)."""
+        if isinstance(lhs.type, ir.PointerType) and lhs.type.pointee == ir.IntType(8):
+            return 'string'
+        if isinstance(lhs.type, ir.DoubleType) or isinstance(rhs.type, ir.DoubleType):
+            return 'float'
+        return 'int'
+
     def _type_from_name(self, type_name: str) -> ir.Type:
         """Helper para mapear nome de tipo para LLVM Type"""
         # Primeiro verifica se é um parâmetro de tipo genérico sendo substituído
@@ -1826,14 +1851,10 @@ class LLVMCodeGenerator:
             # Recursivamente resolve o tipo concreto
             return self._type_from_name(type_map[type_name])
         
-        if type_name in ('decimal', 'float', 'double'):
-            return ir.DoubleType()
-        elif type_name == 'string':
-            return ir.IntType(8).as_pointer()
-        elif type_name == 'bool':
-            return ir.IntType(1)
-        elif type_name == 'int':
-            return ir.IntType(32)
+        t = tipo(type_name)
+        llvm_type = _TIPOS_LLVM.get(t.id) if t is not None else None
+        if llvm_type is not None:
+            return llvm_type
         elif type_name in getattr(self, 'classes', {}):
             return self.classes[type_name][0].as_pointer()
         elif type_name in getattr(self, 'enums', {}):
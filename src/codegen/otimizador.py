@@ -0,0 +1,109 @@
+"""
+Passes de otimização sobre a AST em arena (`src.parser.ast.arena`).
+
+`dobrar_constantes` avalia em tempo de compilação as operações aritméticas
+cujos operandos são literais numéricos do mesmo tipo, com a mesma semântica
+do código gerado: `int` é i32 com sinal (resultado com wrap-around, divisão e
+resto truncados em direção a zero, como `sdiv`/`srem`) e `float` é double.
+Nada que possa falhar em tempo de execução (divisão por zero) é dobrado.
+"""
+from typing import List
+
+from src.parser.ast.arena import CODIGO_LITERAL, CODIGO_NO, Arena
+from src.parser.ast.ast_base import ExpressaoBinaria, ExpressaoUnaria
+
+_BINARIA = CODIGO_NO[ExpressaoBinaria]
+_UNARIA = CODIGO_NO[ExpressaoUnaria]
+
+_NADA = object()
+
+
+def _i32(v: int) -> int:
+    v &= 0xFFFFFFFF
+    return v - (1 << 32) if v & 0x80000000 else v
+
+
+def _div_trunc(a: int, b: int) -> int:
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _avaliar_binaria(op: str, a, b):
+    if type(a) is not type(b) or type(a) not in (int, float):
+        return _NADA
+    if op == '+':
+        r = a + b
+    elif op == '-':
+        r = a - b
+    elif op == '*':
+        r = a * b
+    elif op in ('/', '%'):
+        if b == 0:
+            return _NADA
+        if type(a) is float:
+            if op == '%':
+                return _NADA  # frem segue o sinal do dividendo; não vale a pena replicar
+            r = a / b
+        else:
+            q = _div_trunc(a, b)
+            r = q if op == '/' else a - b * q
+    else:
+        return _NADA
+    return _i32(r) if type(r) is int else r
+
+
+def _valor_literal(arena: Arena, i: int):
+    v = arena.forma(i)[0]
+    return v if type(v) in (int, float) else _NADA
+
+
+def dobrar_constantes(arena: Arena) -> Arena:
+    """
+    Retorna uma nova arena em que cada subárvore aritmética constante virou
+    um único `Literal` (com o span da expressão original).
+
+    Duas passadas lineares: de trás para frente calcula o valor de cada nó
+    (os filhos vêm depois do pai em pré-ordem, então já foram avaliados) e de
+    frente para trás copia os nós, pulando as subárvores dobradas.
+    """
+    n = len(arena)
+    tipos, fim = arena.tipos, arena.fim
+    valores: List[object] = [_NADA] * n
+
+    for i in range(n - 1, -1, -1):
+        codigo = tipos[i]
+        if codigo == CODIGO_LITERAL:
+            valores[i] = _valor_literal(arena, i)
+        elif codigo == _BINARIA:
+            esq = i + 1
+            dir_ = fim[esq]
+            a, b = valores[esq], valores[dir_]
+            if a is not _NADA and b is not _NADA:
+                valores[i] = _avaliar_binaria(arena.forma(i)[1], a, b)
+        elif codigo == _UNARIA:
+            v = valores[i + 1]
+            op = arena.forma(i)[0]
+            if v is not _NADA and op in ('-', '+'):
+                valores[i] = (_i32(-v) if type(v) is int else -v) if op == '-' else v
+
+    nova = Arena()
+    novo_indice = [-1] * n
+    abertos: List[int] = []  # índices antigos cuja subárvore ainda está sendo copiada
+    i = 0
+    while i < n:
+        while abertos and fim[abertos[-1]] <= i:
+            nova.fechar(novo_indice[abertos.pop()])
+        pai = arena.pais[i]
+        pai_novo = novo_indice[pai] if pai >= 0 else -1
+        posicao = (arena.linhas[i], arena.colunas[i], arena.inicios[i], arena.fins[i])
+        v = valores[i]
+        if v is not _NADA and tipos[i] != CODIGO_LITERAL:
+            nova.fechar(nova.adicionar(CODIGO_LITERAL, pai_novo, (v,), *posicao))
+            i = fim[i]
+            continue
+        novo_indice[i] = nova.adicionar(tipos[i], pai_novo, arena.forma(i), *posicao)
+        abertos.append(i)
+        i += 1
+    while abertos:
+        nova.fechar(novo_indice[abertos.pop()])
+    return nova
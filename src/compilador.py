@@ -6,14 +6,47 @@ import llvmlite.binding as llvm
 
 from src.parser.parser import parse_cd
 from src.codegen.llvm_codegen import LLVMCodeGenerator
+from src.codegen.otimizador import dobrar_constantes
+from src.parser.ast.arena import Arena
 from src.semantic.analyzer import SemanticAnalyzer
+from src.utils.erros import CompilationError, ErrorHandler
 
-def compile_cd(arquivo: str, run: bool = False):
+def compile_cd(arquivo: str, run: bool = False, cache: bool = False, estrito: bool = False,
+               otimizar: bool = False):
     """
     Compila um arquivo .cd para LLVM IR e opcionalmente executa a função main.
+    Com `cache=True` a AST é lida e gravada no cache em disco (`CacheAST`).
+    Com `otimizar=True` as expressões aritméticas constantes são dobradas
+    antes da análise semântica (`dobrar_constantes`).
+
+    Erros léxicos e sintáticos interrompem a compilação (`CompilationError`).
+    Os erros semânticos são impressos em stderr como avisos; com
+    `estrito=True` também interrompem a compilação.
     """
     # ---------- Parse ----------
-    ast = parse_cd(arquivo)
+    ast = parse_cd(arquivo, cache=cache)
+
+    # ---------- Dobramento de constantes ----------
+    # Passe linear sobre a AST em arena. A ida e volta Programa -> Arena ->
+    # Programa reconstrói a árvore inteira e custa quase tanto quanto o parse,
+    # por isso só roda quando pedido.
+    if otimizar:
+        ast = dobrar_constantes(Arena.do_programa(ast)).para_programa()
+
+    # ---------- Análise semântica ----------
+    # Anota cada expressão com o tipo resolvido e o símbolo, que o codegen usa
+    # para escolher as instruções. Fora do modo estrito os diagnósticos são só
+    # avisos. Os exemplos válidos de `examples/` compilam sem nenhum (ver
+    # test_anotacoes_semanticas); parâmetros de tipo genéricos, tuplas e null
+    # ficam com tipo desconhecido e não são verificados.
+    eh_semantico = ErrorHandler(buffered=True)
+    SemanticAnalyzer(eh_semantico).analyze(ast)
+    if eh_semantico.has_errors():
+        if estrito:
+            eh_semantico.flush()
+            raise CompilationError("análise semântica", eh_semantico.errors)
+        for erro in eh_semantico.errors:
+            print(f"[AVISO] {erro}", file=sys.stderr)
 
     # ---------- Geração de LLVM IR ----------
     llvm_gen = LLVMCodeGenerator()
@@ -0,0 +1,61 @@
+"""
+Front-end único do compilador: fonte -> tokens -> AST.
+
+Os pontos de entrada (`parse_cd`, `compile_cd`, o modo `check` de `lote`, o
+parse paralelo e as APIs legadas `analise_lexica` e `tokens.TokenStream`)
+tokenizam e analisam por aqui, com os mesmos tipos de token
+(`src.lexer.protocolo.TipoToken`) e o mesmo protocolo de fluxo
+(`FluxoTokens`). Trocar o lexer ou o parser padrão é uma mudança só.
+
+`LEXER_PADRAO` é o lexer por tabelas de AFD, que produz os mesmos tokens que
+`Lexer` (ver `test_lexer_afd`) em uma fração do tempo. Os tokens vão para uma
+lista de `Token`: indexar a lista é mais barato para o parser do que criar
+um `TokenView` a cada `peek` (o `TokenBuffer` fica para quando a compactação
+importa, como ao mandar os tokens a outros processos).
+
+Fontes grandes demais para ler inteiros passam por `analisar_arquivo`, que
+tokeniza em blocos com `LexerStreaming` (a versão em blocos de `LexerAFD`).
+"""
+from typing import List, Optional, TextIO, Type
+
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.analisador_lexico_completo import Lexer, Token, TokenStream, TokenStreamIndexado
+from src.lexer.analisador_lexico_streaming import LexerStreaming
+from src.lexer.protocolo import FluxoTokens
+from src.parser.ast.ast_base import Parser, Programa
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.utils.erros import ErrorHandler
+
+LEXER_PADRAO: Type[Lexer] = LexerAFD
+PARSER_PADRAO: Type[Parser] = ParserPratt
+
+
+def tokenizar(fonte: str, error_handler: Optional[ErrorHandler] = None,
+              lexer_cls: Type[Lexer] = LEXER_PADRAO) -> List[Token]:
+    """Todos os tokens de `fonte`; erros léxicos vão para `error_handler`."""
+    return lexer_cls(fonte, error_handler=error_handler).tokenize_all()
+
+
+def fluxo(fonte: str, error_handler: Optional[ErrorHandler] = None,
+          lexer_cls: Type[Lexer] = LEXER_PADRAO) -> FluxoTokens:
+    return TokenStreamIndexado(tokenizar(fonte, error_handler, lexer_cls))
+
+
+def analisar(fonte: str, error_handler: Optional[ErrorHandler] = None,
+             parser_cls: Type[Parser] = PARSER_PADRAO,
+             lexer_cls: Type[Lexer] = LEXER_PADRAO) -> Programa:
+    """AST de `fonte`. Erros léxicos e sintáticos vão para `error_handler`."""
+    eh = error_handler or ErrorHandler()
+    return parser_cls(fluxo(fonte, eh, lexer_cls), eh).parse()
+
+
+def fluxo_arquivo(arquivo: TextIO, error_handler: Optional[ErrorHandler] = None) -> FluxoTokens:
+    """Tokens de `arquivo` lidos em blocos, sem carregar o fonte inteiro."""
+    return TokenStream(LexerStreaming(arquivo, error_handler=error_handler))
+
+
+def analisar_arquivo(arquivo: TextIO, error_handler: Optional[ErrorHandler] = None,
+                     parser_cls: Type[Parser] = PARSER_PADRAO) -> Programa:
+    """Como `analisar`, lendo o fonte em blocos de `arquivo`."""
+    eh = error_handler or ErrorHandler()
+    return parser_cls(fluxo_arquivo(arquivo, eh), eh).parse()
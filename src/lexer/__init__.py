@@ -1,2 +1,5 @@
-from .analisador_lexico_completo import Lexer
-from .tokens import Token, TokenStream, KEYWORDS
\ No newline at end of file
+from .analisador_lexico_completo import Lexer, LexerRegexMestre, TokenStreamIndexado
+from .analisador_lexico_afd import LexerAFD
+from .tokens import Token, TokenStream, KEYWORDS
+from .buffer_tokens import TokenBuffer, TokenView
+from .protocolo import FluxoTokens, TipoToken
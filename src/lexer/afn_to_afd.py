@@ -92,20 +92,24 @@ class NFABuilder:
 
 ALL_ASCII: Set[int] = set(range(128))
 NON_ASCII = 128
-ALL_CHARS: Set[int] = set(range(128)) | {NON_ASCII}
-DIGITS: Set[int] = set(map(ord, '0123456789'))
+# Dígitos Unicode fora do ASCII (categoria Nd): o '\d' do `re` também os aceita
+NON_ASCII_DIGIT = 129
+ALPHABET_SIZE = 130
+ALL_CHARS: Set[int] = set(range(128)) | {NON_ASCII, NON_ASCII_DIGIT}
+DIGITS: Set[int] = set(map(ord, '0123456789')) | {NON_ASCII_DIGIT}
 UPPER: Set[int] = set(range(ord('A'), ord('Z')+1))
 LOWER: Set[int] = set(range(ord('a'), ord('z')+1))
 LETTERS: Set[int] = UPPER | LOWER
 UNDERSCORE: Set[int] = {ord('_')}
 ID_START = LETTERS | UNDERSCORE
-ID_CONT  = ID_START | DIGITS
+ID_CONT  = ID_START | set(map(ord, '0123456789'))
 WS_NO_NL = set(map(ord, [' ', '\t', '\f', '\r']))
 NL = {ord('\n')}
 NOT_QUOTE_NL = ALL_CHARS - {ord('"')} - NL
 NOT_NL = ALL_CHARS - NL
 SLASH = {ord('/')}
 QUOTE = {ord('"')}
+APOS = {ord("'")}
 PERCENT = {ord('%')}
 AMP = {ord('&')}
 BAR = {ord('|')}
@@ -131,107 +135,119 @@ BANG = {ord('!')}
 TILDE = {ord('~')}
 BACKSLASH = {ord('\\')}
 
+def symbol_of(ch: str) -> int:
+    """Mapeia um caractere do fonte para o símbolo do alfabeto do AFD."""
+    c = ord(ch)
+    if c < 128:
+        return c
+    return NON_ASCII_DIGIT if ch.isdecimal() else NON_ASCII
+
+# Nomes dos tokens descartáveis (regras com tipo None em REGRAS)
+IGNORED_TOKENS = {'BLOCK_COMMENT', 'LINE_COMMENT', 'WS', 'NEWLINE'}
+
 def build_token_nfas(builder: NFABuilder):
+    """
+    Constrói os NFAs dos tokens espelhando `REGRAS` de
+    analisador_lexico_completo, na mesma ordem (a ordem define a prioridade).
+
+    As regras com repetição de corpo (comentário de bloco, strings e literais
+    biológicos) são montadas estado a estado para reproduzir a semântica do
+    `re` (quantificador preguiçoso / backtracking), e não só a linguagem.
+    """
     token_defs: List[Tuple[Tuple[int,int], str]] = []
 
     def add(tok_nfa: Tuple[int,int], name: str):
         token_defs.append((tok_nfa, name))
 
-    s1 = builder.seq(builder.literal('/"'), builder.star(builder.charclass(NOT_NL)))
-    add(s1, 'LINE_COMMENT')
-    s1b = builder.seq(builder.literal('//'), builder.star(builder.charclass(NOT_NL)))
-    add(s1b, 'LINE_COMMENT2')
-
-    s, a = builder.literal('"""')
-    A = a
-    x = builder.charclass(ALL_CHARS - {ord('"')})
-    builder.add_eps(A, x[0])
-    builder.add_eps(x[1], A)
-    B_start, B_acc = builder.literal('"')
-    builder.add_eps(A, B_start)
-    C_start, C_acc = builder.literal('"')
-    y = builder.charclass(ALL_CHARS - {ord('"')})
-    builder.add_eps(B_acc, C_start)
-    builder.add_eps(B_acc, y[0])
-    builder.add_eps(y[1], A)
+    # /"[\s\S]*?"/  -> termina no primeiro '"/'
+    s, body = builder.literal('/"')
+    quote = builder.new_state()
     end = builder.new_state()
-    builder.add_trans(C_acc, ord('"'), end)
-    z = builder.charclass(ALL_CHARS - {ord('"')})
-    builder.add_eps(C_acc, z[0])
-    builder.add_eps(z[1], A)
+    builder.add_trans_set(body, ALL_CHARS - QUOTE, body)
+    builder.add_trans(body, ord('"'), quote)
+    builder.add_trans(quote, ord('"'), quote)
+    builder.add_trans(quote, ord('/'), end)
+    builder.add_trans_set(quote, ALL_CHARS - QUOTE - SLASH, body)
     add((s, end), 'BLOCK_COMMENT')
 
+    add(builder.seq(builder.literal('//'), builder.star(builder.charclass(NOT_NL))), 'LINE_COMMENT')
     add(builder.plus(builder.charclass(WS_NO_NL)), 'WS')
     add(builder.charclass(NL), 'NEWLINE')
 
     for lex, name in [
-        ('...', 'DOT3'), ('..', 'DOT2'),
-        ('=>', 'FATARROW'), ('->', 'ARROW'),
-        ('<<=', 'SHL_EQ'), ('>>=', 'SHR_EQ'),
-        ('<<', 'SHL'), ('>>', 'SHR'),
-        ('+=', 'PLUS_EQ'), ('-=', 'MINUS_EQ'), ('*=', 'STAR_EQ'),
-        ('/=', 'SLASH_EQ'), ('%=', 'PERC_EQ'),
-        ('==', 'EQ'), ('!=', 'NE'),
-        ('<=', 'LE'), ('>=', 'GE'),
+        ('<-', 'ARROW_LEFT'), ('->', 'ARROW_RIGHT'),
+        ('...', 'DOT3'), ('..', 'DOT2'), ('=>', 'FATARROW'),
+        ('<<=', 'SHL_EQ'), ('>>=', 'SHR_EQ'), ('<<', 'SHL'), ('>>', 'SHR'),
+        ('+=', 'PLUS_EQ'), ('-=', 'MINUS_EQ'), ('++', 'PLUS_PLUS'), ('--', 'MINUS_MINUS'),
+        ('**', 'POW'), ('*=', 'STAR_EQ'), ('/=', 'SLASH_EQ'), ('%=', 'PERC_EQ'),
+        ('&=', 'AMP_EQ'), ('|=', 'BAR_EQ'), ('^=', 'CARET_EQ'),
+        ('==', 'EQ'), ('!=', 'NE'), ('<=', 'LE'), ('>=', 'GE'),
         ('&&', 'AND_AND'), ('||', 'OR_OR'),
     ]:
         add(builder.literal(lex), name)
 
-    def quoted_payload():
-        body_unit = builder.alt(
-            builder.seq(builder.charclass(BACKSLASH), builder.charclass(ALL_ASCII)),
-            builder.charclass(NOT_QUOTE_NL)
-        )
-        return builder.star(body_unit)
+    def quoted(prefix: str, body_chars: Set[int], esc_to_body: Set[int], esc_to_esc: Set[int]):
+        """
+        Corpo entre aspas com escape ao estilo do `re` guloso: a primeira aspa
+        não escapada fecha o literal (aceitação final). Uma aspa precedida de
+        '\\' continua o corpo, mas marca uma aceitação "fraca", usada apenas
+        quando o literal não fecha (o backtracking do `re` recua até ela).
+        """
+        s, body = builder.literal(prefix)
+        esc = builder.new_state()
+        weak = builder.new_state()
+        end = builder.new_state()
+        for st in (body, weak):
+            builder.add_trans_set(st, body_chars - BACKSLASH - QUOTE, body)
+            builder.add_trans(st, ord('\\'), esc)
+            builder.add_trans(st, ord('"'), end)
+        builder.add_trans(esc, ord('"'), weak)
+        builder.add_trans_set(esc, esc_to_body, body)
+        builder.add_trans_set(esc, esc_to_esc, esc)
+        return s, weak, end
 
     for prefix, name in [('dna"', 'DNA_LIT'), ('rna"', 'RNA_LIT'), ('prot"', 'PROT_LIT')]:
-        p = builder.literal(prefix)
-        pay = quoted_payload()
-        close = builder.literal('"')
-        add(builder.seq(builder.seq(p, pay), close), name)
-
-    openq = builder.literal('"')
-    payload = quoted_payload()
-    closeq = builder.literal('"')
-    add(builder.seq(builder.seq(openq, payload), closeq), 'STRING')
-
-    dplus = builder.plus(builder.charclass(DIGITS))
-    dot = builder.charclass(DOT)
-    frac = builder.plus(builder.charclass(DIGITS))
-    opt_frac = builder.optional(builder.seq(dot, frac))
-    eE = builder.charclass(set(map(ord, 'eE')))
-    sign = builder.optional(builder.charclass(set(map(ord, '+-'))))
-    exp = builder.seq(eE, builder.seq(sign, builder.plus(builder.charclass(DIGITS))))
-    float_exp = builder.seq(dplus, builder.seq(opt_frac, exp))
-    add(float_exp, 'FLOAT_EXP')
-
-    float_simple = builder.seq(dplus, builder.seq(dot, frac))
-    add(float_simple, 'FLOAT')
-
-    add(dplus, 'DEC_INT')
-
-    id_start = builder.charclass(ID_START)
-    id_cont = builder.star(builder.charclass(ID_CONT))
-    add(builder.seq(id_start, id_cont), 'ID')
+        # (\\"|[^"])*  -> uma '\\' que não escapa aspa é caractere comum
+        s, weak, end = quoted(prefix, ALL_CHARS, ALL_CHARS - QUOTE - BACKSLASH, BACKSLASH)
+        add((s, end), name)
+        add((s, weak), name)
+
+    # "(\\.|[^"\n])*"  -> '\\' consome o próximo caractere (exceto \n)
+    s, weak, end = quoted('"', NOT_QUOTE_NL, NOT_NL - QUOTE, set())
+    add((s, end), 'STRING')
+    add((s, weak), 'STRING')
+
+    # '(\\.|[^'\\n])'  (a classe exclui a barra e a letra 'n')
+    body = builder.alt(
+        builder.seq(builder.charclass(BACKSLASH), builder.charclass(NOT_NL)),
+        builder.charclass(ALL_CHARS - APOS - BACKSLASH - {ord('n')})
+    )
+    add(builder.seq(builder.seq(builder.literal("'"), body), builder.literal("'")), 'CHAR_LIT')
+
+    def digits():
+        return builder.plus(builder.charclass(DIGITS))
+
+    def exponent():
+        sign = builder.optional(builder.charclass(set(map(ord, '+-'))))
+        return builder.seq(builder.charclass(set(map(ord, 'eE'))), builder.seq(sign, digits()))
+
+    add(builder.seq(digits(), builder.seq(builder.charclass(DOT), builder.seq(digits(), exponent()))), 'FLOAT_EXP')
+    add(builder.seq(digits(), exponent()), 'FLOAT_EXP')
+    add(builder.seq(digits(), builder.seq(builder.charclass(DOT), digits())), 'FLOAT')
+    add(digits(), 'DEC_INT')
+
+    add(builder.seq(builder.charclass(ID_START), builder.star(builder.charclass(ID_CONT))), 'ID')
 
     for (charset, name) in [
-        (LPAREN, 'LPAREN'), (RPAREN, 'RPAREN'),
-        (LBRACE, 'LBRACE'), (RBRACE, 'RBRACE'),
+        (EQ, 'ASSIGN'), (PLUS, 'PLUS'), (MINUS, 'MINUS'), (STAR, 'STAR'), (SLASH, 'SLASH'),
+        (PERCENT, 'PERCENT'), (CARET, 'CARET'), (GT, 'GT'), (LT, 'LT'),
+        (AMP, 'AMP'), (BAR, 'BAR'), (BANG, 'BANG'), (TILDE, 'TILDE'),
+        (LPAREN, 'LPAREN'), (RPAREN, 'RPAREN'), (LBRACE, 'LBRACE'), (RBRACE, 'RBRACE'),
         (LBRACK, 'LBRACK'), (RBRACK, 'RBRACK'),
-        (COMMA, 'COMMA'), (SEMI, 'SEMI'), (COLON, 'COLON'),
-        (AT, 'AT'),
-        (PLUS, 'PLUS'), (MINUS, 'MINUS'), (STAR, 'STAR'), (SLASH, 'SLASH'),
-        (PERCENT, 'PERCENT'), (CARET, 'CARET'),
-        (AMP, 'AMP'), (BAR, 'BAR'),
-        (BANG, 'BANG'), (TILDE, 'TILDE'),
-        (EQ, 'ASSIGN'), (LT, 'LT'), (GT, 'GT'),
-        (DOT, 'DOT'),
+        (SEMI, 'SEMI'), (COLON, 'COLON'), (COMMA, 'COMMA'), (DOT, 'DOT'),
     ]:
         add(builder.charclass(charset), name)
 
-    nfas_with_meta: List[Tuple[int,int,str,int]] = []
-    for prio, (pair, name) in enumerate(token_defs):
-        nfas_with_meta.append((pair[0], pair[1], name, prio))
     return token_defs
 
 def merge_nfas_to_master(token_defs: List[Tuple[Tuple[int,int], str]]) -> NFA:
@@ -328,7 +344,7 @@ def build_master_dfa():
     builder = NFABuilder()
     token_defs = build_token_nfas(builder)
     nfa = merge_nfas_to_master(token_defs, builder)
-    alphabet = list(range(129))
+    alphabet = list(range(ALPHABET_SIZE))
     dfa = build_dfa(nfa, alphabet)
     return dfa
 
@@ -339,6 +355,43 @@ def compress_dfa(dfa: DFA) -> Dict[str, object]:
         "trans": {int(s): {int(c): int(t) for c, t in row.items()} for s, row in dfa.trans.items()},
     }
 
+def tabulate_dfa(dfa: DFA) -> Dict[str, object]:
+    """
+    Converte o AFD em tabelas densas para o lexer dirigido por tabela.
+
+    Símbolos com a mesma coluna em todos os estados são agrupados em classes
+    de equivalência, e cada estado vira uma linha `classe -> próximo estado`
+    (-1 = estado morto). A aceitação é o índice do token em `tokens` (ou -1).
+    """
+    n_states = len(dfa.trans)
+    columns: Dict[Tuple[int, ...], int] = {}
+    classes: List[int] = []
+    for c in range(ALPHABET_SIZE):
+        col = tuple(dfa.trans.get(st, {}).get(c, -1) for st in range(n_states))
+        classes.append(columns.setdefault(col, len(columns)))
+
+    by_class = sorted(columns.items(), key=lambda kv: kv[1])
+    trans = [[col[st] for col, _ in by_class] for st in range(n_states)]
+
+    tokens: List[str] = []
+    accept: List[int] = []
+    for st in range(n_states):
+        acc = dfa.accepts.get(st)
+        if acc is None:
+            accept.append(-1)
+            continue
+        if acc[0] not in tokens:
+            tokens.append(acc[0])
+        accept.append(tokens.index(acc[0]))
+
+    return {
+        "start": dfa.start,
+        "classes": classes,
+        "trans": trans,
+        "accept": accept,
+        "tokens": tokens,
+    }
+
 if __name__ == "__main__":
     dfa = build_master_dfa()
     data = compress_dfa(dfa)
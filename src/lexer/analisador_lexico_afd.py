@@ -0,0 +1,103 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from src.lexer.afn_to_afd import IGNORED_TOKENS, NON_ASCII, NON_ASCII_DIGIT
+from src.lexer.analisador_lexico_completo import Lexer
+from src.lexer.identificadores import TabelaIdentificadores
+from src.lexer.tabelas import carregar_tabelas_afd
+
+
+class AFDCompilado:
+    """
+    Tabelas do AFD mestre prontas para o laço do lexer.
+
+    Além das transições, cada estado com laço sobre si mesmo ganha um
+    "salto": uma regex `[...]*` com os caracteres do laço, que avança por
+    corpos de comentários, strings, literais biológicos e identificadores
+    em velocidade de C em vez de caractere a caractere.
+    """
+
+    def __init__(self, tabelas: dict):
+        self.inicio: int = tabelas['start']
+        self.classes: List[int] = tabelas['classes'][:128]
+        self.cls_nao_ascii: int = tabelas['classes'][NON_ASCII]
+        self.cls_digito: int = tabelas['classes'][NON_ASCII_DIGIT]
+        self.trans: List[List[int]] = tabelas['trans']
+        self.aceita: List[int] = tabelas['accept']
+        self.tipos: List[Optional[str]] = [
+            None if nome in IGNORED_TOKENS else nome for nome in tabelas['tokens']
+        ]
+        self.saltos = [self._salto(estado) for estado in range(len(self.trans))]
+
+    def _salto(self, estado: int):
+        linha = self.trans[estado]
+        laco = {c for c in range(128) if linha[self.classes[c]] == estado}
+        nao_ascii = linha[self.cls_nao_ascii] == estado
+        digito = linha[self.cls_digito] == estado
+        if not laco and not nao_ascii and not digito:
+            return None
+        if nao_ascii and digito:
+            fora = ''.join(re.escape(chr(c)) for c in range(128) if c not in laco)
+            padrao = f'[^{fora}]*' if fora else r'[\s\S]*'
+        elif not nao_ascii and not digito:
+            padrao = '[' + ''.join(re.escape(chr(c)) for c in sorted(laco)) + ']*'
+        elif digito and laco == set(range(ord('0'), ord('9') + 1)):
+            padrao = r'\d*'
+        else:
+            return None
+        return re.compile(padrao).match
+
+
+@lru_cache(maxsize=1)
+def _afd_padrao() -> AFDCompilado:
+    return AFDCompilado(carregar_tabelas_afd())
+
+
+class LexerAFD(Lexer):
+    """
+    Lexer dirigido por tabela: percorre o AFD mestre (gerado por
+    `tools/gerador_tabelas.py`) uma única vez por posição, guardando a última
+    aceitação (maximal munch). Produz exatamente os mesmos tokens de `Lexer`,
+    com custo linear no tamanho do fonte em vez de O(regras × caracteres).
+    """
+
+    def __init__(self, source: str, error_handler=None, tabelas: Optional[dict] = None,
+                 tabela_ids: Optional[TabelaIdentificadores] = None):
+        super().__init__(source, error_handler, tabela_ids)
+        self._afd = AFDCompilado(tabelas) if tabelas is not None else _afd_padrao()
+
+    def _casar(self, pos: int) -> Optional[Tuple[int, Optional[str]]]:
+        afd = self._afd
+        src = self.source
+        n = self.length
+        classes = afd.classes
+        trans = afd.trans
+        aceita = afd.aceita
+        saltos = afd.saltos
+
+        estado = afd.inicio
+        fim = -1
+        token = -1
+        i = pos
+        while i < n:
+            ch = src[i]
+            c = ord(ch)
+            if c < 128:
+                cls = classes[c]
+            else:
+                cls = afd.cls_digito if ch.isdecimal() else afd.cls_nao_ascii
+            estado = trans[estado][cls]
+            if estado < 0:
+                break
+            i += 1
+            salto = saltos[estado]
+            if salto is not None:
+                i = salto(src, i, n).end()
+            if aceita[estado] >= 0:
+                fim = i
+                token = aceita[estado]
+
+        if fim < 0:
+            return None
+        return fim, afd.tipos[token]
@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Tuple, Deque
 from collections import deque
 import re
 
+from src.lexer.identificadores import TabelaIdentificadores
 from src.utils.erros import ErrorHandler, LexicalError
 
 # --------------- Regras e palavras-chave ---------------
@@ -93,8 +94,93 @@ PALAVRAS_CHAVE = {
     "extends": "KWD"
 }
 
+# Só as palavras-chave: cada lexer que não recebe uma tabela parte de uma cópia
+# desta, para que a tabela não cresça com os nomes de todos os arquivos já lidos.
+_TABELA_PALAVRAS_CHAVE = TabelaIdentificadores(PALAVRAS_CHAVE)
+
+
+def nova_tabela_identificadores() -> TabelaIdentificadores:
+    return _TABELA_PALAVRAS_CHAVE.copiar()
+
 _compiled_rules = [(re.compile(r), t) for r, t in REGRAS]
 
+# --------------- Literais biológicos ---------------
+
+PREFIXOS_BIO = {'dna': 'DNA_LIT', 'rna': 'RNA_LIT', 'prot': 'PROT_LIT'}
+
+# Alfabetos aceitos em cada literal (maiúsculas ou minúsculas)
+ALFABETOS_BIO = {
+    'DNA_LIT': 'ACGTacgt',
+    'RNA_LIT': 'ACGUacgu',
+    'PROT_LIT': 'ACDEFGHIKLMNPQRSTVWYacdefghiklmnpqrstvwy',
+}
+
+# As regras DNA_LIT/RNA_LIT/PROT_LIT ficam fora do laço de regex: o
+# `(\\"|[^"])*` retrocede caractere a caractere em literais longos.
+_regras_gerais = [(idx, regex, t) for idx, (regex, t) in enumerate(_compiled_rules)
+                  if t not in ALFABETOS_BIO]
+
+
+def escanear_literal_bio(source: str, pos: int) -> Optional[Tuple[int, str]]:
+    """
+    Casa `dna"..."`, `rna"..."` ou `prot"..."` em `pos` com `str.find`,
+    reproduzindo a regex `prefixo"(\\"|[^"])*"`: fecha na primeira aspa não
+    precedida de barra; sem ela, a regex recua e fecha na última `\\"`.
+    Retorna (fim, tipo) ou None.
+    """
+    c = source[pos:pos + 1]
+    if c == 'd' or c == 'r':
+        prefixo = source[pos:pos + 3]
+    elif c == 'p':
+        prefixo = source[pos:pos + 4]
+    else:
+        return None
+    tipo = PREFIXOS_BIO.get(prefixo)
+    if tipo is None:
+        return None
+    inicio = pos + len(prefixo)
+    if not source.startswith('"', inicio):
+        return None
+
+    ultima_escapada = -1
+    k = source.find('"', inicio + 1)
+    while k != -1 and source[k - 1] == '\\':
+        ultima_escapada = k
+        k = source.find('"', k + 1)
+    if k == -1:
+        if ultima_escapada == -1:
+            return None
+        k = ultima_escapada
+    return k + 1, tipo
+
+
+# Início do conteúdo de um literal (após `prefixo"`), relativo ao início do token
+INICIO_CONTEUDO_BIO = {'DNA_LIT': 4, 'RNA_LIT': 4, 'PROT_LIT': 5}
+
+_FORA_DO_ALFABETO = {t: re.compile(f'[^{a}]') for t, a in ALFABETOS_BIO.items()}
+
+
+def alfabeto_bio_valido(tipo: str, texto: str, inicio: int = 0, fim: Optional[int] = None) -> bool:
+    """
+    True se `texto[inicio:fim]` usa só o alfabeto do literal: uma busca em C
+    sobre o próprio `texto`, sem copiar o trecho.
+    """
+    regex = _FORA_DO_ALFABETO[tipo]
+    return (regex.search(texto, inicio) if fim is None else regex.search(texto, inicio, fim)) is None
+
+
+# Regex mestre: uma única alternação com um grupo nomeado por regra, na ordem
+# de REGRAS. A alternação do `re` é leftmost-first (vence a primeira
+# alternativa que casa), o que coincide com maior-casamento + prioridade
+# porque em REGRAS toda regra que pode casar um lexema mais longo a partir da
+# mesma posição aparece antes das que casam seus prefixos (`<<=` antes de
+# `<<` e `<`, FLOAT_EXP antes de FLOAT e DEC_INT...). Literais biológicos são
+# tratados antes por `escanear_literal_bio`.
+# O teste de conformidade em test/lexer_test garante a equivalência.
+_regex_mestre = re.compile('|'.join(f'(?P<R{i}>{r})' for i, (r, t) in enumerate(REGRAS)
+                                    if t not in ALFABETOS_BIO))
+_tipos_mestre = {f'R{i}': t for i, (_, t) in enumerate(REGRAS)}
+
 @dataclass
 class Token:
     tipo: str
@@ -103,6 +189,12 @@ class Token:
     coluna: int
     start_pos: int
     end_pos: int
+    # Só em literais biológicos: tamanho da sequência e se ela respeita o
+    # alfabeto, calculados uma vez no lexer.
+    tamanho: Optional[int] = field(default=None, compare=False, repr=False)
+    alfabeto_valido: Optional[bool] = field(default=None, compare=False, repr=False)
+    # Em IDs e palavras-chave: código na TabelaIdentificadores do lexer.
+    codigo_id: Optional[int] = field(default=None, compare=False, repr=False)
 
     def __repr__(self):
         return f"Token({self.tipo!r}, {self.valor!r}, Ln{self.linha}, Col{self.coluna})"
@@ -111,8 +203,24 @@ class Token:
         return hash((self.tipo, self.valor, self.linha, self.coluna))
 
 
+def criar_token(tipo: str, valor: str, linha: int, coluna: int, start_pos: int, end_pos: int,
+                codigo_id: Optional[int] = None, alfabeto_valido: Optional[bool] = None) -> Token:
+    """
+    Cria o `Token`. Em literais biológicos, `alfabeto_valido` vem do lexer,
+    que já o verificou ao avançar linha/coluna; se None, é verificado aqui.
+    """
+    tok = Token(tipo, valor, linha, coluna, start_pos, end_pos, codigo_id=codigo_id)
+    if tipo in ALFABETOS_BIO:
+        inicio = INICIO_CONTEUDO_BIO[tipo]
+        tok.tamanho = len(valor) - inicio - 1
+        if alfabeto_valido is None:
+            alfabeto_valido = alfabeto_bio_valido(tipo, valor, inicio, len(valor) - 1)
+        tok.alfabeto_valido = alfabeto_valido
+    return tok
+
+
 class Lexer:
-    def __init__(self, source: str, error_handler=None):
+    def __init__(self, source: str, error_handler=None, tabela_ids: Optional[TabelaIdentificadores] = None):
         self.source = source
         self.length = len(source)
         self.pos = 0
@@ -120,6 +228,7 @@ class Lexer:
         self.coluna = 1
         self._buf: Deque[Token] = deque()
         self.error_handler = error_handler or ErrorHandler()
+        self.tabela_ids = tabela_ids if tabela_ids is not None else nova_tabela_identificadores()
 
     def _update_line_col(self, text: str):
         if not text:
@@ -133,9 +242,27 @@ class Lexer:
         else:
             self.coluna += len(text)
 
+    def _avancar(self, token_tipo: Optional[str], inicio: int, valor: str) -> Optional[bool]:
+        """
+        Atualiza linha/coluna após `valor`, que começa em `self.source[inicio]`.
+        Em literais biológicos verifica o alfabeto e retorna o resultado: um
+        conteúdo válido não tem quebras de linha, e a coluna avança sem
+        reexaminar o literal.
+        """
+        if token_tipo in ALFABETOS_BIO:
+            valido = alfabeto_bio_valido(token_tipo, self.source, inicio + INICIO_CONTEUDO_BIO[token_tipo],
+                                         inicio + len(valor) - 1)
+            if valido:
+                self.coluna += len(valor)
+            else:
+                self._update_line_col(valor)
+            return valido
+        self._update_line_col(valor)
+        return None
+
     def _longest_match_at(self, pos: int) -> Optional[Tuple[re.Match, str, int]]:
         best = None
-        for idx, (regex, t_tipo) in enumerate(_compiled_rules):
+        for idx, regex, t_tipo in _regras_gerais:
             m = regex.match(self.source, pos)
             if not m:
                 continue
@@ -148,43 +275,108 @@ class Lexer:
                 best = (m, t_tipo, idx)
         return best
 
-    def _next_token_internal(self) -> Optional[Token]:
+    def _casar(self, pos: int) -> Optional[Tuple[int, Optional[str]]]:
+        """Retorna (fim, tipo) do lexema mais longo em `pos`, ou None se nenhuma regra casar."""
+        bio = escanear_literal_bio(self.source, pos)
+        if bio is not None:
+            return bio
+        res = self._longest_match_at(pos)
+        if res is None:
+            return None
+        m, token_tipo, _ = res
+        return m.end(), token_tipo
+
+    def _mais_fonte(self) -> bool:
+        """Lexers que leem o fonte aos poucos carregam mais texto aqui; retorna se há mais."""
+        return False
+
+    def _abortar(self):
+        """Encerra a tokenização (limite de erros atingido)."""
+        self.pos = self.length
+
+    def _reportar_invalidos(self, linha: int, coluna: int):
+        """
+        Consome a sequência de caracteres que nenhuma regra reconhece a partir
+        de `self.pos` e reporta um único erro cobrindo o trecho inteiro.
+        """
+        partes = []
+        inicio = self.pos
+        self.pos += 1
+        while True:
+            src, pos = self.source, self.pos
+            if pos >= self.length:
+                partes.append(src[inicio:pos])
+                if not self._mais_fonte():
+                    break
+                inicio = self.pos
+                continue
+            casou = self._casar(pos) is not None
+            if self.source is not src:
+                # a janela foi recarregada durante o casamento
+                partes.append(src[inicio:pos])
+                inicio = self.pos
+            if casou:
+                partes.append(self.source[inicio:self.pos])
+                break
+            self.pos += 1
+
+        trecho = ''.join(partes)
+        self._update_line_col(trecho)
+        if len(trecho) == 1:
+            msg = f"Caractere não reconhecido '{trecho}'"
+        else:
+            amostra = trecho if len(trecho) <= 20 else trecho[:20] + '...'
+            msg = f"{len(trecho)} caracteres não reconhecidos '{amostra}'"
+        self.error_handler.report_error(
+            LexicalError(msg, linha, coluna, end_line=self.linha, end_col=self.coluna)
+        )
+
+    def _proximo(self) -> Optional[Tuple[str, str, int, int, int, int, Optional[int], Optional[bool]]]:
+        """
+        Avança até o próximo token e retorna os argumentos de `criar_token`
+        (tipo, valor, linha, coluna, início, fim, código do identificador,
+        alfabeto válido) sem alocá-lo; None no fim do fonte.
+        """
         # loop para pular caracteres inválidos sem encerrar a tokenização
         while self.pos < self.length:
             start_pos_current = self.pos
             start_line_current = self.linha
             start_col_current = self.coluna
 
-            res = self._longest_match_at(start_pos_current)
+            res = self._casar(start_pos_current)
             if res is None:
-                bad_char = self.source[self.pos]
-                self.pos += 1
-                self._update_line_col(bad_char)
-
-                err = LexicalError(f"Caractere não reconhecido '{bad_char}'", start_line_current, start_col_current)
-                self.error_handler.report_error(err)
-
+                self._reportar_invalidos(start_line_current, start_col_current)
+                if self.error_handler.limit_reached():
+                    self._abortar()
+                    return None
                 # continuar o laço para tentar o próximo caractere/token
                 continue
 
-            m, token_tipo, rule_idx = res
-            valor = m.group(0)
-            end_pos = m.end()
+            end_pos, token_tipo = res
+            valor = self.source[start_pos_current:end_pos]
             self.pos = end_pos
-            self._update_line_col(valor)
+            alfabeto_valido = self._avancar(token_tipo, start_pos_current, valor)
 
             if token_tipo is None:
                 # token descartável (comentário / whitespace) - continuar
                 continue
 
-            if token_tipo == 'ID' and valor in PALAVRAS_CHAVE:
-                token_tipo = PALAVRAS_CHAVE[valor]
+            codigo_id = None
+            if token_tipo == 'ID':
+                token_tipo, codigo_id, valor = self.tabela_ids.resolver(valor)
 
-            return Token(token_tipo, valor, start_line_current, start_col_current, start_pos_current, end_pos)
+            return (token_tipo, valor, start_line_current, start_col_current, start_pos_current, end_pos,
+                    codigo_id, alfabeto_valido)
 
         # EOF
         return None
 
+    def _next_token_internal(self) -> Optional[Token]:
+        res = self._proximo()
+        if res is None:
+            return None
+        return criar_token(*res)
+
     def next(self) -> Optional[Token]:
         if self._buf:
             return self._buf.popleft()
@@ -211,10 +403,29 @@ class Lexer:
         return toks
 
 
+class LexerRegexMestre(Lexer):
+    """
+    Variante do `Lexer` que casa todas as regras com uma única chamada a
+    `match` sobre a regex mestre, em vez de testar cada regra separadamente
+    em cada posição. A regra vencedora é identificada por `m.lastgroup`.
+    """
+
+    def _casar(self, pos: int) -> Optional[Tuple[int, Optional[str]]]:
+        bio = escanear_literal_bio(self.source, pos)
+        if bio is not None:
+            return bio
+        m = _regex_mestre.match(self.source, pos)
+        if m is None:
+            return None
+        return m.end(), _tipos_mestre[m.lastgroup]
+
+
 class TokenStream:
     def __init__(self, lexer: Lexer):
-        self.lexer = lexer
+        # aceita também um TokenBuffer, consumido pelo seu cursor
+        self.lexer = lexer.leitor() if hasattr(lexer, 'leitor') else lexer
         self.buffer: Deque[Token] = deque()
+        self.anterior: Optional[Token] = None  # último token consumido (fim dos spans da AST)
 
     def _fill(self, n: int):
         while len(self.buffer) < n:
@@ -228,9 +439,10 @@ class TokenStream:
         return self.buffer[n - 1] if len(self.buffer) >= n else None
 
     def next(self) -> Optional[Token]:
-        if self.buffer:
-            return self.buffer.popleft()
-        return self.lexer.next()
+        t = self.buffer.popleft() if self.buffer else self.lexer.next()
+        if t is not None:
+            self.anterior = t
+        return t
 
     def accept(self, tipo: str) -> Optional[Token]:
         t = self.peek(1)
@@ -239,12 +451,13 @@ class TokenStream:
         return None
 
     def expect(self, tipo: str) -> Token:
-        t = self.next()
+        # o token errado não é consumido: a recuperação do parser decide o que descartar
+        t = self.peek(1)
         if t is None:
             raise SyntaxError(f"Esperado token {tipo}, mas chegou EOF")
         if t.tipo != tipo:
             raise SyntaxError(f"Esperado token {tipo}, mas chegou {t.tipo} em Ln{t.linha} Col{t.coluna}")
-        return t
+        return self.next()
 
     def match(self, *tipos: str) -> Optional[Token]:
         t = self.peek(1)
@@ -254,3 +467,74 @@ class TokenStream:
 
     def push_back(self, token: Token):
         self.buffer.appendleft(token)
+
+
+class TokenStreamIndexado:
+    """
+    `TokenStream` sobre tokens já tokenizados, com um cursor inteiro em vez de
+    uma deque: `peek(n)` é O(1) para qualquer n e `mark()`/`reset()` permitem
+    retroceder sem devolver tokens um a um.
+
+    Aceita uma lista de tokens, qualquer sequência indexável (como um
+    `TokenBuffer`, inclusive tokenizado em outro processo) ou um lexer, que é
+    consumido inteiro na construção.
+    """
+
+    def __init__(self, tokens):
+        if hasattr(tokens, 'tokenize_all'):
+            tokens = tokens.tokenize_all()
+        self.tokens = tokens
+        self.pos = 0
+        self._n = len(tokens)
+        self.anterior: Optional[Token] = None  # último token consumido (fim dos spans da AST)
+
+    def peek(self, n: int = 1) -> Optional[Token]:
+        i = self.pos + n - 1
+        return self.tokens[i] if i < self._n else None
+
+    def next(self) -> Optional[Token]:
+        i = self.pos
+        if i >= self._n:
+            return None
+        self.pos = i + 1
+        t = self.anterior = self.tokens[i]
+        return t
+
+    def accept(self, tipo: str) -> Optional[Token]:
+        t = self.peek(1)
+        if t and t.tipo == tipo:
+            return self.next()
+        return None
+
+    def expect(self, tipo: str) -> Token:
+        # o token errado não é consumido: a recuperação do parser decide o que descartar
+        t = self.peek(1)
+        if t is None:
+            raise SyntaxError(f"Esperado token {tipo}, mas chegou EOF")
+        if t.tipo != tipo:
+            raise SyntaxError(f"Esperado token {tipo}, mas chegou {t.tipo} em Ln{t.linha} Col{t.coluna}")
+        return self.next()
+
+    def match(self, *tipos: str) -> Optional[Token]:
+        t = self.peek(1)
+        if t and t.tipo in tipos:
+            return self.next()
+        return None
+
+    def mark(self) -> int:
+        """Posição atual do cursor, para um `reset` posterior."""
+        return self.pos
+
+    def reset(self, marca: int):
+        self.pos = marca
+        self.anterior = self.tokens[marca - 1] if marca > 0 else None
+
+    def push_back(self, token: Token):
+        if self.pos > 0 and self.tokens[self.pos - 1] == token:
+            self.reset(self.pos - 1)
+            return
+        # token que não veio deste stream: passa a morar numa lista própria
+        if not isinstance(self.tokens, list):
+            self.tokens = list(self.tokens)
+        self.tokens.insert(self.pos, token)
+        self._n += 1
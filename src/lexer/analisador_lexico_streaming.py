@@ -0,0 +1,135 @@
+from typing import Optional, TextIO, Tuple
+
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.identificadores import TabelaIdentificadores
+
+TAMANHO_BLOCO = 1 << 20
+
+
+class LexerStreaming(LexerAFD):
+    """
+    Lexer que lê o fonte em blocos de um arquivo texto em vez de exigir o
+    conteúdo inteiro em memória.
+
+    `self.source` é apenas uma janela: ao esgotá-la, o trecho já consumido é
+    descartado e o restante (o início do token em andamento) é mantido como
+    sobra, seguido do próximo bloco. O AFD sabe quando um casamento chegou ao
+    fim da janela ainda vivo, então a varredura é retomada do mesmo estado
+    depois da recarga; tokens que atravessam blocos (comentários `/" ... "/`,
+    literais `dna"..."` longos) saem idênticos aos do `Lexer`. As posições
+    `start_pos`/`end_pos` são absolutas, em caracteres, como em `Lexer`.
+    """
+
+    def __init__(self, arquivo: TextIO, error_handler=None,
+                 tamanho_bloco: int = TAMANHO_BLOCO, tabelas: Optional[dict] = None,
+                 tabela_ids: Optional[TabelaIdentificadores] = None):
+        super().__init__('', error_handler, tabelas, tabela_ids)
+        self._arquivo = arquivo
+        self._tamanho_bloco = tamanho_bloco
+        self._base = 0  # posição absoluta de self.source[0]
+        self._eof = False
+
+    def _carregar(self) -> int:
+        """Descarta a janela antes de `self.pos` e lê o próximo bloco. Retorna quanto foi descartado."""
+        if self._eof:
+            return 0
+        sobra = self.source[self.pos:]
+        # tokens maiores que um bloco dobram a leitura, evitando recópias quadráticas da sobra
+        bloco = self._arquivo.read(max(self._tamanho_bloco, len(sobra)))
+        if not bloco:
+            self._eof = True
+        descartado = self.pos
+        self.source = sobra + bloco
+        self.length = len(self.source)
+        self._base += descartado
+        self.pos = 0
+        return descartado
+
+    def _mais_fonte(self) -> bool:
+        self._carregar()
+        return self.pos < self.length
+
+    def _abortar(self):
+        self._eof = True
+        self.pos = self.length
+
+    def _casar(self, pos: int) -> Optional[Tuple[int, Optional[str]]]:
+        afd = self._afd
+        classes = afd.classes
+        trans = afd.trans
+        aceita = afd.aceita
+        saltos = afd.saltos
+
+        estado = afd.inicio
+        fim = -1
+        token = -1
+        i = pos
+        while True:
+            src = self.source
+            n = self.length
+            while i < n:
+                ch = src[i]
+                c = ord(ch)
+                if c < 128:
+                    cls = classes[c]
+                else:
+                    cls = afd.cls_digito if ch.isdecimal() else afd.cls_nao_ascii
+                estado = trans[estado][cls]
+                if estado < 0:
+                    break
+                i += 1
+                salto = saltos[estado]
+                if salto is not None:
+                    i = salto(src, i, n).end()
+                if aceita[estado] >= 0:
+                    fim = i
+                    token = aceita[estado]
+            else:
+                # o AFD ainda está vivo no fim da janela: recarrega e continua
+                if not self._eof:
+                    descartado = self._carregar()
+                    i -= descartado
+                    if fim >= 0:
+                        fim -= descartado
+                    continue
+            break
+
+        if fim < 0:
+            return None
+        return fim, afd.tipos[token]
+
+    def _proximo(self) -> Optional[Tuple[str, str, int, int, int, int, Optional[int], Optional[bool]]]:
+        while True:
+            if self.pos >= self.length:
+                self._carregar()
+                if self.pos >= self.length:
+                    return None
+
+            start_line_current = self.linha
+            start_col_current = self.coluna
+
+            res = self._casar(self.pos)
+            # `_casar` pode ter recarregado a janela: a posição do token é relida
+            start_pos_current = self.pos
+            if res is None:
+                self._reportar_invalidos(start_line_current, start_col_current)
+                if self.error_handler.limit_reached():
+                    self._abortar()
+                    return None
+                continue
+
+            end_pos, token_tipo = res
+            valor = self.source[start_pos_current:end_pos]
+            self.pos = end_pos
+            alfabeto_valido = self._avancar(token_tipo, start_pos_current, valor)
+
+            if token_tipo is None:
+                continue
+
+            codigo_id = None
+            if token_tipo == 'ID':
+                token_tipo, codigo_id, valor = self.tabela_ids.resolver(valor)
+
+            base = self._base
+            return (token_tipo, valor, start_line_current, start_col_current,
+                    base + start_pos_current, base + end_pos, codigo_id, alfabeto_valido)
@@ -0,0 +1,190 @@
+"""
+Armazenamento compacto de tokens.
+
+`TokenBuffer` guarda os tokens em colunas paralelas de `array` (tipo como
+código inteiro pequeno, posições, linha, coluna e código de identificador) em vez de um objeto `Token`
+por lexema. O valor é fatiado do fonte apenas quando acessado. `TokenView` é a
+visão leve de um token para o parser; `TokenStream` e `TokenStreamIndexado`
+consomem o buffer diretamente.
+"""
+from array import array
+from typing import Iterator, List, Optional, Type
+
+from src.lexer.analisador_lexico_completo import (
+    ALFABETOS_BIO, INICIO_CONTEUDO_BIO, Lexer, Token, alfabeto_bio_valido, criar_token,
+)
+from src.lexer.identificadores import TabelaIdentificadores
+from src.lexer.protocolo import TipoToken
+
+# Códigos dos tipos de token: a posição do tipo em `TipoToken`.
+TIPOS_TOKEN: List[str] = [t.value for t in TipoToken]
+
+CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(TIPOS_TOKEN)}
+
+
+class TokenView:
+    """Visão de um token dentro de um `TokenBuffer`, com a mesma interface de `Token`."""
+
+    __slots__ = ('_buf', '_i')
+
+    def __init__(self, buf: 'TokenBuffer', i: int):
+        self._buf = buf
+        self._i = i
+
+    @property
+    def tipo(self) -> str:
+        return TIPOS_TOKEN[self._buf.tipos[self._i]]
+
+    @property
+    def valor(self) -> str:
+        buf = self._buf
+        return buf.source[buf.inicios[self._i]:buf.fins[self._i]]
+
+    @property
+    def linha(self) -> int:
+        return self._buf.linhas[self._i]
+
+    @property
+    def coluna(self) -> int:
+        return self._buf.colunas[self._i]
+
+    @property
+    def start_pos(self) -> int:
+        return self._buf.inicios[self._i]
+
+    @property
+    def codigo_id(self) -> Optional[int]:
+        codigo = self._buf.ids[self._i]
+        return None if codigo < 0 else codigo
+
+    @property
+    def end_pos(self) -> int:
+        return self._buf.fins[self._i]
+
+    @property
+    def tamanho(self) -> Optional[int]:
+        tipo = self.tipo
+        if tipo not in ALFABETOS_BIO:
+            return None
+        return self.end_pos - self.start_pos - INICIO_CONTEUDO_BIO[tipo] - 1
+
+    @property
+    def alfabeto_valido(self) -> Optional[bool]:
+        tipo = self.tipo
+        if tipo not in ALFABETOS_BIO:
+            return None
+        # direto no fonte do buffer, sem copiar o literal
+        return alfabeto_bio_valido(tipo, self._buf.source, self.start_pos + INICIO_CONTEUDO_BIO[tipo],
+                                   self.end_pos - 1)
+
+    def para_token(self) -> Token:
+        return criar_token(self.tipo, self.valor, self.linha, self.coluna, self.start_pos, self.end_pos,
+                           self.codigo_id)
+
+    def _campos(self):
+        return (self.tipo, self.valor, self.linha, self.coluna, self.start_pos, self.end_pos)
+
+    def __eq__(self, other):
+        if isinstance(other, (TokenView, Token)):
+            return self._campos() == (
+                other.tipo, other.valor, other.linha, other.coluna, other.start_pos, other.end_pos
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.tipo, self.valor, self.linha, self.coluna))
+
+    def __repr__(self):
+        return f"Token({self.tipo!r}, {self.valor!r}, Ln{self.linha}, Col{self.coluna})"
+
+
+class CursorTokens:
+    """Leitor sequencial de um `TokenBuffer`, com a interface `next()` de `Lexer`."""
+
+    def __init__(self, buf: 'TokenBuffer'):
+        self.buf = buf
+        self.i = 0
+
+    def next(self) -> Optional[TokenView]:
+        if self.i >= len(self.buf):
+            return None
+        v = TokenView(self.buf, self.i)
+        self.i += 1
+        return v
+
+
+class TokenBuffer:
+    def __init__(self, source: str, tabela_ids: Optional[TabelaIdentificadores] = None):
+        self.source = source
+        # tabela dos códigos em `ids`: vai junto com o buffer (inclusive para
+        # outros processos), pois os códigos só valem nela
+        self.tabela_ids = tabela_ids
+        self.tipos = array('B')
+        self.inicios = array('i')
+        self.fins = array('i')
+        self.linhas = array('i')
+        self.colunas = array('i')
+        self.ids = array('i')  # -1 fora de IDs/palavras-chave
+
+    @classmethod
+    def do_lexer(cls, lexer: Lexer) -> 'TokenBuffer':
+        """Consome todos os tokens restantes de `lexer`."""
+        buf = cls(lexer.source, lexer.tabela_ids)
+        while lexer._buf:
+            t = lexer._buf.popleft()
+            buf.adicionar(t.tipo, t.start_pos, t.end_pos, t.linha, t.coluna, t.codigo_id)
+
+        tipos, inicios, fins = buf.tipos.append, buf.inicios.append, buf.fins.append
+        linhas, colunas, ids = buf.linhas.append, buf.colunas.append, buf.ids.append
+        proximo = lexer._proximo
+        while True:
+            res = proximo()
+            if res is None:
+                return buf
+            tipo, _, linha, coluna, inicio, fim, codigo_id, _ = res
+            tipos(CODIGO_TIPO[tipo])
+            inicios(inicio)
+            fins(fim)
+            linhas(linha)
+            colunas(coluna)
+            ids(-1 if codigo_id is None else codigo_id)
+
+    @classmethod
+    def tokenizar(cls, source: str, error_handler=None, lexer_cls: Type[Lexer] = Lexer) -> 'TokenBuffer':
+        return cls.do_lexer(lexer_cls(source, error_handler=error_handler))
+
+    def adicionar(self, tipo: str, inicio: int, fim: int, linha: int, coluna: int,
+                  codigo_id: Optional[int] = None):
+        self.tipos.append(CODIGO_TIPO[tipo])
+        self.inicios.append(inicio)
+        self.fins.append(fim)
+        self.linhas.append(linha)
+        self.colunas.append(coluna)
+        self.ids.append(-1 if codigo_id is None else codigo_id)
+
+    def tipo(self, i: int) -> str:
+        return TIPOS_TOKEN[self.tipos[i]]
+
+    def valor(self, i: int) -> str:
+        return self.source[self.inicios[i]:self.fins[i]]
+
+    def leitor(self) -> CursorTokens:
+        return CursorTokens(self)
+
+    def __len__(self) -> int:
+        return len(self.tipos)
+
+    def __getitem__(self, i: int) -> TokenView:
+        n = len(self.tipos)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice de token fora do buffer")
+        return TokenView(self, i)
+
+    def __iter__(self) -> Iterator[TokenView]:
+        for i in range(len(self.tipos)):
+            yield TokenView(self, i)
+
+    def para_tokens(self) -> List[Token]:
+        return [v.para_token() for v in self]
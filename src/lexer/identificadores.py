@@ -0,0 +1,64 @@
+import sys
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+class TabelaIdentificadores:
+    """
+    Tabela de internação de identificadores.
+
+    Cada nome distinto recebe um código inteiro estável (na ordem de inserção)
+    e uma única instância de `str` passada por `sys.intern`, de modo que
+    etapas posteriores (parser, tabela de símbolos, codegen) comparem objetos
+    idênticos em vez de re-hashear strings. As palavras-chave são cadastradas
+    na construção já com o tipo de token resolvido, então o lexer resolve um
+    ID com uma única consulta ao dicionário.
+
+    Os códigos só valem dentro da tabela que os gerou: cada lexer usa uma
+    tabela própria (por arquivo), e quem guarda os códigos guarda a tabela
+    junto (ver `TokenBuffer.tabela_ids`).
+    """
+
+    def __init__(self, palavras_chave: Optional[Mapping[str, str]] = None):
+        self._entradas: Dict[str, Tuple[str, int, str]] = {}  # nome -> (tipo, código, nome internado)
+        self.nomes: List[str] = []
+        for nome, tipo in (palavras_chave or {}).items():
+            self._registrar(nome, tipo)
+        self.total_palavras_chave = len(self.nomes)
+
+    def copiar(self) -> 'TabelaIdentificadores':
+        """Tabela nova com as mesmas entradas (ex.: partir só das palavras-chave)."""
+        copia = TabelaIdentificadores.__new__(TabelaIdentificadores)
+        copia._entradas = dict(self._entradas)
+        copia.nomes = list(self.nomes)
+        copia.total_palavras_chave = self.total_palavras_chave
+        return copia
+
+    def _registrar(self, nome: str, tipo: str) -> Tuple[str, int, str]:
+        nome = sys.intern(nome)
+        entrada = (tipo, len(self.nomes), nome)
+        self.nomes.append(nome)
+        self._entradas[nome] = entrada
+        return entrada
+
+    def resolver(self, nome: str) -> Tuple[str, int, str]:
+        """Retorna (tipo do token, código, nome internado), cadastrando `nome` se for novo."""
+        entrada = self._entradas.get(nome)
+        if entrada is None:
+            entrada = self._registrar(nome, 'ID')
+        return entrada
+
+    def codigo(self, nome: str) -> Optional[int]:
+        entrada = self._entradas.get(nome)
+        return None if entrada is None else entrada[1]
+
+    def nome(self, codigo: int) -> str:
+        return self.nomes[codigo]
+
+    def e_palavra_chave(self, codigo: int) -> bool:
+        return codigo < self.total_palavras_chave
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self._entradas
+
+    def __len__(self) -> int:
+        return len(self.nomes)
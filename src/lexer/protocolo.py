@@ -0,0 +1,59 @@
+"""
+Tipos de token e protocolo de fluxo compartilhados pelo front-end.
+
+`TipoToken` é a enumeração única dos tipos que os lexers produzem: os das
+regras de `analisador_lexico_completo` (na ordem delas, que é a ordem dos
+códigos de `TokenBuffer`), as classes de palavra-chave e `EOF`, o sentinela
+dos fluxos que não devolvem None no fim (`tokens.TokenStream`). Os membros
+herdam de `str`, então `TipoToken.SEMI == 'SEMI'` e o código que compara
+`t.tipo` com strings continua valendo.
+
+`FluxoTokens` é o que os parsers consomem. `TokenStream` (sobre um lexer) e
+`TokenStreamIndexado` (sobre tokens já tokenizados) o implementam.
+"""
+from enum import Enum
+from typing import Optional, Protocol, runtime_checkable
+
+from src.lexer.analisador_lexico_completo import PALAVRAS_CHAVE, REGRAS
+
+
+def _nomes_tipos():
+    nomes = []
+    for _, tipo in REGRAS:
+        if tipo is not None and tipo not in nomes:
+            nomes.append(tipo)
+    for tipo in PALAVRAS_CHAVE.values():
+        if tipo not in nomes:
+            nomes.append(tipo)
+    nomes.append('EOF')
+    return nomes
+
+
+class _Tipo(str, Enum):
+    def __str__(self):
+        return self.value
+
+
+TipoToken = _Tipo('TipoToken', [(nome, nome) for nome in _nomes_tipos()])
+
+PALAVRAS_RESERVADAS = frozenset(PALAVRAS_CHAVE)
+
+
+@runtime_checkable
+class FluxoTokens(Protocol):
+    """
+    Fluxo de tokens com lookahead. `peek(1)` é o próximo token; no fim,
+    `peek` e `next` devolvem None. `expect` levanta o SyntaxError nativo sem
+    consumir o token recusado.
+    """
+    anterior: Optional[object]
+
+    def peek(self, n: int = 1): ...
+
+    def next(self): ...
+
+    def accept(self, tipo: str): ...
+
+    def expect(self, tipo: str): ...
+
+    def match(self, *tipos: str): ...
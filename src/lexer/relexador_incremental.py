@@ -0,0 +1,248 @@
+"""
+Re-tokenização incremental.
+
+Após uma edição pequena (editor, modo watch), `relexar` reaproveita a lista
+de tokens anterior: volta até um limite de token seguro antes da edição,
+re-tokeniza só a região afetada e, assim que um token novo começa na mesma
+posição (deslocada) de um token antigo depois da edição, reaproveita o resto
+da lista ajustando posições, linhas e colunas.
+
+A re-sincronização é correta porque o lexer não tem estado além da posição:
+a partir de um mesmo ponto de início de token, sufixos iguais do fonte geram
+os mesmos tokens.
+
+O custo de uma edição é proporcional à região re-examinada, não ao arquivo:
+o resultado (`TokensRelexados`) referencia o começo e a cauda da lista
+anterior em vez de copiá-los, e o deslocamento de posição e de linha da
+cauda só é aplicado ao token acessado. Os tokens que podem mudar com uma
+aspa em qualquer ponto posterior (ver `_aberto_sem_fim`) são acompanhados
+de edição em edição; só a primeira edição com aspa sobre uma lista comum
+percorre o arquivo para encontrá-los. A cada `MAX_TRECHOS` trechos a
+sequência é compactada numa lista (O(arquivo), amortizado entre as edições).
+"""
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import replace
+from itertools import islice
+from typing import List, Optional, Sequence as SequenciaTipada, Tuple, Type
+
+from src.lexer.analisador_lexico_completo import Lexer, Token
+
+# Quantos caracteres além do fim de um token o lexer pode ter inspecionado ao
+# decidir o casamento (ex.: "1.5" seguido de "e+" só vira FLOAT_EXP com um
+# dígito logo depois). Construções sem limite são tratadas à parte.
+LOOKAHEAD_MAXIMO = 3
+
+PREFIXOS_BIO = ('dna', 'rna', 'prot')
+TIPOS_BIO = ('DNA_LIT', 'RNA_LIT', 'PROT_LIT')
+
+# Acima disso os trechos de um `TokensRelexados` são copiados numa lista só.
+MAX_TRECHOS = 512
+
+# (lista base, início, fim, deslocamento de posição, deslocamento de linha)
+Trecho = Tuple[List[Token], int, int, int, int]
+
+
+class TokensRelexados(Sequence):
+    """
+    Tokens do fonte editado, como trechos de listas de tokens (a anterior e a
+    dos tokens re-examinados). Indexar, iterar e comparar com uma lista
+    funcionam como numa lista; os tokens de um trecho deslocado são cópias
+    ajustadas criadas no acesso, os dos demais são os próprios objetos.
+    """
+    __slots__ = ('_trechos', '_inicios', '_n', 'abertos')
+
+    def __init__(self, trechos: List[Trecho], abertos: Optional[List[int]] = None):
+        if len(trechos) > MAX_TRECHOS:
+            lista = [t for trecho in trechos for t in _iterar_trecho(trecho)]
+            trechos = [(lista, 0, len(lista), 0, 0)]
+        self._trechos = trechos
+        self._inicios: List[int] = []
+        n = 0
+        for _, ini, fim, _, _ in trechos:
+            self._inicios.append(n)
+            n += fim - ini
+        self._n = n
+        # posições de início dos tokens abertos (`_aberto_sem_fim`), em ordem;
+        # None enquanto não foram procuradas
+        self.abertos = abertos
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._n))]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError('índice de token fora da sequência')
+        k = bisect_right(self._inicios, i) - 1
+        base, ini, _, d_pos, d_linha = self._trechos[k]
+        return _ajustar(base[ini + i - self._inicios[k]], d_pos, d_linha)
+
+    def __iter__(self):
+        for trecho in self._trechos:
+            yield from _iterar_trecho(trecho)
+
+    def __eq__(self, outro):
+        if isinstance(outro, Sequence) and not isinstance(outro, str):
+            return len(self) == len(outro) and all(a == b for a, b in zip(self, outro))
+        return NotImplemented
+
+    __hash__ = None
+
+
+def _ajustar(tok: Token, d_pos: int, d_linha: int) -> Token:
+    if d_pos == 0 and d_linha == 0:
+        return tok
+    return replace(tok, linha=tok.linha + d_linha, start_pos=tok.start_pos + d_pos, end_pos=tok.end_pos + d_pos)
+
+
+def _iterar_trecho(trecho: Trecho):
+    base, ini, fim, d_pos, d_linha = trecho
+    if d_pos == 0 and d_linha == 0:
+        return islice(base, ini, fim)
+    return (_ajustar(t, d_pos, d_linha) for t in islice(base, ini, fim))
+
+
+def _trechos(tokens: SequenciaTipada[Token], ini: int, fim: int, d_pos: int = 0, d_linha: int = 0) -> List[Trecho]:
+    """Trechos que cobrem `tokens[ini:fim]`, deslocados de (`d_pos`, `d_linha`), sem copiar tokens."""
+    if ini >= fim:
+        return []
+    if not isinstance(tokens, TokensRelexados):
+        return [(tokens, ini, fim, d_pos, d_linha)]
+    saida = []
+    k = bisect_right(tokens._inicios, ini) - 1
+    while k < len(tokens._trechos) and tokens._inicios[k] < fim:
+        base, b_ini, b_fim, b_pos, b_linha = tokens._trechos[k]
+        inicio = tokens._inicios[k]
+        de = b_ini + max(ini - inicio, 0)
+        ate = b_ini + min(fim - inicio, b_fim - b_ini)
+        saida.append((base, de, ate, b_pos + d_pos, b_linha + d_linha))
+        k += 1
+    return saida
+
+
+def _posicao_apos(tok: Token) -> Tuple[int, int]:
+    """Linha e coluna em que o lexer fica depois de consumir `tok`."""
+    quebra = tok.valor.rfind('\n')
+    if quebra == -1:
+        return tok.linha, tok.coluna + len(tok.valor)
+    return tok.linha + tok.valor.count('\n'), len(tok.valor) - quebra - 1
+
+
+def _aberto_sem_fim(tok: Token, fonte: str) -> bool:
+    """
+    Tokens cujo casamento pode mudar com uma aspa inserida em qualquer ponto
+    posterior do arquivo: `/"` de comentário sem fechamento (virou SLASH),
+    `dna"`/`rna"`/`prot"` sem fechamento (virou ID) e literais biológicos
+    terminados em `\\"` (a regex recuou para usar essa aspa como fechamento).
+    """
+    if tok.tipo == 'SLASH' or (tok.tipo == 'ID' and tok.valor in PREFIXOS_BIO):
+        return fonte.startswith('"', tok.end_pos)
+    return tok.tipo in TIPOS_BIO and tok.valor.endswith('\\"')
+
+
+def _abertos(fonte: str, tokens: SequenciaTipada[Token]) -> List[int]:
+    """Posições de início dos tokens de `tokens` abertos sem fim (percorre a lista toda)."""
+    abertos = getattr(tokens, 'abertos', None)
+    if abertos is None:
+        abertos = [t.start_pos for t in tokens if _aberto_sem_fim(t, fonte)]
+    return abertos
+
+
+def _inicio_seguro(tokens: SequenciaTipada[Token], offset: int, abertos: Optional[List[int]]) -> int:
+    """
+    Quantos tokens do início da lista antiga permanecem válidos. `abertos` só
+    é passado quando a edição tem uma aspa.
+    """
+    k = bisect_right(tokens, offset - LOOKAHEAD_MAXIMO, key=lambda t: t.end_pos) - 1
+    if k < 0:
+        return 0
+    # Strings sem fechamento são limitadas à linha: recomeça antes do primeiro
+    # token da linha para que um `"` órfão seja re-examinado.
+    j = k
+    linha = tokens[k].linha
+    while j > 0 and tokens[j - 1].linha == linha:
+        j -= 1
+    if abertos and abertos[0] < tokens[j].start_pos:
+        return bisect_left(tokens, abertos[0], key=lambda t: t.start_pos)
+    return j
+
+
+def relexar(
+    fonte: str,
+    tokens: SequenciaTipada[Token],
+    offset: int,
+    removidos: int,
+    inserido: str,
+    error_handler=None,
+    lexer_cls: Type[Lexer] = Lexer,
+) -> Tuple[str, TokensRelexados]:
+    """
+    Aplica a edição `fonte[offset:offset + removidos] = inserido` e retorna
+    `(novo_fonte, novos_tokens)`, equivalente a re-tokenizar o arquivo todo.
+
+    `tokens` deve ser a saída de `tokenize_all` para `fonte`, ou o resultado
+    de um `relexar` anterior (o caso de edições em sequência). Apenas a região
+    re-examinada reporta erros léxicos em `error_handler`.
+    """
+    if offset < 0 or removidos < 0 or offset + removidos > len(fonte):
+        raise ValueError("Edição fora dos limites do fonte")
+
+    novo = fonte[:offset] + inserido + fonte[offset + removidos:]
+    delta = len(inserido) - removidos
+    fim_edicao = offset + len(inserido)
+    abertos = getattr(tokens, 'abertos', None)
+    if '"' in novo[max(offset - 1, 0):fim_edicao + 1]:
+        abertos = _abertos(fonte, tokens)
+
+    r = _inicio_seguro(tokens, offset, abertos)
+    novos: List[Token] = []
+
+    lexer = lexer_cls(novo, error_handler=error_handler)
+    limite_prefixo = 0
+    if r > 0:
+        anterior = tokens[r - 1]
+        lexer.pos = limite_prefixo = anterior.end_pos
+        lexer.linha, lexer.coluna = _posicao_apos(anterior)
+
+    # primeiro token antigo que começa depois do trecho removido
+    i = bisect_right(tokens, offset + removidos - 1, key=lambda t: t.start_pos)
+    n = len(tokens)
+    while True:
+        t: Optional[Token] = lexer.next()
+        if t is None:
+            i = n
+            break
+        novos.append(t)
+        if t.start_pos < fim_edicao:
+            continue
+        while i < n and tokens[i].start_pos + delta < t.start_pos:
+            i += 1
+        if i < n and tokens[i].start_pos + delta == t.start_pos:
+            break
+
+    d_linha = d_coluna = 0
+    cauda = i + 1
+    if i < n:
+        antigo = tokens[i]
+        d_linha = t.linha - antigo.linha
+        d_coluna = t.coluna - antigo.coluna
+        if d_coluna:
+            # os tokens que seguem na linha da sincronização mudam de coluna:
+            # esses são ajustados já
+            while cauda < n and tokens[cauda].linha == antigo.linha:
+                tok = tokens[cauda]
+                novos.append(replace(tok, linha=tok.linha + d_linha, coluna=tok.coluna + d_coluna,
+                                     start_pos=tok.start_pos + delta, end_pos=tok.end_pos + delta))
+                cauda += 1
+
+    if abertos is not None:
+        inicio_cauda = tokens[cauda].start_pos if cauda < n else len(fonte) + 1
+        abertos = ([p for p in abertos if p < limite_prefixo]
+                   + [t.start_pos for t in novos if _aberto_sem_fim(t, novo)]
+                   + [p + delta for p in abertos if p >= inicio_cauda])
+    trechos = _trechos(tokens, 0, r) + [(novos, 0, len(novos), 0, 0)] + _trechos(tokens, cauda, n, delta, d_linha)
+    return novo, TokensRelexados(trechos, abertos)
@@ -0,0 +1,45 @@
+"""
+Tabelas pré-computadas do lexer.
+
+`afd_lexer.json` é gerado por `tools/gerador_tabelas.py` a partir de
+`afn_to_afd.build_master_dfa` e consumido por `LexerAFD`. A assinatura grava
+o hash das regras léxicas: se o arquivo estiver ausente ou desatualizado, as
+tabelas são reconstruídas em memória (mais lento, mas sempre correto).
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+ARQUIVO_AFD = os.path.join(os.path.dirname(__file__), 'afd_lexer.json')
+
+
+def assinatura_regras() -> str:
+    """Hash de `REGRAS` e das definições do AFN que geram as tabelas."""
+    from src.lexer import afn_to_afd
+    from src.lexer.analisador_lexico_completo import REGRAS
+
+    h = hashlib.sha256(repr(REGRAS).encode('utf-8'))
+    with open(afn_to_afd.__file__, 'rb') as f:
+        h.update(f.read().replace(b'\r\n', b'\n'))
+    return h.hexdigest()
+
+
+def gerar_tabelas_afd() -> dict:
+    from src.lexer.afn_to_afd import build_master_dfa, tabulate_dfa
+
+    tabelas = tabulate_dfa(build_master_dfa())
+    tabelas['assinatura'] = assinatura_regras()
+    return tabelas
+
+
+@lru_cache(maxsize=1)
+def carregar_tabelas_afd() -> dict:
+    try:
+        with open(ARQUIVO_AFD, 'r', encoding='utf-8') as f:
+            tabelas = json.load(f)
+        if tabelas.get('assinatura') == assinatura_regras():
+            return tabelas
+    except (OSError, ValueError):
+        pass
+    return gerar_tabelas_afd()
@@ -1,39 +1,25 @@
 from dataclasses import dataclass
 from typing import Any, List
 
-# Lista de Palavras-Chave (KWD)
-KEYWORDS = {
-    "and", "or", "not", "if", "else", "elif", "for", "while", "loop", "return",
-    "break", "continue", "function", "procedure", "var", "const", "import", "from", "as",
-    "struct", "enum", "match", "case", "default", "true", "false", "null",
-    "pub", "extern", "use", "class", "extends",
-    "void", "read", "print", "new", "int", "float", "double", "string", "bool", "char"
-}
-
-TOKEN_KINDS = {
-    # Ignorados (serão filtrados no Lexer)
-    'WS', 'NEWLINE', 'LINE_COMMENT', 'BLOCK_COMMENT',
-    # Delimitadores Compostos (Prioridade de Maximal-Munch)
-    'DOT3', 'DOT2', 'FATARROW', 'ARROW',
-    # Operadores Compostos
-    'SHR_EQ', 'SHL_EQ', 'PLUS_EQ', 'MINUS_EQ', 'STAR_EQ', 'SLASH_EQ',
-    'PERC_EQ', 'AMP_EQ', 'BAR_EQ', 'CARET_EQ', 'EQ', 'NE', 'LE', 'GE',
-    'AND_AND', 'OR_OR', 'SHR', 'SHL',
-    # Delimitadores Simples
-    'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE', 'LBRACK', 'RBRACK',
-    'COMMA', 'SEMI', 'COLON', 'AT', 'DOT',
-    # Operadores Simples (incluídos na seção de delimitadores na especificação)
-    'PLUS', 'MINUS', 'STAR', 'SLASH', 'PERCENT', 'CARET', 'AMP', 'BAR', 'BANG', 'TILDE', 'ASSIGN', 'LT', 'GT',
-    # Literais (Strings e Biológicos)
-    'STRING', 'CHAR', 'TRIPLE_STRING', 'BYTE_STRING', 'RAW_STRING',
-    'DNA_LIT', 'RNA_LIT', 'PROT_LIT',
-    # Números
-    'DEC_INT', 'HEX_INT', 'OCT_INT', 'BIN_INT', 'FLOAT', 'FLOAT_EXP', 'INF_NAN',
-    # Identificadores e Palavras-chave
-    'KWD', 'ID',
-    # Especiais
-    'EOF', 'UNKNOWN'
-}
+from src.lexer.protocolo import PALAVRAS_RESERVADAS, TipoToken
+from src.utils.erros import SyntaxError
+
+# Palavras-chave e tipos de token vêm do front-end único (`src.lexer.protocolo`).
+KEYWORDS = PALAVRAS_RESERVADAS
+
+TOKEN_KINDS = frozenset(TipoToken)
+
+
+def _literal(tipo: str, valor: str) -> Any:
+    if tipo == 'DEC_INT':
+        return int(valor)
+    if tipo in ('FLOAT', 'FLOAT_EXP'):
+        return float(valor)
+    if tipo in ('STRING', 'CHAR_LIT'):
+        return valor[1:-1]
+    if tipo in ('DNA_LIT', 'RNA_LIT', 'PROT_LIT'):
+        return valor[valor.index('"') + 1:-1]
+    return None
 
 
 @dataclass
@@ -53,11 +39,22 @@ class Token:
         return f"Token({self.tipo}, '{self.valor}', L{self.linha}:C{self.coluna})"
 
 class TokenStream:
-    """Stream de tokens com capacidades de peek/expect para o Parser."""
+    """
+    Stream de tokens com capacidades de peek/expect para o Parser.
+
+    API legada (usada por `ParserLL1`): `peek(0)` é o token atual e o fim é um
+    token EOF, não None. Use `do_fonte` para tokenizar pelo front-end único.
+    """
     def __init__(self, tokens: List[Token]):
         self._tokens = tokens
         self._current = 0
 
+    @classmethod
+    def do_fonte(cls, fonte: str, error_handler=None) -> 'TokenStream':
+        from src.frontend import tokenizar
+        return cls([Token(t.tipo, t.valor, _literal(t.tipo, t.valor), t.linha, t.coluna)
+                    for t in tokenizar(fonte, error_handler)])
+
     def peek(self, offset: int = 0) -> Token:
         """Retorna o token atual ou futuro sem consumir."""
         index = self._current + offset
@@ -100,8 +97,6 @@ class TokenStream:
             self.next()
             return token
 
-        from ...utils.erros import SyntaxError
-
         expected_info = f"'{expected_lexeme}'" if expected_lexeme else expected_kind
 
         # CORRIGIDO: Usando token.valor, token.tipo, token.linha e token.coluna
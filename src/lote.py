@@ -0,0 +1,173 @@
+"""
+Processamento em lote de muitos arquivos .cd (`codon lex` / `codon check`).
+
+Com `semantica=True`, o `check` também roda a análise semântica; com um
+`dir_semantico`, ela é incremental (`src.semantic.incremental`): só as
+declarações de topo que mudaram desde a última execução, e as que dependem
+delas, são reanalisadas. Com um arquivo só, os `jobs` vão para a análise
+semântica das declarações dele (`src.semantic.paralelo`).
+
+Os arquivos são distribuídos em fragmentos de tamanho total equilibrado
+(maior arquivo primeiro, sempre para o fragmento menos carregado) e cada
+fragmento é processado por um worker de um `ProcessPoolExecutor`, pagando a
+inicialização do interpretador uma vez por worker em vez de uma vez por
+arquivo.
+"""
+import heapq
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+from src.frontend import LEXER_PADRAO, PARSER_PADRAO
+from src.lexer.analisador_lexico_completo import TokenStreamIndexado
+from src.lexer.buffer_tokens import TokenBuffer
+from src.semantic.analyzer import SemanticAnalyzer
+from src.semantic.incremental import analisar_incremental
+from src.semantic.paralelo import analisar_paralelo
+from src.utils.erros import ErrorHandler
+
+MODOS = ('lex', 'check')
+
+# posição embutida na mensagem do SyntaxError nativo levantado por `expect`
+_POSICAO_MENSAGEM = re.compile(r'Ln(\d+) Col(\d+)')
+
+
+@dataclass
+class Diagnostico:
+    codigo: str
+    mensagem: str
+    linha: int
+    coluna: int
+
+    def __str__(self):
+        return f"{self.linha}:{self.coluna}: {self.codigo} {self.mensagem}"
+
+
+@dataclass
+class ResultadoArquivo:
+    arquivo: str
+    tokens: int = 0
+    diagnosticos: List[Diagnostico] = field(default_factory=list)
+    buffer: Optional[TokenBuffer] = None
+
+
+def coletar_arquivos(caminhos: Iterable[str]) -> List[str]:
+    """Expande diretórios (recursivamente, apenas *.cd) e remove duplicatas, mantendo a ordem."""
+    arquivos: List[str] = []
+    vistos = set()
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            encontrados = []
+            for raiz, _, nomes in os.walk(caminho):
+                encontrados.extend(os.path.join(raiz, n) for n in nomes if n.endswith('.cd'))
+            encontrados.sort()
+        else:
+            encontrados = [caminho]
+        for arq in encontrados:
+            arq = os.path.abspath(arq)
+            if arq not in vistos:
+                vistos.add(arq)
+                arquivos.append(arq)
+    return arquivos
+
+
+def fragmentar_por_tamanho(arquivos: List[str], n_fragmentos: int) -> List[List[str]]:
+    """Distribui os arquivos em até `n_fragmentos` grupos de tamanho total parecido (LPT)."""
+    n_fragmentos = max(1, min(n_fragmentos, len(arquivos)))
+    fragmentos: List[List[str]] = [[] for _ in range(n_fragmentos)]
+    heap = [(0, i) for i in range(n_fragmentos)]
+    for arq in sorted(arquivos, key=os.path.getsize, reverse=True):
+        carga, i = heapq.heappop(heap)
+        fragmentos[i].append(arq)
+        heapq.heappush(heap, (carga + os.path.getsize(arq), i))
+    return [f for f in fragmentos if f]
+
+
+def processar_arquivo(arquivo: str, modo: str = 'check', com_tokens: bool = False,
+                      max_erros: Optional[int] = None, semantica: bool = False,
+                      dir_semantico: Optional[str] = None, jobs_semantica: int = 1) -> ResultadoArquivo:
+    """
+    Tokeniza (`lex`) ou tokeniza e analisa sintaticamente (`check`) um arquivo.
+    Com `max_erros`, o processamento do arquivo para ao atingir o limite.
+    Com `semantica`, o `check` de um arquivo sem erros léxicos/sintáticos
+    segue para a análise semântica, incremental se houver `dir_semantico` e
+    distribuída em `jobs_semantica` processos.
+    """
+    res = ResultadoArquivo(arquivo)
+    try:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            fonte = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        res.diagnosticos.append(Diagnostico('IO000', str(e), -1, -1))
+        return res
+
+    # os workers não imprimem: os diagnósticos voltam no resultado
+    eh = ErrorHandler(buffered=True, max_errors=max_erros)
+    buf = TokenBuffer.tokenizar(fonte, eh, lexer_cls=LEXER_PADRAO)
+    res.tokens = len(buf)
+    if com_tokens:
+        res.buffer = buf
+
+    if modo == 'check' and not eh.limit_reached():
+        programa = None
+        try:
+            programa = PARSER_PADRAO(TokenStreamIndexado(buf), eh).parse()
+        except Exception as e:
+            # erros de sintaxe vão para `eh`; aqui só chega o que escapou da recuperação
+            m = _POSICAO_MENSAGEM.search(str(e))
+            linha, coluna = (int(m.group(1)), int(m.group(2))) if m else (-1, -1)
+            res.diagnosticos.append(Diagnostico('SYN000', str(e), linha, coluna))
+
+        if semantica and programa is not None and not eh.has_errors():
+            try:
+                if dir_semantico is not None:
+                    analisar_incremental(programa, fonte, arquivo, eh, dir_semantico, jobs_semantica)
+                elif jobs_semantica > 1:
+                    analisar_paralelo(programa, eh, jobs_semantica)
+                else:
+                    SemanticAnalyzer(eh).analyze(programa)
+            except Exception as e:
+                # construções que o analisador ainda não cobre
+                res.diagnosticos.append(Diagnostico('SEM000', f"{type(e).__name__}: {e}", -1, -1))
+
+    res.diagnosticos[:0] = [Diagnostico(e.code, e.message, e.line, e.col) for e in eh.errors]
+    return res
+
+
+def _processar_fragmento(arquivos: List[str], modo: str, com_tokens: bool, max_erros: Optional[int],
+                         semantica: bool = False, dir_semantico: Optional[str] = None,
+                         jobs_semantica: int = 1) -> List[ResultadoArquivo]:
+    return [processar_arquivo(a, modo, com_tokens, max_erros, semantica, dir_semantico, jobs_semantica)
+            for a in arquivos]
+
+
+def executar_lote(caminhos: Iterable[str], modo: str = 'check', jobs: Optional[int] = None,
+                  com_tokens: bool = False, max_erros: Optional[int] = None, semantica: bool = False,
+                  dir_semantico: Optional[str] = None) -> List[ResultadoArquivo]:
+    """
+    Processa todos os arquivos .cd de `caminhos` e retorna um resultado por
+    arquivo, na ordem de `coletar_arquivos`. `jobs=1` roda no próprio processo.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: {modo!r} (esperado um de {MODOS})")
+    arquivos = coletar_arquivos(caminhos)
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1 or len(arquivos) <= 1:
+        # um arquivo só: o paralelismo, se houver, fica para a análise semântica dele
+        resultados = _processar_fragmento(arquivos, modo, com_tokens, max_erros, semantica, dir_semantico,
+                                          jobs if len(arquivos) == 1 else 1)
+    else:
+        fragmentos = fragmentar_por_tamanho(arquivos, jobs)
+        resultados = []
+        with ProcessPoolExecutor(max_workers=len(fragmentos)) as pool:
+            futuros = [pool.submit(_processar_fragmento, frag, modo, com_tokens, max_erros, semantica, dir_semantico)
+                       for frag in fragmentos]
+            for futuro in futuros:
+                resultados.extend(futuro.result())
+
+    ordem = {a: i for i, a in enumerate(arquivos)}
+    resultados.sort(key=lambda r: ordem[r.arquivo])
+    return resultados
@@ -1,3 +1,5 @@
 from . import ast
 from .ast.ast_base import Parser
+from .ast.expressao_pratt import ParserPratt
+from .ast.parser_iterativo import ParserIterativo
 # from .descendente import ParserLL1
\ No newline at end of file
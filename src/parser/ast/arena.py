@@ -0,0 +1,188 @@
+"""
+AST achatada em arena (struct-of-arrays).
+
+Os nós ficam em pré-ordem, um índice por nó, em colunas paralelas de `array`:
+tipo do nó (código pequeno), pai, fim da subárvore (exclusivo), índice da
+forma e a posição no fonte. Os filhos de `i` começam em `i + 1` e cada irmão
+seguinte está no `fim` do anterior, então a subárvore de `i` é o intervalo
+`[i, fim[i])` e percorrer a árvore inteira é um laço sobre `range(len(arena))`.
+
+A "forma" de um nó guarda os campos que não são nós (operador, nome,
+valor do literal, tipos...) com cada filho trocado por `FILHO`; formas iguais
+(ex.: toda soma `a + b`) são compartilhadas em `constantes`.
+
+`Arena.do_programa` e `Arena.para_programa` convertem de/para a árvore de
+`ast_base` sem recursão; `percorrer` entrega eventos de entrada/saída em ordem
+linear para passes que precisam de escopo. O único passe sobre a arena no
+pipeline é `src.codegen.otimizador.dobrar_constantes`, chamado por
+`compile_cd(otimizar=True)` (`codon ... -O`). A análise semântica continua
+percorrendo a árvore: portá-la para `percorrer` ficou fora do escopo.
+"""
+from array import array
+from dataclasses import fields
+from typing import Iterator, List, Tuple
+
+from src.parser.ast import ast_base
+from src.parser.ast.ast_base import ASTNode, Literal, Programa
+
+# Classes de nó na ordem em que aparecem em ast_base; o código é o índice.
+CLASSES_NO: List[type] = [
+    c for c in vars(ast_base).values()
+    if isinstance(c, type) and issubclass(c, ASTNode) and c is not ASTNode
+]
+CODIGO_NO = {c: i for i, c in enumerate(CLASSES_NO)}
+CODIGO_LITERAL = CODIGO_NO[Literal]
+_CAMPOS = {c: tuple(f.name for f in fields(c) if not f.kw_only) for c in CLASSES_NO}
+
+ENTRADA = 0
+SAIDA = 1
+
+
+class _Marcador:
+    __slots__ = ('nome',)
+
+    def __init__(self, nome: str):
+        self.nome = nome
+
+    def __repr__(self):
+        return self.nome
+
+
+FILHO = _Marcador('<filho>')
+_LISTA = _Marcador('<lista>')  # primeiro elemento de uma lista codificada como tupla
+
+
+def _codificar(valor, filhos: list):
+    """Troca os nós de `valor` por FILHO (guardando-os em `filhos`) e listas por tuplas marcadas."""
+    if isinstance(valor, ASTNode):
+        filhos.append(valor)
+        return FILHO
+    if isinstance(valor, list):
+        return (_LISTA,) + tuple(_codificar(v, filhos) for v in valor)
+    if isinstance(valor, tuple):
+        return tuple(_codificar(v, filhos) for v in valor)
+    return valor
+
+
+def _decodificar(forma, filhos: Iterator):
+    if forma is FILHO:
+        return next(filhos)
+    if isinstance(forma, tuple):
+        if forma and forma[0] is _LISTA:
+            return [_decodificar(v, filhos) for v in forma[1:]]
+        return tuple(_decodificar(v, filhos) for v in forma)
+    return forma
+
+
+class Arena:
+    def __init__(self):
+        self.tipos = array('B')
+        self.pais = array('i')
+        self.fim = array('i')
+        self.formas = array('i')
+        self.linhas = array('i')
+        self.colunas = array('i')
+        self.inicios = array('i')
+        self.fins = array('i')
+        self.constantes: list = []
+        self._indice_constantes = {}
+
+    # ---------- construção ----------
+
+    def _forma(self, forma) -> int:
+        # repr distingue 1, 1.0 e True, que colidiriam como chaves de dicionário
+        chave = repr(forma)
+        indice = self._indice_constantes.get(chave)
+        if indice is None:
+            indice = self._indice_constantes[chave] = len(self.constantes)
+            self.constantes.append(forma)
+        return indice
+
+    def adicionar(self, codigo: int, pai: int, forma, line: int = -1, col: int = -1,
+                  span_start: int = -1, span_end: int = -1) -> int:
+        """Acrescenta um nó (em pré-ordem). O `fim` é fixado por `fechar` depois dos filhos."""
+        i = len(self.tipos)
+        self.tipos.append(codigo)
+        self.pais.append(pai)
+        self.fim.append(i + 1)
+        self.formas.append(self._forma(forma))
+        self.linhas.append(line)
+        self.colunas.append(col)
+        self.inicios.append(span_start)
+        self.fins.append(span_end)
+        return i
+
+    def fechar(self, i: int):
+        self.fim[i] = len(self.tipos)
+
+    @classmethod
+    def do_programa(cls, programa: Programa) -> 'Arena':
+        arena = cls()
+        # (nó, pai) para abrir; (None, i) fecha a subárvore de i
+        pilha = [(programa, -1)]
+        while pilha:
+            node, pai = pilha.pop()
+            if node is None:
+                arena.fechar(pai)
+                continue
+            filhos = []
+            forma = tuple(_codificar(getattr(node, nome), filhos) for nome in _CAMPOS[type(node)])
+            i = arena.adicionar(CODIGO_NO[type(node)], pai, forma,
+                                node.line, node.col, node.span_start, node.span_end)
+            pilha.append((None, i))
+            pilha.extend((f, i) for f in reversed(filhos))
+        return arena
+
+    def para_programa(self) -> Programa:
+        """Reconstrói a árvore de baixo para cima (filhos têm índice maior que o pai)."""
+        n = len(self.tipos)
+        nos: List[ASTNode] = [None] * n
+        for i in range(n - 1, -1, -1):
+            cls = CLASSES_NO[self.tipos[i]]
+            filhos = iter([nos[j] for j in self.filhos(i)])
+            node = cls(*_decodificar(self.constantes[self.formas[i]], filhos))
+            node.line = self.linhas[i]
+            node.col = self.colunas[i]
+            node.span_start = self.inicios[i]
+            node.span_end = self.fins[i]
+            nos[i] = node
+        return nos[0] if n else None
+
+    # ---------- consulta ----------
+
+    def __len__(self) -> int:
+        return len(self.tipos)
+
+    def classe(self, i: int) -> type:
+        return CLASSES_NO[self.tipos[i]]
+
+    def forma(self, i: int) -> tuple:
+        return self.constantes[self.formas[i]]
+
+    def campo(self, i: int, nome: str):
+        """Valor de um campo que não é nó (ex.: `operador`, `nome`, `valor`)."""
+        valor = self.forma(i)[_CAMPOS[CLASSES_NO[self.tipos[i]]].index(nome)]
+        return _decodificar(valor, iter(()))
+
+    def filhos(self, i: int) -> Iterator[int]:
+        """Índices dos filhos diretos de `i`, na ordem dos campos."""
+        fim = self.fim
+        j, limite = i + 1, fim[i]
+        while j < limite:
+            yield j
+            j = fim[j]
+
+    def percorrer(self, inicio: int = 0) -> Iterator[Tuple[int, int]]:
+        """
+        Eventos `(ENTRADA, i)` em pré-ordem e `(SAIDA, i)` quando a subárvore
+        de `i` termina, sobre a subárvore de `inicio`, sem recursão.
+        """
+        fim = self.fim
+        abertos: List[int] = []
+        for i in range(inicio, fim[inicio] if len(self.tipos) else 0):
+            while abertos and fim[abertos[-1]] <= i:
+                yield SAIDA, abertos.pop()
+            yield ENTRADA, i
+            abertos.append(i)
+        while abertos:
+            yield SAIDA, abertos.pop()
@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import builtins
+import functools
+import re
 from typing import Optional, List, Tuple, Union
 import sys
 
-from src.utils.erros import ErrorHandler, LexicalError, SyntaxError
+from src.utils.erros import BaseError, ErrorHandler, LexicalError, SyntaxError
 
 # Importa as classes do Lexer
 try:
@@ -15,16 +18,36 @@ except ImportError:
 # ==========================================
 # 1. Definição dos Nós da AST
 # ==========================================
-class ASTNode:
-    # Adicionando metadados de linha/coluna para o analisador semântico
-    line: int = -1
-    col: int = -1
+# Nós com __slots__ (sem __dict__ por instância). Posição e span ficam fora
+# da comparação e do repr: duas árvores iguais continuam iguais mesmo vindas
+# de fontes formatados de jeitos diferentes.
+def _posicao():
+    return field(default=-1, kw_only=True, compare=False, repr=False)
+
+
+# Anotações da análise semântica: o tipo resolvido de cada expressão e o
+# símbolo a que um nome se refere. O parser deixa None; o `SemanticAnalyzer`
+# preenche e o gerador de código consome.
+def _anotacao():
+    return field(default=None, kw_only=True, compare=False, repr=False)
+
 
-@dataclass
+@dataclass(slots=True)
+class ASTNode:
+    # Linha/coluna do primeiro token (para o analisador semântico) e o
+    # intervalo [span_start, span_end) do nó no fonte, em offsets de caractere
+    line: int = _posicao()
+    col: int = _posicao()
+    span_start: int = _posicao()
+    span_end: int = _posicao()
+    tipo_resolvido: Optional[str] = _anotacao()
+    simbolo: Optional[object] = _anotacao()
+
+@dataclass(slots=True)
 class Programa(ASTNode):
     declaracoes: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class DeclaracaoFuncao(ASTNode):
     nome: str
     parametros: list
@@ -33,14 +56,14 @@ class DeclaracaoFuncao(ASTNode):
     tipo_retorno: str | None = None
     type_params: List[str] = None  # Parâmetros de tipo genérico (ex: ['T', 'U'])
 
-@dataclass
+@dataclass(slots=True)
 class DeclaracaoClasse(ASTNode):
     nome: str
     campos: List[Tuple[str, str]]
     metodos: List[ASTNode] = None
     type_params: List[str] = None  # Parâmetros de tipo genérico (ex: ['T'])
 
-@dataclass
+@dataclass(slots=True)
 class DeclaracaoMetodo(ASTNode):
     classe: str
     nome: str
@@ -50,138 +73,146 @@ class DeclaracaoMetodo(ASTNode):
     tipo_retorno: str | None = None
     type_params: List[str] = None  # Parâmetros de tipo genérico
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoIf(ASTNode):
     condicao: ASTNode
     bloco_if: List[ASTNode]
     elif_blocos: List[Tuple[ASTNode, List[ASTNode]]]
     bloco_else: Optional[List[ASTNode]]
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoLoopFor(ASTNode):
     inicializacao: ASTNode
     condicao: ASTNode
     passo: ASTNode
     corpo: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoLoopForEach(ASTNode):
     iter_var: str
     iterable: ASTNode
     corpo: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoLoopWhile(ASTNode):
     condicao: ASTNode
     corpo: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoLoopInfinito(ASTNode):
     corpo: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoAtribuicao(ASTNode):
     alvo: ASTNode
     operador: str
     valor: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class ExpressaoBinaria(ASTNode):
     esquerda: ASTNode
     operador: str
     direita: ASTNode
-    line: int
-    col: int
 
-@dataclass
+@dataclass(slots=True)
 class ExpressaoUnaria(ASTNode):
     operador: str
     direita: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class Literal(ASTNode):
     valor: Union[str, float, int, bool, None] # Adicionado bool e None (null)
 
-@dataclass
+@dataclass(slots=True)
 class Numero(Literal):
     pass
 
-@dataclass
+@dataclass(slots=True)
+class LiteralBio(Literal):
+    # 'dna', 'rna' ou 'prot'; tamanho e alfabeto vêm do token, já verificados no lexer
+    tipo: str
+    tamanho: int
+    alfabeto_valido: bool
+
+# Tipo do literal biológico por tipo de token
+TIPOS_LITERAL_BIO = {'DNA_LIT': 'dna', 'RNA_LIT': 'rna', 'PROT_LIT': 'prot'}
+
+@dataclass(slots=True)
 class LiteralRange(ASTNode):
     inicio: ASTNode
     fim: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class Variavel(ASTNode):
     nome: str
 
-@dataclass
+@dataclass(slots=True)
 class DeclaracaoVariavel(ASTNode):
     nome: str
     tipo: str
 
-@dataclass
+@dataclass(slots=True)
 class ChamadaFuncao(ASTNode):
     nome: Union[str, ASTNode]
     argumentos: List[ASTNode]
     type_args: List[str] = None  # Argumentos de tipo para funções genéricas (ex: ['int'] em func<int>(x))
 
-@dataclass
+@dataclass(slots=True)
 class AcessoCampo(ASTNode):
     alvo: ASTNode
     campo: str
 
-@dataclass
+@dataclass(slots=True)
 class AcessoArray(ASTNode):
     alvo: ASTNode
     indice: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoRetorno(ASTNode):
     expressao: Optional[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoBreak(ASTNode):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoContinue(ASTNode):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class InstrucaoImpressao(ASTNode):
     expressoes: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class CriacaoArray(ASTNode):
     tipo: str
     tamanho: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class CriacaoArray2D(ASTNode):
     tipo: str
     linhas: ASTNode
     colunas: ASTNode
-@dataclass
+@dataclass(slots=True)
 class LiteralArray(ASTNode):
     elementos: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class CriacaoClasse(ASTNode):
     classe: str
     argumentos: List[ASTNode]
     type_args: List[str] = None  # Argumentos de tipo para classes genéricas (ex: ['int'] em Container<int>)
 
-@dataclass
+@dataclass(slots=True)
 class LiteralTuple(ASTNode):
     elementos: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class DeclaracaoEnum(ASTNode):
     nome: str
     membros: List[Tuple[str, int]]
 
-@dataclass
+@dataclass(slots=True)
 class CriacaoMapa(ASTNode):
     tipo_chave: str
     tipo_valor: str
@@ -191,38 +222,162 @@ class CriacaoMapa(ASTNode):
 # ==========================================
 # 2. Parser
 # ==========================================
+# Recuperação em modo pânico: palavras-chave em que cada contexto volta a
+# analisar depois de um erro. Além delas, `;` encerra o trecho descartado e
+# o `}` que fecha o bloco corrente nunca é consumido.
+SINCRONIA_DECLARACAO = frozenset(('function', 'procedure', 'void', 'class', 'struct', 'enum'))
+SINCRONIA_INSTRUCAO = SINCRONIA_DECLARACAO | frozenset((
+    'if', 'for', 'while', 'loop', 'return', 'break', 'continue', 'print', 'var', 'const',
+))
+# Fim de uma expressão: onde a recuperação de `_exp_primaria` para, sem consumir.
+SINCRONIA_EXPRESSAO = frozenset(('SEMI', 'COMMA', 'RPAREN', 'RBRACK', 'RBRACE'))
+
+# Erros de sintaxe reportados por parse antes de desistir do arquivo.
+LIMITE_ERROS_SINTATICOS = 50
+
+_ABRE = frozenset(('LBRACE', 'LPAREN', 'LBRACK'))
+_FECHA = frozenset(('RBRACE', 'RPAREN', 'RBRACK'))
+_POSICAO_MENSAGEM = re.compile(r' em Ln-?\d+ Col-?\d+$')
+
+
+def literal_bio(t) -> LiteralBio:
+    """`LiteralBio` do token `t`, com o tamanho e o alfabeto que o lexer já calculou."""
+    return LiteralBio(t.valor[-1 - t.tamanho:-1], TIPOS_LITERAL_BIO[t.tipo], t.tamanho, t.alfabeto_valido)
+
+
+def _com_span(regra):
+    """Marca o nó devolvido por `regra` com a posição do seu primeiro token até o último consumido."""
+    @functools.wraps(regra)
+    def envolvida(self, *args, **kwargs):
+        inicio = self.ts.peek()
+        return self._marcar(regra(self, *args, **kwargs), inicio)
+    return envolvida
+
+
 class Parser:
     def __init__(self, ts: TokenStream, error_handler=None):
         self.ts = ts
         self.error_handler = error_handler or ErrorHandler()
+        # modo pânico: erros seguintes são cascata até uma instrução/declaração completar
+        self.em_panico = False
+        self.erros_sintaticos = 0
+        self.erros_em_cascata = 0
 
     def parse(self) -> Programa:
-        # ... (Método parse, _skip_to_sync) ...
         declaracoes = []
-        while self.ts.peek():
-            t = self.ts.peek()
-            # print(f"[DEBUG parse] peek={t.tipo if t else None}, valor={t.valor if t else None}")
+        while self.ts.peek() and not self._deve_parar():
+            antes = self.ts.anterior
             try:
                 decl = self._declaracao()
                 if decl:
                     declaracoes.append(decl)
-            except (LexicalError, SyntaxError) as e:
-                self.error_handler.report_error(e)
-                self.ts.next()
-        # print(f"[DEBUG parse] Total de declarações: {len(declaracoes)}")
+                self.em_panico = False
+            except (LexicalError, SyntaxError, builtins.SyntaxError) as e:
+                self._reportar(e)
+                self._sincronizar(SINCRONIA_DECLARACAO, dentro_de_bloco=False,
+                                  progresso=self.ts.anterior is not antes)
         return Programa(declaracoes)
 
+    def _deve_parar(self) -> bool:
+        return self.erros_sintaticos >= LIMITE_ERROS_SINTATICOS or self.error_handler.limit_reached()
+
+    def _reportar(self, e: Exception):
+        """Reporta o erro, a menos que seja cascata de um erro ainda não recuperado."""
+        if self.em_panico or self._deve_parar():
+            self.erros_em_cascata += 1
+            return
+        self.em_panico = True
+        self.erros_sintaticos += 1
+        self.error_handler.report_error(self._como_erro(e))
+
+    def _como_erro(self, e: Exception) -> BaseError:
+        # `expect` levanta o SyntaxError nativo; a posição é a do token recusado, que continua no fluxo
+        if isinstance(e, BaseError):
+            return e
+        t = self.ts.peek()
+        mensagem = _POSICAO_MENSAGEM.sub('', str(e))
+        return SyntaxError(mensagem, t.linha, t.coluna) if t else SyntaxError(mensagem, -1, -1)
+
+    def _marcar(self, node, inicio):
+        # nós já marcados por uma regra interna (ex.: a expressão entre parênteses) ficam como estão
+        if inicio is not None and isinstance(node, ASTNode) and node.span_start < 0:
+            fim = self.ts.anterior
+            node.line = inicio.linha
+            node.col = inicio.coluna
+            node.span_start = inicio.start_pos
+            node.span_end = fim.end_pos if fim is not None else inicio.end_pos
+        return node
+
+    @staticmethod
+    def _folha(node: ASTNode, t) -> ASTNode:
+        """Posição de um nó que corresponde a um único token."""
+        node.line = t.linha
+        node.col = t.coluna
+        node.span_start = t.start_pos
+        node.span_end = t.end_pos
+        return node
+
+    def _estender(self, node: ASTNode, origem: ASTNode) -> ASTNode:
+        """Span de `node` = do início de `origem` (operando da esquerda) até o último token consumido."""
+        if isinstance(origem, ASTNode) and origem.span_start >= 0:
+            fim = self.ts.anterior
+            node.line = origem.line
+            node.col = origem.col
+            node.span_start = origem.span_start
+            node.span_end = fim.end_pos if fim is not None else origem.span_end
+        return node
+
+    def _sincronizar(self, palavras: frozenset, dentro_de_bloco: bool, progresso: bool):
+        """
+        Modo pânico: descarta tokens até um ponto seguro do contexto, em tempo
+        linear. Para antes de uma palavra-chave de `palavras` ou do `}` que fecha
+        o bloco corrente; para depois de um `;` ou de um bloco `{...}` inteiro,
+        contando o aninhamento de chaves, parênteses e colchetes. Sem
+        `progresso` (a regra que falhou não consumiu nada) ao menos um token é
+        descartado, para a análise nunca repetir o mesmo erro no mesmo lugar.
+        """
+        profundidade = 0
+        while True:
+            t = self.ts.peek()
+            if t is None:
+                return
+            tipo = t.tipo
+            if profundidade == 0 and progresso:
+                if tipo == 'KWD' and t.valor in palavras:
+                    return
+                if tipo == 'RBRACE' and dentro_de_bloco:
+                    return
+            self.ts.next()
+            progresso = True
+            if tipo in _ABRE:
+                profundidade += 1
+            elif tipo in _FECHA:
+                if profundidade > 0:
+                    profundidade -= 1
+                    if profundidade == 0 and tipo == 'RBRACE':
+                        return
+            elif tipo == 'SEMI' and profundidade == 0:
+                return
+
     def _skip_to_sync(self):
+        """Recuperação dentro de uma expressão: pula até o fim dela, sem consumir o delimitador."""
+        profundidade = 0
         while True:
             t = self.ts.peek()
-            if t is None or t.tipo in ("SEMI", "RBRACE"):
-                self.ts.next() if t else None
-                break
+            if t is None:
+                return
+            if profundidade == 0 and t.tipo in SINCRONIA_EXPRESSAO:
+                return
+            if t.tipo in _ABRE:
+                profundidade += 1
+            elif t.tipo in _FECHA:
+                profundidade -= 1
             self.ts.next()
 
     # ==========================================
     # --- Declarações e Instruções ---
     # ==========================================
+    @_com_span
     def _declaracao(self) -> ASTNode:
         t = self.ts.peek()
         if t and t.tipo == 'KWD':
@@ -237,6 +392,7 @@ class Parser:
                 return self._decl_enum()
         return self._instrucao()
 
+    @_com_span
     def _decl_funcao(self, is_procedure: bool) -> DeclaracaoFuncao:
         self.ts.expect("KWD")
         nome_token = self.ts.expect("ID")
@@ -297,7 +453,7 @@ class Parser:
             if peek and peek.tipo == 'KWD' and peek.valor in ('function','procedure','void'):
                 # Parse método reutilizando _decl_funcao
                 func_decl = self._decl_funcao(is_procedure=(peek.valor in ('procedure','void')))
-                metodos.append(DeclaracaoMetodo(nome_token.valor, func_decl.nome, func_decl.parametros, func_decl.corpo, func_decl.is_procedure, func_decl.tipo_retorno, func_decl.type_params))
+                metodos.append(self._estender(DeclaracaoMetodo(nome_token.valor, func_decl.nome, func_decl.parametros, func_decl.corpo, func_decl.is_procedure, func_decl.tipo_retorno, func_decl.type_params), func_decl))
             else:
                 campos.append(self._decl_campo())
         return DeclaracaoClasse(nome_token.valor, campos, metodos, type_params)
@@ -334,7 +490,7 @@ class Parser:
         if tipo_token and (tipo_token.tipo == 'KWD' or tipo_token.tipo == 'ID'):
             self.ts.next()
             return tipo_token
-        self.error_handler.report_error(
+        self._reportar(
             SyntaxError(f"Esperado tipo, mas encontrou {tipo_token.valor if tipo_token else 'EOF'}",
                         tipo_token.linha if tipo_token else -1,
                         tipo_token.coluna if tipo_token else -1)
@@ -357,12 +513,27 @@ class Parser:
         self.ts.expect("LBRACE")
         instrucoes = []
         while not self.ts.match("RBRACE"):
-            instrucoes.append(self._instrucao())
+            t = self.ts.peek()
+            if t is None or self._deve_parar():
+                raise builtins.SyntaxError("Esperado token RBRACE, mas chegou EOF")
+            if t.tipo == 'KWD' and t.valor in SINCRONIA_DECLARACAO:
+                # `}` esquecido: a próxima declaração de topo encerra o bloco
+                self._reportar(SyntaxError(f"Esperado token RBRACE, mas chegou {t.valor}", t.linha, t.coluna))
+                break
+            antes = self.ts.anterior
+            try:
+                instrucoes.append(self._instrucao())
+                self.em_panico = False
+            except (LexicalError, SyntaxError, builtins.SyntaxError) as e:
+                self._reportar(e)
+                self._sincronizar(SINCRONIA_INSTRUCAO, dentro_de_bloco=True,
+                                  progresso=self.ts.anterior is not antes)
         return instrucoes
 
     # ==========================================
     # --- Instruções ---
     # ==========================================
+    @_com_span
     def _instrucao(self) -> ASTNode:
         t = self.ts.peek()
         if t and t.tipo == 'KWD':
@@ -392,6 +563,7 @@ class Parser:
         # Chamada de função ou atribuição
         return self._instrucao_atribuicao_ou_chamada()
 
+    @_com_span
     def _decl_var_const(self) -> Optional[ASTNode]:
         kw = self.ts.expect("KWD")  # 'var' ou 'const'
         var_name_token = None
@@ -433,6 +605,7 @@ class Parser:
             self.ts.expect("SEMI")
             return DeclaracaoVariavel(var_name_token.valor, None)
 
+    @_com_span
     def _instrucao_atribuicao_ou_chamada(self) -> ASTNode:
         # Usa _exp_primaria_ou_acesso para capturar ID, ID(), ID.campo, ID[indice]
         alvo = self._exp_primaria_ou_acesso()
@@ -546,6 +719,7 @@ class Parser:
         corpo = self._bloco()
         return InstrucaoLoopFor(inicializacao, condicao, passo, corpo)
 
+    @_com_span
     def _atribuicao_ou_chamada_sem_semi(self) -> ASTNode:
         alvo = self._exp_primaria_ou_acesso()
         atrib_op = self.ts.match("ASSIGN", "ARROW_LEFT", "PLUS_EQ", "MINUS_EQ", "STAR_EQ", "SLASH_EQ", "PERC_EQ")
@@ -599,55 +773,18 @@ class Parser:
             #   - node é Variavel (nome de função)
             #   - próximos tokens se parecem com tipo, vírgula, tipo, ..., GT, LPAREN
             type_args = None
-            if tok.tipo == "LT" and isinstance(node, Variavel):
-                # Olha adiante sem consumir
-                # Heurística: se vemos ID/KWD (tipo), então COMMA ou GT, e eventualmente GT seguido de LPAREN, é tipo genérico
-                lookahead_idx = 2  # peek(2) é token após '<'
-                temp_types_found = []
-                looks_like_generic = False
-                
-                # Tenta detectar padrão: < tipo [, tipo]* > (
-                next_tok = self.ts.peek(lookahead_idx)
-                if next_tok and next_tok.tipo in ("KWD", "ID"):
-                    # Possível tipo
-                    temp_types_found.append(True)
-                    lookahead_idx += 1
-                    # Continue olhando por COMMA ou GT
-                    while True:
-                        la_tok = self.ts.peek(lookahead_idx)
-                        if not la_tok:
-                            break
-                        if la_tok.tipo == "COMMA":
-                            # Deve ter outro tipo
-                            lookahead_idx += 1
-                            type_tok = self.ts.peek(lookahead_idx)
-                            if type_tok and type_tok.tipo in ("KWD", "ID"):
-                                temp_types_found.append(True)
-                                lookahead_idx += 1
-                            else:
-                                break
-                        elif la_tok.tipo == "GT":
-                            # Fim dos tipos, verifica se tem '(' depois
-                            lookahead_idx += 1
-                            paren_tok = self.ts.peek(lookahead_idx)
-                            if paren_tok and paren_tok.tipo == "LPAREN":
-                                looks_like_generic = True
-                            break
-                        else:
-                            break
-                
-                if looks_like_generic:
-                    # Agora consome de verdade
-                    self.ts.next()  # consume '<'
-                    type_args = []
-                    while True:
-                        tipo_arg = self._tipo().valor
-                        type_args.append(tipo_arg)
-                        if not self.ts.match("COMMA"):
-                            break
-                    self.ts.expect("GT")  # '>'
-                    tok = self.ts.peek()  # atualiza tok para LPAREN
-            
+            if tok.tipo == "LT" and isinstance(node, Variavel) and self._parece_chamada_generica():
+                # Agora consome de verdade
+                self.ts.next()  # consume '<'
+                type_args = []
+                while True:
+                    tipo_arg = self._tipo().valor
+                    type_args.append(tipo_arg)
+                    if not self.ts.match("COMMA"):
+                        break
+                self.ts.expect("GT")  # '>'
+                tok = self.ts.peek()  # atualiza tok para LPAREN
+
             if tok and tok.tipo == "LPAREN":
                 self.ts.next()  # consume '('
 
@@ -668,20 +805,20 @@ class Parser:
                 #
                 # Não fazemos caso especial para Variavel.
                 # `node` vira o callee real.
-                node = ChamadaFuncao(node, argumentos, type_args)
+                node = self._estender(ChamadaFuncao(node, argumentos, type_args), node)
                 continue
 
             if tok and tok.tipo == "DOT":
                 self.ts.next()  # consume '.'
                 campo = self.ts.expect("ID")
-                node = AcessoCampo(node, campo.valor)
+                node = self._estender(AcessoCampo(node, campo.valor), node)
                 continue
 
             if tok and tok.tipo == "LBRACK":
                 self.ts.next()  # consume '['
                 indice = self._expressao()
                 self.ts.expect("RBRACK")
-                node = AcessoArray(node, indice)
+                node = self._estender(AcessoArray(node, indice), node)
                 continue
 
             # Nenhum operador pós-fixado adicional
@@ -689,10 +826,49 @@ class Parser:
 
         return node
 
+    def _parece_chamada_generica(self) -> bool:
+        """Com '<' em peek(1), verifica se o que segue é `< tipo [, tipo]* > (`."""
+        # Olha adiante sem consumir
+        # Heurística: se vemos ID/KWD (tipo), então COMMA ou GT, e eventualmente GT seguido de LPAREN, é tipo genérico
+        lookahead_idx = 2  # peek(2) é token após '<'
+        temp_types_found = []
+        looks_like_generic = False
+
+        # Tenta detectar padrão: < tipo [, tipo]* > (
+        next_tok = self.ts.peek(lookahead_idx)
+        if next_tok and next_tok.tipo in ("KWD", "ID"):
+            # Possível tipo
+            temp_types_found.append(True)
+            lookahead_idx += 1
+            # Continue olhando por COMMA ou GT
+            while True:
+                la_tok = self.ts.peek(lookahead_idx)
+                if not la_tok:
+                    break
+                if la_tok.tipo == "COMMA":
+                    # Deve ter outro tipo
+                    lookahead_idx += 1
+                    type_tok = self.ts.peek(lookahead_idx)
+                    if type_tok and type_tok.tipo in ("KWD", "ID"):
+                        temp_types_found.append(True)
+                        lookahead_idx += 1
+                    else:
+                        break
+                elif la_tok.tipo == "GT":
+                    # Fim dos tipos, verifica se tem '(' depois
+                    lookahead_idx += 1
+                    paren_tok = self.ts.peek(lookahead_idx)
+                    if paren_tok and paren_tok.tipo == "LPAREN":
+                        looks_like_generic = True
+                    break
+                else:
+                    break
+        return looks_like_generic
+
     def _exp_primaria(self):
         t = self.ts.peek()
         if not t:
-            self.error_handler.report_error(SyntaxError("Esperado expressão, mas EOF", -1, -1))
+            self._reportar(SyntaxError("Esperado expressão, mas EOF", -1, -1))
             return Literal(None)
 
         try:
@@ -705,20 +881,18 @@ class Parser:
                     while self.ts.match('COMMA'):
                         elementos.append(self._expressao())
                     self.ts.expect('RBRACK')
-                return LiteralArray(elementos)
+                return self._marcar(LiteralArray(elementos), t)
 
             # Literais Simples
             if t.tipo in ("DEC_INT","FLOAT","STRING","CHAR_LIT","DNA_LIT","RNA_LIT","PROT_LIT"):
                 self.ts.next()
-                if t.tipo=="DEC_INT": return Literal(int(t.valor))
-                if t.tipo=="FLOAT": return Literal(float(t.valor))
-                if t.tipo=="CHAR_LIT": return Literal(t.valor[1:-1])
-                if t.tipo=="STRING": return Literal(t.valor.strip('"'))
+                if t.tipo=="DEC_INT": return self._folha(Literal(int(t.valor)), t)
+                if t.tipo=="FLOAT": return self._folha(Literal(float(t.valor)), t)
+                if t.tipo=="CHAR_LIT": return self._folha(Literal(t.valor[1:-1]), t)
+                if t.tipo=="STRING": return self._folha(Literal(t.valor.strip('"')), t)
                 # Lógicas para tipos biológicos
                 if t.tipo in ("DNA_LIT","RNA_LIT","PROT_LIT"):
-                    # Extrai o valor do literal entre aspas
-                    valor = t.valor.split('"',1)[1].rsplit('"',1)[0]
-                    return Literal(valor)
+                    return self._folha(literal_bio(t), t)
 
             # Expressão Agrupada
             elif t.tipo=="LPAREN":
@@ -732,17 +906,17 @@ class Parser:
                 self.ts.expect("RPAREN")
                 if len(elementos) == 1:
                     return first
-                return LiteralTuple(elementos)
+                return self._marcar(LiteralTuple(elementos), t)
 
             # ID (Variável)
             elif t.tipo=="ID":
                 id_token = self.ts.next()
-                return Variavel(id_token.valor)
+                return self._folha(Variavel(id_token.valor), id_token)
 
             # Literais Keyword: true, false, null
             elif t.tipo=="KWD" and t.valor in ("true","false","null"):
                 self.ts.next()
-                return Literal(True) if t.valor == 'true' else Literal(False) if t.valor == 'false' else Literal(None)
+                return self._folha(Literal(True) if t.valor == 'true' else Literal(False) if t.valor == 'false' else Literal(None), t)
 
             # Nova Palavra-chave: 'new' para CriacaoClasse ou CriacaoArray
             elif t.tipo=="KWD" and t.valor == 'new':
@@ -764,7 +938,7 @@ class Parser:
                     self.ts.expect("LPAREN")
                     cap = self._expressao()
                     self.ts.expect("RPAREN")
-                    return CriacaoMapa(tk, tv, cap)
+                    return self._marcar(CriacaoMapa(tk, tv, cap), t)
 
                 # Suporte a argumentos de tipo para classes genéricas: new Container<int>(...)
                 type_args = None
@@ -786,7 +960,7 @@ class Parser:
                         if self.ts.peek() and self.ts.peek().tipo == "COMMA":
                             self.ts.next()
                     self.ts.expect("RPAREN")
-                    return CriacaoClasse(class_type, argumentos, type_args)
+                    return self._marcar(CriacaoClasse(class_type, argumentos, type_args), t)
 
                 elif self.ts.match("LBRACK"):
                     # Criação de Array: new T[m] ou new T[m][n]
@@ -796,8 +970,8 @@ class Parser:
                     if self.ts.match("LBRACK"):
                         n = self._expressao()
                         self.ts.expect("RBRACK")
-                        return CriacaoArray2D(class_type, m, n)
-                    return CriacaoArray(class_type, m)
+                        return self._marcar(CriacaoArray2D(class_type, m, n), t)
+                    return self._marcar(CriacaoArray(class_type, m), t)
 
             # Range Expression: expr..expr (Usado em For-Each, mas tratado aqui como expressão)
             # NOTA: Range é um operador de baixa precedência, mas como literal é tratado aqui se for literal..literal
@@ -807,9 +981,9 @@ class Parser:
                 raise SyntaxError(f"Esperado expressão primária, mas chegou {t.valor}", t.linha, t.coluna)
 
         except SyntaxError as e:
-            self.error_handler.report_error(e)
+            self._reportar(e)
             self._skip_to_sync()
-            return Literal(None)
+            return self._marcar(Literal(None), t)
 
     # --- Operadores binários e unários ---
     def _expressao(self) -> ASTNode:
@@ -822,8 +996,8 @@ class Parser:
             direita = self._exp_range() # Associação da direita
             # Se for uma expressão de range, retorna LiteralRange para análise semântica mais fácil
             if isinstance(node, (Literal, Variavel)) and isinstance(direita, (Literal, Variavel)):
-                return LiteralRange(node, direita)
-            return ExpressaoBinaria(node, "..", direita)
+                return self._estender(LiteralRange(node, direita), node)
+            return self._estender(ExpressaoBinaria(node, "..", direita), node)
         return node
 
     def _exp_logica_or(self):
@@ -833,7 +1007,7 @@ class Parser:
             if not op:
                 break
             direita = self._exp_logica_and()
-            node = ExpressaoBinaria(node, op.valor, direita)
+            node = self._estender(ExpressaoBinaria(node, op.valor, direita), node)
         return node
 
     def _exp_logica_and(self):
@@ -843,7 +1017,7 @@ class Parser:
             if not op:
                 break
             direita = self._exp_relacional()
-            node = ExpressaoBinaria(node, op.valor, direita)
+            node = self._estender(ExpressaoBinaria(node, op.valor, direita), node)
         return node
 
     def _exp_relacional(self):
@@ -852,7 +1026,7 @@ class Parser:
             op = self.ts.match("EQ","NE","LT","GT","LE","GE")
             if not op: break
             direita = self._exp_bitshift()
-            node = ExpressaoBinaria(node,op.valor,direita)
+            node = self._estender(ExpressaoBinaria(node,op.valor,direita), node)
         return node
 
     def _exp_bitshift(self):
@@ -861,7 +1035,7 @@ class Parser:
             op = self.ts.match("SHL","SHR")
             if not op: break
             direita = self._exp_aditiva()
-            node = ExpressaoBinaria(node,op.valor,direita)
+            node = self._estender(ExpressaoBinaria(node,op.valor,direita), node)
         return node
 
     def _exp_aditiva(self):
@@ -870,7 +1044,7 @@ class Parser:
             op = self.ts.match("PLUS","MINUS","BAR","CARET")
             if not op: break
             direita = self._exp_multiplicativa()
-            node = ExpressaoBinaria(node,op.valor,direita)
+            node = self._estender(ExpressaoBinaria(node,op.valor,direita), node)
         return node
 
     def _exp_multiplicativa(self):
@@ -879,7 +1053,7 @@ class Parser:
             op = self.ts.match("STAR","SLASH","PERCENT","AMP")
             if not op: break
             direita = self._exp_potencia()
-            node = ExpressaoBinaria(node,op.valor,direita)
+            node = self._estender(ExpressaoBinaria(node,op.valor,direita), node)
         return node
 
     def _exp_potencia(self):
@@ -887,14 +1061,14 @@ class Parser:
         op = self.ts.match("POW")
         if op:
             direita = self._exp_potencia()
-            return ExpressaoBinaria(node, "**", direita)
+            return self._estender(ExpressaoBinaria(node, "**", direita), node)
         return node
 
     def _exp_unaria(self):
         op = self.ts.match("PLUS","MINUS","BANG","TILDE")
         if op:
             direita = self._exp_unaria()
-            return ExpressaoUnaria(op.valor,direita)
+            return self._marcar(ExpressaoUnaria(op.valor,direita), op)
         # Expressão primária com pós-fixos (++, --, chamadas, acesso)
         node = self._exp_primaria_ou_acesso()
         
@@ -902,6 +1076,6 @@ class Parser:
         post_op = self.ts.match("PLUS_PLUS", "MINUS_MINUS")
         if post_op:
             # Retorna ExpressaoUnaria com flag de pós-fixo
-            return ExpressaoUnaria(post_op.valor, node)
+            return self._estender(ExpressaoUnaria(post_op.valor, node), node)
         
         return node
@@ -0,0 +1,56 @@
+from src.parser.ast.ast_base import (
+    ASTNode, ExpressaoBinaria, Literal, LiteralRange, Parser, Variavel,
+)
+
+# Precedência dos operadores binários (maior = liga mais forte), na mesma
+# ordem da cadeia _exp_logica_or -> ... -> _exp_potencia do Parser.
+PRECEDENCIA_BINARIA = {
+    'OR_OR': 1,
+    'AND_AND': 2,
+    'EQ': 3, 'NE': 3, 'LT': 3, 'GT': 3, 'LE': 3, 'GE': 3,
+    'SHL': 4, 'SHR': 4,
+    'PLUS': 5, 'MINUS': 5, 'BAR': 5, 'CARET': 5,
+    'STAR': 6, 'SLASH': 6, 'PERCENT': 6, 'AMP': 6,
+    'POW': 7,
+}
+
+# Operadores associativos à direita
+ASSOCIATIVOS_DIREITA = {'POW'}
+
+
+class ParserPratt(Parser):
+    """
+    Parser cujas expressões binárias são analisadas por precedence climbing
+    (Pratt) a partir de PRECEDENCIA_BINARIA, em um único laço, em vez de
+    descer pelos nove níveis de `_exp_range` até `_exp_unaria` a cada folha.
+
+    Produz exatamente as mesmas árvores de `Parser`: o range `..` continua
+    tratado acima de tudo (associativo à direita) e os operandos continuam
+    vindo de `_exp_unaria`, que cuida dos prefixos e pós-fixos.
+    """
+
+    def _expressao(self) -> ASTNode:
+        node = self._exp_binaria(1)
+        if self.ts.match("DOT2"):
+            direita = self._expressao()
+            if isinstance(node, (Literal, Variavel)) and isinstance(direita, (Literal, Variavel)):
+                return self._estender(LiteralRange(node, direita), node)
+            return self._estender(ExpressaoBinaria(node, "..", direita), node)
+        return node
+
+    def _exp_binaria(self, prec_minima: int) -> ASTNode:
+        ts = self.ts
+        node = self._exp_unaria()
+        while True:
+            op = ts.peek()
+            if op is None:
+                return node
+            prec = PRECEDENCIA_BINARIA.get(op.tipo)
+            if prec is None or prec < prec_minima:
+                return node
+            ts.next()
+            if op.tipo in ASSOCIATIVOS_DIREITA:
+                direita = self._exp_binaria(prec)
+            else:
+                direita = self._exp_binaria(prec + 1)
+            node = self._estender(ExpressaoBinaria(node, op.valor, direita), node)
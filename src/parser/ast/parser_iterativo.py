@@ -0,0 +1,469 @@
+"""
+Parser sem recursão em Python para instruções e expressões.
+
+Cada regra que pode aninhar (expressões, `_bloco`, `_instrucao`, `if`, laços,
+atribuições...) é escrita como um gerador que, em vez de chamar a sub-regra,
+faz `yield` do gerador dela e recebe o nó resultante de volta. O laço de
+`_executar` mantém esses geradores em uma pilha explícita (uma lista), então a
+profundidade de aninhamento do fonte vira tamanho de lista, não de pilha de
+chamadas: `if` dentro de `if` ou parênteses dentro de parênteses a 10^4+ níveis
+não estouram o limite de recursão.
+
+Exceções descem pela pilha com `throw`, na mesma ordem em que subiriam pelas
+chamadas recursivas, então a recuperação de erros (`_exp_primaria` ->
+`_skip_to_sync`, `_g_bloco` -> `_sincronizar`) e as árvores produzidas são as mesmas de `ParserPratt`.
+Declarações de topo (função, classe, enum) continuam recursivas: elas não
+aninham e entram no modo iterativo em `_bloco`.
+"""
+import builtins
+from typing import Generator, List
+
+from src.parser.ast.ast_base import (
+    SINCRONIA_DECLARACAO, SINCRONIA_INSTRUCAO, ASTNode, AcessoArray, AcessoCampo, ChamadaFuncao, CriacaoArray, CriacaoArray2D,
+    CriacaoClasse, CriacaoMapa, DeclaracaoVariavel, ExpressaoBinaria, ExpressaoUnaria,
+    InstrucaoAtribuicao, InstrucaoBreak, InstrucaoContinue, InstrucaoIf, InstrucaoImpressao,
+    InstrucaoLoopFor, InstrucaoLoopForEach, InstrucaoLoopInfinito, InstrucaoLoopWhile,
+    InstrucaoRetorno, Literal, LiteralArray, LiteralRange, LiteralTuple, Variavel, literal_bio,
+)
+from src.parser.ast.expressao_pratt import ASSOCIATIVOS_DIREITA, PRECEDENCIA_BINARIA, ParserPratt
+from src.utils.erros import LexicalError, SyntaxError
+
+OPERADORES_ATRIBUICAO = ("ASSIGN", "ARROW_LEFT", "PLUS_EQ", "MINUS_EQ", "STAR_EQ", "SLASH_EQ", "PERC_EQ")
+
+Regra = Generator
+
+
+class ParserIterativo(ParserPratt):
+    """
+    `ParserPratt` com pilha explícita: `_bloco`, `_instrucao` e `_expressao`
+    passam a rodar os geradores `_g_*` em `_executar`, sem recursão.
+    """
+
+    def _executar(self, regra: Regra):
+        # `inicios` acompanha `pilha`: primeiro token de cada regra, para o span do nó que ela devolver
+        pilha = [regra]
+        inicios = [self.ts.peek()]
+        valor = None
+        erro = None
+        while True:
+            topo = pilha[-1]
+            try:
+                if erro is not None:
+                    e, erro = erro, None
+                    sub = topo.throw(e)
+                else:
+                    sub = topo.send(valor)
+            except StopIteration as fim:
+                pilha.pop()
+                valor = self._marcar(fim.value, inicios.pop())
+                if not pilha:
+                    return valor
+                continue
+            except Exception as e:
+                pilha.pop()
+                inicios.pop()
+                if not pilha:
+                    raise
+                erro = e
+                continue
+            pilha.append(sub)
+            inicios.append(self.ts.peek())
+            valor = None
+
+    # Pontos de entrada usados pelas declarações (ainda recursivas)
+    def _bloco(self) -> List[ASTNode]:
+        return self._executar(self._g_bloco())
+
+    def _instrucao(self) -> ASTNode:
+        return self._executar(self._g_instrucao())
+
+    def _expressao(self) -> ASTNode:
+        return self._executar(self._g_expressao())
+
+    # ==========================================
+    # --- Instruções ---
+    # ==========================================
+    def _g_bloco(self) -> Regra:
+        self.ts.expect("LBRACE")
+        instrucoes = []
+        while not self.ts.match("RBRACE"):
+            t = self.ts.peek()
+            if t is None or self._deve_parar():
+                raise builtins.SyntaxError("Esperado token RBRACE, mas chegou EOF")
+            if t.tipo == 'KWD' and t.valor in SINCRONIA_DECLARACAO:
+                # `}` esquecido: a próxima declaração de topo encerra o bloco
+                self._reportar(SyntaxError(f"Esperado token RBRACE, mas chegou {t.valor}", t.linha, t.coluna))
+                break
+            antes = self.ts.anterior
+            try:
+                instrucoes.append((yield self._g_instrucao()))
+                self.em_panico = False
+            except (LexicalError, SyntaxError, builtins.SyntaxError) as e:
+                self._reportar(e)
+                self._sincronizar(SINCRONIA_INSTRUCAO, dentro_de_bloco=True,
+                                  progresso=self.ts.anterior is not antes)
+        return instrucoes
+
+    def _g_instrucao(self) -> Regra:
+        t = self.ts.peek()
+        if t and t.tipo == 'KWD':
+            if t.valor == 'if':
+                return (yield self._g_instrucao_if())
+            elif t.valor == 'for':
+                return (yield self._g_instrucao_for())
+            elif t.valor == 'while':
+                return (yield self._g_instrucao_while())
+            elif t.valor == 'loop':
+                self.ts.expect("KWD")
+                return InstrucaoLoopInfinito((yield self._g_bloco()))
+            elif t.valor == 'return':
+                return (yield self._g_instrucao_return())
+            elif t.valor == 'break':
+                self.ts.next()
+                self.ts.expect("SEMI")
+                return InstrucaoBreak()
+            elif t.valor == 'continue':
+                self.ts.next()
+                self.ts.expect("SEMI")
+                return InstrucaoContinue()
+            elif t.valor == 'print':
+                return (yield self._g_instrucao_print())
+            elif t.valor in ('var', 'const'):
+                return (yield self._g_decl_var_const())
+
+        return (yield self._g_instrucao_atribuicao_ou_chamada())
+
+    def _g_decl_var_const(self) -> Regra:
+        self.ts.expect("KWD")  # 'var' ou 'const'
+
+        t1 = self.ts.peek()
+        t2 = self.ts.peek(2)
+
+        if t1 and (t1.tipo in ("KWD", "ID")) and t2 and (t2.tipo in ("ID", "LBRACK", "LT")):
+            tipo_token = self.ts.next()
+            if tipo_token.valor == 'map' and self.ts.match("LBRACK"):
+                self._tipo()
+                self.ts.expect("COMMA")
+                self._tipo()
+                self.ts.expect("RBRACK")
+            elif self.ts.match("LT"):
+                while True:
+                    self._tipo()
+                    if not self.ts.match("COMMA"):
+                        break
+                self.ts.expect("GT")
+            else:
+                while self.ts.match("LBRACK"):
+                    self.ts.expect("RBRACK")
+        var_name_token = self.ts.expect("ID")
+
+        if self.ts.match("ASSIGN"):
+            valor = yield self._g_expressao()
+            self.ts.expect("SEMI")
+            return InstrucaoAtribuicao(Variavel(var_name_token.valor), '=', valor)
+        self.ts.expect("SEMI")
+        return DeclaracaoVariavel(var_name_token.valor, None)
+
+    def _g_instrucao_atribuicao_ou_chamada(self) -> Regra:
+        alvo = yield self._g_exp_primaria_ou_acesso()
+
+        post_op = self.ts.match("PLUS_PLUS", "MINUS_MINUS")
+        if post_op:
+            self.ts.expect("SEMI")
+            return ExpressaoUnaria(post_op.valor, alvo)
+
+        atrib_op = self.ts.match(*OPERADORES_ATRIBUICAO)
+        if atrib_op:
+            valor = yield self._g_expressao()
+            self.ts.expect("SEMI")
+            return InstrucaoAtribuicao(alvo, atrib_op.valor, valor)
+
+        self.ts.expect("SEMI")
+        return alvo
+
+    def _g_atribuicao_ou_chamada_sem_semi(self) -> Regra:
+        alvo = yield self._g_exp_primaria_ou_acesso()
+        atrib_op = self.ts.match(*OPERADORES_ATRIBUICAO)
+        if atrib_op:
+            valor = yield self._g_expressao()
+            return InstrucaoAtribuicao(alvo, atrib_op.valor, valor)
+        return alvo
+
+    def _g_condicao_if(self) -> Regra:
+        if self.ts.match("LPAREN"):
+            condicao = yield self._g_expressao()
+            self.ts.expect("RPAREN")
+            return condicao
+        return (yield self._g_expressao())
+
+    def _g_instrucao_if(self) -> Regra:
+        self.ts.expect("KWD")
+        condicao = yield self._g_condicao_if()
+        bloco_if = yield self._g_bloco()
+        elif_blocos = []
+        while self.ts.peek() and self.ts.peek().valor == 'elif':
+            self.ts.next()
+            elif_cond = yield self._g_condicao_if()
+            elif_bloco = yield self._g_bloco()
+            elif_blocos.append((elif_cond, elif_bloco))
+        bloco_else = None
+        if self.ts.peek() and self.ts.peek().valor == 'else':
+            self.ts.next()
+            # 'else if (...) { ... }' vira um 'elif' adicional
+            if self.ts.peek() and self.ts.peek().valor == 'if':
+                self.ts.next()
+                self.ts.expect("LPAREN")
+                elif_cond = yield self._g_expressao()
+                self.ts.expect("RPAREN")
+                elif_bloco = yield self._g_bloco()
+                elif_blocos.append((elif_cond, elif_bloco))
+            else:
+                bloco_else = yield self._g_bloco()
+        return InstrucaoIf(condicao, bloco_if, elif_blocos, bloco_else)
+
+    def _g_instrucao_while(self) -> Regra:
+        self.ts.expect("KWD")
+        self.ts.expect("LPAREN")
+        condicao = yield self._g_expressao()
+        self.ts.expect("RPAREN")
+        corpo = yield self._g_bloco()
+        return InstrucaoLoopWhile(condicao, corpo)
+
+    def _g_instrucao_for(self) -> Regra:
+        self.ts.expect("KWD")  # 'for'
+        has_parens = self.ts.match("LPAREN") is not None
+
+        save1 = self.ts.peek()
+        save2 = self.ts.peek(2)
+        if save1 and save1.tipo == 'ID' and save2 and save2.tipo in ('KWD', 'ID') and save2.valor == 'in':
+            iter_var = self.ts.expect("ID").valor
+            self.ts.next()  # consome 'in'
+            iterable = yield self._g_expressao()
+            if has_parens:
+                self.ts.expect("RPAREN")
+            corpo = yield self._g_bloco()
+            return InstrucaoLoopForEach(iter_var, iterable, corpo)
+
+        t = self.ts.peek()
+        if t and t.tipo == 'KWD' and t.valor in ('var', 'const'):
+            inicializacao = yield self._g_decl_var_const()
+        else:
+            inicializacao = yield self._g_instrucao_atribuicao_ou_chamada()
+
+        condicao = yield self._g_expressao()
+        self.ts.expect("SEMI")
+
+        passo = yield self._g_atribuicao_ou_chamada_sem_semi()
+
+        if has_parens:
+            self.ts.expect("RPAREN")
+        corpo = yield self._g_bloco()
+        return InstrucaoLoopFor(inicializacao, condicao, passo, corpo)
+
+    def _g_instrucao_return(self) -> Regra:
+        self.ts.expect("KWD")
+        expressao = None
+        if not self.ts.match("SEMI"):
+            expressao = yield self._g_expressao()
+            self.ts.expect("SEMI")
+        return InstrucaoRetorno(expressao)
+
+    def _g_instrucao_print(self) -> Regra:
+        self.ts.expect("KWD")
+        self.ts.expect("LPAREN")
+        exp_list: List[ASTNode] = []
+        if not self.ts.match("RPAREN"):
+            exp_list.append((yield self._g_expressao()))
+            while self.ts.match("COMMA"):
+                exp_list.append((yield self._g_expressao()))
+            self.ts.expect("RPAREN")
+        self.ts.expect("SEMI")
+        return InstrucaoImpressao(exp_list)
+
+    # ==========================================
+    # --- Expressões ---
+    # ==========================================
+    def _g_expressao(self) -> Regra:
+        node = yield self._g_exp_binaria(1)
+        if self.ts.match("DOT2"):
+            direita = yield self._g_expressao()
+            if isinstance(node, (Literal, Variavel)) and isinstance(direita, (Literal, Variavel)):
+                return self._estender(LiteralRange(node, direita), node)
+            return self._estender(ExpressaoBinaria(node, "..", direita), node)
+        return node
+
+    def _g_exp_binaria(self, prec_minima: int) -> Regra:
+        ts = self.ts
+        node = yield self._g_exp_unaria()
+        while True:
+            op = ts.peek()
+            if op is None:
+                return node
+            prec = PRECEDENCIA_BINARIA.get(op.tipo)
+            if prec is None or prec < prec_minima:
+                return node
+            ts.next()
+            if op.tipo in ASSOCIATIVOS_DIREITA:
+                direita = yield self._g_exp_binaria(prec)
+            else:
+                direita = yield self._g_exp_binaria(prec + 1)
+            node = self._estender(ExpressaoBinaria(node, op.valor, direita), node)
+
+    def _g_exp_unaria(self) -> Regra:
+        op = self.ts.match("PLUS", "MINUS", "BANG", "TILDE")
+        if op:
+            direita = yield self._g_exp_unaria()
+            return ExpressaoUnaria(op.valor, direita)
+        node = yield self._g_exp_primaria_ou_acesso()
+        post_op = self.ts.match("PLUS_PLUS", "MINUS_MINUS")
+        if post_op:
+            return self._estender(ExpressaoUnaria(post_op.valor, node), node)
+        return node
+
+    def _g_exp_primaria_ou_acesso(self) -> Regra:
+        node = yield self._g_exp_primaria()
+
+        while True:
+            tok = self.ts.peek()
+            if not tok:
+                break
+
+            type_args = None
+            if tok.tipo == "LT" and isinstance(node, Variavel) and self._parece_chamada_generica():
+                self.ts.next()  # consome '<'
+                type_args = []
+                while True:
+                    type_args.append(self._tipo().valor)
+                    if not self.ts.match("COMMA"):
+                        break
+                self.ts.expect("GT")
+                tok = self.ts.peek()
+
+            if tok and tok.tipo == "LPAREN":
+                self.ts.next()
+                argumentos = []
+                if self.ts.peek() and self.ts.peek().tipo != "RPAREN":
+                    argumentos.append((yield self._g_expressao()))
+                    while self.ts.match("COMMA"):
+                        argumentos.append((yield self._g_expressao()))
+                self.ts.expect("RPAREN")
+                node = self._estender(ChamadaFuncao(node, argumentos, type_args), node)
+                continue
+
+            if tok and tok.tipo == "DOT":
+                self.ts.next()
+                campo = self.ts.expect("ID")
+                node = self._estender(AcessoCampo(node, campo.valor), node)
+                continue
+
+            if tok and tok.tipo == "LBRACK":
+                self.ts.next()
+                indice = yield self._g_expressao()
+                self.ts.expect("RBRACK")
+                node = self._estender(AcessoArray(node, indice), node)
+                continue
+
+            break
+
+        return node
+
+    def _g_exp_primaria(self) -> Regra:
+        t = self.ts.peek()
+        if not t:
+            self._reportar(SyntaxError("Esperado expressão, mas EOF", -1, -1))
+            return Literal(None)
+
+        try:
+            if t.tipo == 'LBRACK':
+                self.ts.next()
+                elementos: List[ASTNode] = []
+                if not self.ts.match('RBRACK'):
+                    elementos.append((yield self._g_expressao()))
+                    while self.ts.match('COMMA'):
+                        elementos.append((yield self._g_expressao()))
+                    self.ts.expect('RBRACK')
+                return LiteralArray(elementos)
+
+            if t.tipo in ("DEC_INT", "FLOAT", "STRING", "CHAR_LIT", "DNA_LIT", "RNA_LIT", "PROT_LIT"):
+                self.ts.next()
+                if t.tipo == "DEC_INT": return Literal(int(t.valor))
+                if t.tipo == "FLOAT": return Literal(float(t.valor))
+                if t.tipo == "CHAR_LIT": return Literal(t.valor[1:-1])
+                if t.tipo == "STRING": return Literal(t.valor.strip('"'))
+                return literal_bio(t)
+
+            elif t.tipo == "LPAREN":
+                self.ts.next()
+                elementos: List[ASTNode] = []
+                first = yield self._g_expressao()
+                elementos.append(first)
+                while self.ts.match('COMMA'):
+                    elementos.append((yield self._g_expressao()))
+                self.ts.expect("RPAREN")
+                if len(elementos) == 1:
+                    return first
+                return LiteralTuple(elementos)
+
+            elif t.tipo == "ID":
+                return Variavel(self.ts.next().valor)
+
+            elif t.tipo == "KWD" and t.valor in ("true", "false", "null"):
+                self.ts.next()
+                return Literal(True) if t.valor == 'true' else Literal(False) if t.valor == 'false' else Literal(None)
+
+            elif t.tipo == "KWD" and t.valor == 'new':
+                return (yield self._g_criacao())
+
+            else:
+                raise SyntaxError(f"Esperado expressão primária, mas chegou {t.valor}", t.linha, t.coluna)
+
+        except SyntaxError as e:
+            self._reportar(e)
+            self._skip_to_sync()
+            return Literal(None)
+
+    def _g_criacao(self) -> Regra:
+        self.ts.next()  # 'new'
+        tipo_token = self.ts.peek()
+        if not tipo_token or tipo_token.tipo not in ("ID", "KWD"):
+            self.ts.expect("ID")
+        self.ts.next()
+        class_type = tipo_token.valor
+
+        if class_type == 'map' and self.ts.match("LBRACK"):
+            tk = self._tipo().valor
+            self.ts.expect("COMMA")
+            tv = self._tipo().valor
+            self.ts.expect("RBRACK")
+            self.ts.expect("LPAREN")
+            cap = yield self._g_expressao()
+            self.ts.expect("RPAREN")
+            return CriacaoMapa(tk, tv, cap)
+
+        type_args = None
+        if self.ts.match("LT"):
+            type_args = []
+            while True:
+                type_args.append(self._tipo().valor)
+                if not self.ts.match("COMMA"):
+                    break
+            self.ts.expect("GT")
+
+        if self.ts.match("LPAREN"):
+            argumentos = []
+            while self.ts.peek() and self.ts.peek().tipo != 'RPAREN':
+                argumentos.append((yield self._g_expressao()))
+                if self.ts.peek() and self.ts.peek().tipo == "COMMA":
+                    self.ts.next()
+            self.ts.expect("RPAREN")
+            return CriacaoClasse(class_type, argumentos, type_args)
+
+        elif self.ts.match("LBRACK"):
+            m = yield self._g_expressao()
+            self.ts.expect("RBRACK")
+            if self.ts.match("LBRACK"):
+                n = yield self._g_expressao()
+                self.ts.expect("RBRACK")
+                return CriacaoArray2D(class_type, m, n)
+            return CriacaoArray(class_type, m)
+        return None
@@ -0,0 +1,159 @@
+"""
+Cache em disco de ASTs (`Programa`) já analisadas.
+
+Cada entrada fica em `<diretório>/<sha256>.bin`, onde o hash cobre o texto do
+fonte, a versão do compilador e uma assinatura dos módulos do lexer/parser
+(para que editar o front-end também invalide o cache durante o
+desenvolvimento). O conteúdo é o `Programa` serializado com pickle e
+comprimido com zlib.
+
+O diretório padrão é `$CODON_CACHE_DIR` ou `~/.cache/codon/ast` (respeitando
+`$XDG_CACHE_HOME`). A política de despejo é LRU pelo mtime: cada acerto
+atualiza o mtime do arquivo e, após gravar, as entradas mais antigas são
+removidas até o total caber em `limite_bytes`.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from typing import Optional, TextIO
+
+from src import __version__
+from src.parser.ast.ast_base import Programa
+
+LIMITE_PADRAO = 64 * 1024 * 1024
+EXTENSAO = '.bin'
+
+_RAIZ_SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_assinatura: Optional[bytes] = None
+
+
+def diretorio_padrao() -> str:
+    if os.environ.get('CODON_CACHE_DIR'):
+        return os.environ['CODON_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'codon', 'ast')
+
+
+def assinatura_frontend() -> bytes:
+    """Hash da versão do compilador e do código-fonte do lexer e do parser."""
+    global _assinatura
+    if _assinatura is None:
+        h = hashlib.sha256(__version__.encode())
+        for pacote in ('lexer', 'parser'):
+            for raiz, dirs, nomes in os.walk(os.path.join(_RAIZ_SRC, pacote)):
+                dirs.sort()
+                for nome in sorted(nomes):
+                    if nome.endswith('.py'):
+                        with open(os.path.join(raiz, nome), 'rb') as f:
+                            h.update(nome.encode())
+                            h.update(f.read())
+        _assinatura = h.digest()
+    return _assinatura
+
+
+class CacheAST:
+    def __init__(self, diretorio: Optional[str] = None, limite_bytes: int = LIMITE_PADRAO):
+        self.diretorio = diretorio or diretorio_padrao()
+        self.limite_bytes = limite_bytes
+
+    def chave(self, fonte: str) -> str:
+        h = hashlib.sha256(assinatura_frontend())
+        h.update(fonte.encode('utf-8'))
+        return h.hexdigest()
+
+    def chave_arquivo(self, arquivo: TextIO, tamanho_bloco: int = 1 << 20) -> str:
+        """`chave` do texto de `arquivo`, lido em blocos a partir da posição atual."""
+        h = hashlib.sha256(assinatura_frontend())
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), ''):
+            h.update(bloco.encode('utf-8'))
+        return h.hexdigest()
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, chave + EXTENSAO)
+
+    def carregar(self, fonte: str) -> Optional[Programa]:
+        """Retorna a AST de `fonte` se houver uma entrada válida, senão None."""
+        return self.carregar_chave(self.chave(fonte))
+
+    def carregar_chave(self, chave: str) -> Optional[Programa]:
+        caminho = self._caminho(chave)
+        try:
+            with open(caminho, 'rb') as f:
+                programa = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # entrada corrompida ou de um formato antigo: descarta
+            self._remover(caminho)
+            return None
+        if not isinstance(programa, Programa):
+            self._remover(caminho)
+            return None
+        try:
+            os.utime(caminho)  # LRU: marca como usada agora
+        except OSError:
+            pass
+        return programa
+
+    def salvar(self, fonte: str, programa: Programa) -> bool:
+        """Grava a AST de `fonte`. Falhas (disco, árvore funda demais) só desativam o cache."""
+        return self.salvar_chave(self.chave(fonte), programa)
+
+    def salvar_chave(self, chave: str, programa: Programa) -> bool:
+        try:
+            dados = zlib.compress(pickle.dumps(programa, pickle.HIGHEST_PROTOCOL))
+        except RecursionError:
+            return False
+        temporario = None
+        try:
+            os.makedirs(self.diretorio, exist_ok=True)
+            # grava em arquivo temporário e renomeia, para leitores nunca verem um .bin pela metade
+            fd, temporario = tempfile.mkstemp(dir=self.diretorio, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dados)
+            os.replace(temporario, self._caminho(chave))
+        except OSError:
+            if temporario is not None:
+                self._remover(temporario)
+            return False
+        self.despejar()
+        return True
+
+    def despejar(self):
+        """Remove as entradas usadas há mais tempo até o total caber no limite."""
+        entradas = []
+        total = 0
+        try:
+            nomes = os.listdir(self.diretorio)
+        except OSError:
+            return
+        for nome in nomes:
+            if not nome.endswith(EXTENSAO):
+                continue
+            caminho = os.path.join(self.diretorio, nome)
+            try:
+                st = os.stat(caminho)
+            except OSError:
+                continue
+            entradas.append((st.st_mtime, caminho, st.st_size))
+            total += st.st_size
+        entradas.sort()
+        for _, caminho, tamanho in entradas:
+            if total <= self.limite_bytes:
+                break
+            self._remover(caminho)
+            total -= tamanho
+
+    def limpar(self):
+        for nome in os.listdir(self.diretorio) if os.path.isdir(self.diretorio) else ():
+            if nome.endswith(EXTENSAO):
+                self._remover(os.path.join(self.diretorio, nome))
+
+    @staticmethod
+    def _remover(caminho: str):
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
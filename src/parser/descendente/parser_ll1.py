@@ -546,7 +546,7 @@ class ParserLL1:
         token_tipo = token.tipo
 
         # Literais
-        if token_tipo in ('DEC_INT', 'FLOAT', 'STRING', 'DNA_LIT', 'RNA_LIT', 'PROT_LIT', 'CHAR'):
+        if token_tipo in ('DEC_INT', 'FLOAT', 'FLOAT_EXP', 'STRING', 'DNA_LIT', 'RNA_LIT', 'PROT_LIT', 'CHAR_LIT'):
             self.tokens.next()
             return Literal(token=token, value=token.literal)
 
@@ -0,0 +1,189 @@
+"""
+Análise sintática em paralelo por declaração de topo.
+
+Depois de tokenizar o arquivo inteiro em um `TokenBuffer`, uma varredura
+linear casa as chaves e encontra as faixas de tokens de cada declaração de
+topo (`function`, `procedure`, `void`, `class`, `struct`, `enum`); os tokens
+soltos entre elas (instruções de topo) formam faixas próprias. As faixas são
+agrupadas em lotes contíguos de tamanho parecido e analisadas em um
+`ProcessPoolExecutor`, cujos workers recebem o buffer uma única vez (no
+inicializador). Os nós voltam na ordem do fonte e viram um único `Programa`.
+
+Se qualquer lote acusar erro, o arquivo é reanalisado sequencialmente, para
+que os diagnósticos sejam exatamente os do parser sequencial.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Type
+
+from src.frontend import LEXER_PADRAO, analisar
+from src.lexer.analisador_lexico_completo import TokenStreamIndexado
+from src.lexer.buffer_tokens import CODIGO_TIPO, TokenBuffer, TokenView
+from src.parser.ast.ast_base import ASTNode, Parser, Programa
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.utils.erros import ErrorHandler
+
+INICIO_DECLARACAO = frozenset(('function', 'procedure', 'void', 'class', 'struct', 'enum'))
+
+# Abaixo disso o custo de subir os workers e serializar as ASTs não compensa.
+MIN_DECLARACOES_PARALELO = 64
+# Lotes por worker: mais de um para equilibrar funções de tamanhos diferentes.
+LOTES_POR_WORKER = 4
+
+Faixa = Tuple[int, int]
+
+_KWD = CODIGO_TIPO['KWD']
+_LBRACE = CODIGO_TIPO['LBRACE']
+_RBRACE = CODIGO_TIPO['RBRACE']
+_SEMI = CODIGO_TIPO['SEMI']
+
+
+class FatiaTokens:
+    """Os tokens `[inicio, fim)` de um `TokenBuffer` como sequência indexável."""
+
+    __slots__ = ('buf', 'inicio', 'fim')
+
+    def __init__(self, buf: TokenBuffer, inicio: int, fim: int):
+        self.buf = buf
+        self.inicio = inicio
+        self.fim = fim
+
+    def __len__(self) -> int:
+        return self.fim - self.inicio
+
+    def __getitem__(self, i: int) -> TokenView:
+        return TokenView(self.buf, self.inicio + i)
+
+
+def _fim_declaracao(buf: TokenBuffer, i: int) -> Optional[int]:
+    """Índice logo após a chave que fecha a declaração iniciada em `i` (e o `;` de um enum)."""
+    tipos = buf.tipos
+    n = len(tipos)
+    enum = buf.valor(i) == 'enum'
+    profundidade = 0
+    j = i + 1
+    while j < n:
+        t = tipos[j]
+        if t == _LBRACE:
+            profundidade += 1
+        elif t == _RBRACE:
+            profundidade -= 1
+            if profundidade == 0:
+                j += 1
+                if enum and j < n and tipos[j] == _SEMI:
+                    j += 1
+                return j
+        j += 1
+    return None
+
+
+def faixas_declaracoes(buf: TokenBuffer) -> List[Faixa]:
+    """
+    Divide os tokens em faixas `[inicio, fim)`: uma por declaração de topo e
+    uma para cada trecho de instruções de topo entre elas, em ordem.
+    """
+    tipos = buf.tipos
+    n = len(tipos)
+    faixas: List[Faixa] = []
+    solto = 0  # início do trecho de instruções de topo corrente
+    profundidade = 0
+    inicio_instrucao = True
+    i = 0
+    while i < n:
+        t = tipos[i]
+        if profundidade == 0 and inicio_instrucao and t == _KWD and buf.valor(i) in INICIO_DECLARACAO:
+            fim = _fim_declaracao(buf, i)
+            if fim is None:
+                break  # sem a chave de fechamento: o resto fica num trecho só
+            if solto < i:
+                faixas.append((solto, i))
+            faixas.append((i, fim))
+            i = solto = fim
+            continue
+        if t == _LBRACE:
+            profundidade += 1
+        elif t == _RBRACE and profundidade > 0:
+            profundidade -= 1
+        inicio_instrucao = t == _SEMI or t == _RBRACE
+        i += 1
+    if solto < n:
+        faixas.append((solto, n))
+    return faixas
+
+
+def agrupar_faixas(faixas: Sequence[Faixa], n_lotes: int) -> List[List[Faixa]]:
+    """Junta faixas consecutivas em até `n_lotes` lotes com número de tokens parecido."""
+    total = sum(f - i for i, f in faixas)
+    alvo = max(1, -(-total // max(1, n_lotes)))
+    lotes: List[List[Faixa]] = [[]]
+    carga = 0
+    for faixa in faixas:
+        if carga >= alvo:
+            lotes.append([])
+            carga = 0
+        lotes[-1].append(faixa)
+        carga += faixa[1] - faixa[0]
+    return [l for l in lotes if l]
+
+
+# ---------- lado do worker ----------
+
+_buf_worker: Optional[TokenBuffer] = None
+_parser_worker: Type[Parser] = ParserPratt
+
+
+def _iniciar_worker(buf: TokenBuffer, parser_cls: Type[Parser]):
+    global _buf_worker, _parser_worker
+    _buf_worker = buf
+    _parser_worker = parser_cls
+
+
+def analisar_faixas(buf: TokenBuffer, lote: Sequence[Faixa],
+                    parser_cls: Type[Parser] = ParserPratt) -> Optional[List[ASTNode]]:
+    """Analisa as faixas de `lote` em ordem. None se houver qualquer erro."""
+    declaracoes: List[ASTNode] = []
+    for inicio, fim in lote:
+        eh = ErrorHandler(buffered=True)
+        try:
+            programa = parser_cls(TokenStreamIndexado(FatiaTokens(buf, inicio, fim)), eh).parse()
+        except Exception:
+            return None
+        if eh.has_errors():
+            return None
+        declaracoes.extend(programa.declaracoes)
+    return declaracoes
+
+
+def _analisar_lote(lote: Sequence[Faixa]) -> Optional[List[ASTNode]]:
+    return analisar_faixas(_buf_worker, lote, _parser_worker)
+
+
+# ---------- lado do processo principal ----------
+
+def parse_paralelo(fonte: str, jobs: Optional[int] = None, parser_cls: Type[Parser] = ParserPratt,
+                   error_handler: Optional[ErrorHandler] = None) -> Programa:
+    """
+    Analisa `fonte` distribuindo as declarações de topo entre `jobs` processos
+    (padrão: `os.cpu_count()`). Arquivos com poucas declarações, com erros
+    léxicos ou com erros de sintaxe em algum lote são analisados
+    sequencialmente, com os diagnósticos indo para `error_handler`.
+    """
+    eh = error_handler or ErrorHandler()
+    eh_lexico = ErrorHandler(buffered=True)
+    buf = TokenBuffer.tokenizar(fonte, eh_lexico, lexer_cls=LEXER_PADRAO)
+    jobs = jobs or os.cpu_count() or 1
+    faixas = faixas_declaracoes(buf)
+
+    resultado = None
+    if jobs > 1 and len(faixas) >= MIN_DECLARACOES_PARALELO and not eh_lexico.has_errors():
+        lotes = agrupar_faixas(faixas, jobs * LOTES_POR_WORKER)
+        with ProcessPoolExecutor(max_workers=min(jobs, len(lotes)), initializer=_iniciar_worker,
+                                 initargs=(buf, parser_cls)) as pool:
+            partes = list(pool.map(_analisar_lote, lotes))
+        if all(p is not None for p in partes):
+            resultado = Programa([d for parte in partes for d in parte])
+
+    if resultado is None:
+        # caminho sequencial: relexa com o handler do chamador para reportar os erros léxicos
+        resultado = analisar(fonte, eh, parser_cls)
+    return resultado
@@ -1,17 +1,85 @@
-from .ast.ast_base import Parser, TokenStream, ASTNode
-from src.lexer.analisador_lexico_completo import Lexer
+from typing import Optional
+
+from .ast.ast_base import Parser, ASTNode
+from .ast.expressao_pratt import ParserPratt
+from .ast.parser_iterativo import ParserIterativo
+from .cache_ast import CacheAST
+from .paralelo import parse_paralelo
+from src.frontend import analisar, analisar_arquivo
+from src.utils.erros import CompilationError, ErrorHandler
 import os
 
-def parse_cd(arquivo: str) -> ASTNode:
+# Acima deste tamanho (bytes) o arquivo é tokenizado em blocos, sem ser lido inteiro.
+LIMIAR_STREAMING = 8 * 1024 * 1024
+
+def parse_cd(arquivo: str, streaming: Optional[bool] = None, iterativo: bool = False,
+             cache: bool = False, jobs: int = 1) -> ASTNode:
     """
-    Lê um arquivo .cd, tokeniza usando Lexer e retorna a AST Programa.
+    Lê um arquivo .cd, tokeniza e analisa pelo front-end único
+    (`src.frontend`) e retorna a AST Programa.
+
+    Com `streaming=True` o fonte é lido em blocos (`analisar_arquivo`); com
+    None (padrão) isso acontece automaticamente para arquivos maiores que
+    `LIMIAR_STREAMING`, exceto com `jobs` diferente de 1. Com `iterativo=True`
+    instruções e expressões são analisadas por `ParserIterativo`, com pilha
+    explícita, para fontes com aninhamento mais profundo que o limite de
+    recursão do Python.
+
+    Com `cache=True` a AST é buscada primeiro no `CacheAST` (pelo hash do
+    fonte; no modo streaming o hash é calculado numa leitura em blocos antes
+    do parse); só programas sem erros são gravados nele. O padrão é não ler
+    nem gravar o cache: quem o liga é a CLI (`codon run|build`).
+
+    Com `jobs` diferente de 1 as declarações de topo são analisadas em até
+    `jobs` processos (`None` usa todos os núcleos); ver `src.parser.paralelo`.
+    O parse paralelo precisa do fonte inteiro em memória: `streaming=True`
+    com `jobs` diferente de 1 é um `ValueError`.
+
+    Os erros léxicos e sintáticos são impressos à medida que são reportados;
+    o parser se recupera para reportar todos, mas se houve algum, `parse_cd`
+    levanta `CompilationError` em vez de devolver a AST recuperada.
     """
+    parser_cls = ParserIterativo if iterativo else ParserPratt
     arquivo_path = arquivo if os.path.isabs(arquivo) else os.path.abspath(arquivo)
 
+    if streaming is None:
+        streaming = jobs == 1 and os.path.getsize(arquivo_path) > LIMIAR_STREAMING
+    elif streaming and jobs != 1:
+        raise ValueError("parse_cd: o modo streaming analisa em um único processo (use jobs=1)")
+
+    cache_ast = CacheAST() if cache else None
+    eh = ErrorHandler()
     with open(arquivo_path, "r", encoding="utf-8") as f:
+        if streaming:
+            chave = None
+            if cache_ast is not None:
+                chave = cache_ast.chave_arquivo(f)
+                programa = cache_ast.carregar_chave(chave)
+                if programa is not None:
+                    return programa
+                f.seek(0)
+            programa = analisar_arquivo(f, eh, parser_cls)
+            _verificar(eh)
+            if chave is not None:
+                cache_ast.salvar_chave(chave, programa)
+            return programa
         codigo = f.read()
 
-    lexer = Lexer(codigo)
-    ts = TokenStream(lexer)
-    parser = Parser(ts)
-    return parser.parse()
+    if cache_ast is not None:
+        programa = cache_ast.carregar(codigo)
+        if programa is not None:
+            return programa
+
+    if jobs != 1:
+        programa = parse_paralelo(codigo, jobs, parser_cls, eh)
+    else:
+        programa = analisar(codigo, eh, parser_cls)
+    _verificar(eh)
+    if cache_ast is not None:
+        cache_ast.salvar(codigo, programa)
+    return programa
+
+
+def _verificar(eh: ErrorHandler):
+    if eh.has_errors():
+        raise CompilationError("análise léxica/sintática", eh.errors)
@@ -1,68 +1,73 @@
 from typing import Dict, List, Optional, Tuple, Union
 from src.parser.ast.ast_base import (
     Programa, DeclaracaoFuncao, DeclaracaoClasse, DeclaracaoMetodo, InstrucaoAtribuicao,
-    InstrucaoIf, InstrucaoLoopWhile, InstrucaoLoopFor, InstrucaoImpressao,
-    InstrucaoRetorno, ExpressaoBinaria, ExpressaoUnaria, Literal, Variavel,
-    ChamadaFuncao, AcessoArray, AcessoCampo, CriacaoClasse, CriacaoArray,
-    ASTNode
+    InstrucaoIf, InstrucaoLoopWhile, InstrucaoLoopFor, InstrucaoLoopForEach, InstrucaoLoopInfinito,
+    InstrucaoImpressao, InstrucaoRetorno, ExpressaoBinaria, ExpressaoUnaria, Literal, LiteralBio,
+    LiteralArray, LiteralRange, LiteralTuple, Variavel, ChamadaFuncao, AcessoArray, AcessoCampo,
+    CriacaoClasse, CriacaoArray, CriacaoArray2D, CriacaoMapa, DeclaracaoEnum, ASTNode
 )
 from src.utils.erros import ErrorHandler, SemanticError
 from .tabela_simbolos import Symbol, SymbolTable
+from .tipos import (
+    BIOLOGICOS, BOOL, CHAR, DESCONHECIDO, FLOAT, INT, NUMERICOS, OPERADORES_COMPARACAO,
+    OPERADORES_LOGICOS, STRING, TEXTUAIS, VOID, Tipo, resultado_binario, tipo,
+)
+
+# Funções embutidas que o codegen implementa: nome -> (tipo de retorno, nº de argumentos)
+BUILTINS = {
+    'length': (INT, 1),
+    'input': (STRING, 0),
+    'inputInt': (INT, 0),
+    'printInt': (VOID, 1),
+    'substring': (STRING, 3),
+}
 
 
-def _infer_literal_type(value) -> str:
+def _infer_literal_type(value) -> Tipo:
+    # bool antes de int: True/False também são int em Python
+    if isinstance(value, bool):
+        return BOOL
     if isinstance(value, int):
-        return 'int'
+        return INT
     if isinstance(value, float):
-        return 'float'
-    if isinstance(value, bool):
-        return 'bool'
+        return FLOAT
     if isinstance(value, str):
-        return 'char' if len(value) == 1 else 'string'
-    return 'unknown_type'
-
-
-def _get_binary_result_type(op: str, left_type: str, right_type: str) -> Optional[str]:
-    arithmetic_ops = {'+', '-', '*', '/', '%'}
-    comparison_ops = {'==', '!=', '>', '<', '>=', '<='}
-    logical_ops = {'&&', '||'}
-
-    numeric = {'int', 'float', 'decimal'}
-
-    if op in arithmetic_ops:
-        if left_type in numeric and right_type in numeric:
-            if 'decimal' in {left_type, right_type}:
-                return 'decimal'
-            if 'float' in {left_type, right_type}:
-                return 'float'
-            return 'int'
-        # Concatenação de strings e tipos biológicos
-        biological = {'dna','rna','prot'}
-        if op == '+' and left_type == right_type and (left_type == 'string' or left_type in biological):
-            return left_type
-        return None
+        return CHAR if len(value) == 1 else STRING
+    return DESCONHECIDO
 
-    if op in comparison_ops:
-        numeric = {'int', 'float', 'decimal'}
-        biological = {'dna','rna','prot'}
-        if (left_type in numeric and right_type in numeric) or \
-           (left_type == right_type == 'string') or \
-           (left_type == right_type and left_type in biological):
-            return 'bool'
-        return None
 
-    if op in logical_ops:
-        if left_type == 'bool' and right_type == 'bool':
-            return 'bool'
+def _get_binary_result_type(op: str, left_type: str, right_type: str) -> Optional[Tipo]:
+    if left_type is None or right_type is None:
         return None
+    return resultado_binario(op, tipo(left_type), tipo(right_type))
+
+
+def _compativel(esperado: str, recebido: str) -> bool:
+    """Se um valor de tipo `recebido` pode ser guardado onde se espera `esperado`."""
+    if esperado == recebido or DESCONHECIDO in (esperado, recebido):
+        return True
+    if esperado in NUMERICOS and recebido in NUMERICOS:
+        return True
+    return (esperado == 'Nbase' and recebido == 'char') or (esperado == 'string' and recebido == 'char')
 
-    if op == '->':
-        if left_type == 'dna' and right_type == 'rna':
-            return 'rna'
 
+def _tipo_elemento(t: str) -> Optional[Tipo]:
+    """Tipo de cada elemento de um array, string ou sequência; None se `t` não é iterável."""
+    if t.startswith('Array<'):
+        return tipo(t[6:-1])
+    if t in TEXTUAIS or t in BIOLOGICOS:
+        return CHAR
     return None
 
 
+def _tipos_mapa(t: str) -> Optional[Tuple[Tipo, Tipo]]:
+    """(chave, valor) de um tipo 'Map<K,V>'; None se `t` não é um mapa."""
+    if not t.startswith('Map<'):
+        return None
+    chave, valor = t[4:-1].split(',', 1)
+    return tipo(chave), tipo(valor)
+
+
 class SemanticAnalyzer:
     def __init__(self, error_handler: Optional[ErrorHandler] = None):
         self.error_handler = error_handler or ErrorHandler()
@@ -74,20 +79,34 @@ class SemanticAnalyzer:
         self.found_return_in_current_function: bool = False
 
         self.primitive_types = {
-            "int", "float", "decimal", "bool", "char", "string",
+            "int", "float", "decimal", "double", "bool", "char", "string",
             "dna", "rna", "prot", "Nbase", "void"
         }
+        # Parâmetros de tipo (genéricos) da declaração sendo analisada: são
+        # opacos, com tipo 'unknown_type', e não valem como tipos indefinidos
+        self.type_params: Tuple[str, ...] = ()
 
         self._initialize_global_scope()
 
     def _initialize_global_scope(self):
         for t_name in self.primitive_types:
-            self.global_scope.define(Symbol(t_name, t_name, 'type'), self.error_handler)
-        self.global_scope.define(Symbol('length', 'int', 'function', param_count=1), self.error_handler)
+            self.global_scope.define(Symbol(t_name, tipo(t_name), 'type'), self.error_handler)
+        for nome, (ret_type, param_count) in BUILTINS.items():
+            self.global_scope.define(Symbol(nome, ret_type, 'function', param_count=param_count,
+                                            is_procedure=ret_type is VOID), self.error_handler)
 
     def _get_coords(self, node: ASTNode) -> Tuple[int, int]:
         return getattr(node, 'line', -1), getattr(node, 'col', -1)
 
+    def _resolve_type(self, nome: Optional[str], type_params=()) -> Tipo:
+        """Tipo declarado `nome`; um parâmetro de tipo genérico vira 'unknown_type'."""
+        if nome in type_params or nome in self.type_params:
+            return DESCONHECIDO
+        return tipo(nome)
+
+    def _type_defined(self, nome: str) -> bool:
+        return nome in self.type_params or self.global_scope.lookup(nome) is not None
+
     def push_scope(self, name: str = "local"):
         self.current_scope = self.current_scope.enter_scope(name)
 
@@ -95,15 +114,7 @@ class SemanticAnalyzer:
         self.current_scope = self.current_scope.exit_scope()
 
     def analyze(self, program: Programa):
-        for decl in program.declaracoes:
-            if isinstance(decl, DeclaracaoFuncao):
-                self._register_function(decl)
-            elif isinstance(decl, DeclaracaoClasse):
-                self._register_class(decl)
-                # Registra métodos da classe
-                if getattr(decl, 'metodos', None):
-                    for m in decl.metodos:
-                        self._register_method(m)
+        self._register_declarations(program)
 
         for decl in program.declaracoes:
             self._analyze_declaration(decl)
@@ -113,13 +124,27 @@ class SemanticAnalyzer:
         # else:
         #     print(f"Analise Semantica concluida com {len(self.error_handler.errors)} erros.\n")
 
+    def _register_declarations(self, program: Programa):
+        """Primeira passada: funções, classes e métodos de topo no escopo global."""
+        for decl in program.declaracoes:
+            if isinstance(decl, DeclaracaoFuncao):
+                self._register_function(decl)
+            elif isinstance(decl, DeclaracaoClasse):
+                self._register_class(decl)
+                # Registra métodos da classe
+                if getattr(decl, 'metodos', None):
+                    for m in decl.metodos:
+                        self._register_method(m, decl.type_params or ())
+            elif isinstance(decl, DeclaracaoEnum):
+                self._register_enum(decl)
+
     def _register_function(self, decl: DeclaracaoFuncao):
         line, col = self._get_coords(decl)
         param_count = len(decl.parametros) if decl.parametros else 0
 
-        ret_type = getattr(decl, 'tipo_retorno', 'unknown_type')
+        ret_type = self._resolve_type(getattr(decl, 'tipo_retorno', DESCONHECIDO), decl.type_params or ())
         if decl.is_procedure:
-            ret_type = 'void'
+            ret_type = VOID
 
         func_symbol = Symbol(
             decl.nome,
@@ -143,21 +168,28 @@ class SemanticAnalyzer:
                     f"Campo duplicado '{fname}' na classe '{decl.nome}'.",
                     line, col, "SEM025"))
             field_names.add(fname)
-            fields[fname] = ftype
+            fields[fname] = self._resolve_type(ftype, decl.type_params or ())
 
         class_symbol = Symbol(
             decl.nome,
-            decl.nome,
+            tipo(decl.nome),
             'class',
             line, col,
             fields=fields
         )
         self.current_scope.define(class_symbol, self.error_handler)
 
-    def _register_method(self, decl: DeclaracaoMetodo):
+    def _register_enum(self, decl: DeclaracaoEnum):
+        line, col = self._get_coords(decl)
+        membros = {nome: INT for nome, _ in decl.membros}
+        self.current_scope.define(Symbol(decl.nome, tipo(decl.nome), 'enum', line, col, fields=membros),
+                                  self.error_handler)
+
+    def _register_method(self, decl: DeclaracaoMetodo, class_type_params=()):
         line, col = self._get_coords(decl)
         param_count = len(decl.parametros) if decl.parametros else 0
-        ret_type = decl.tipo_retorno if not decl.is_procedure else 'void'
+        type_params = tuple(class_type_params) + tuple(decl.type_params or ())
+        ret_type = self._resolve_type(decl.tipo_retorno, type_params) if not decl.is_procedure else VOID
         # +1 para self implícito
         func_symbol = Symbol(f"{decl.classe}_{decl.nome}", ret_type, 'function', line, col, param_count=param_count+1, is_procedure=decl.is_procedure)
         self.current_scope.define(func_symbol, self.error_handler)
@@ -166,9 +198,13 @@ class SemanticAnalyzer:
         if isinstance(decl, DeclaracaoFuncao):
             self._analyze_function(decl)
         elif isinstance(decl, DeclaracaoClasse):
+            self.type_params = tuple(decl.type_params or ())
             self._analyze_class(decl)
             for m in getattr(decl, 'metodos', []) or []:
                 self._analyze_method(m)
+            self.type_params = ()
+        elif isinstance(decl, DeclaracaoEnum):
+            pass  # membros já registrados
         elif isinstance(decl, DeclaracaoMetodo):
             self._analyze_method(decl)
         elif decl is not None:
@@ -176,7 +212,7 @@ class SemanticAnalyzer:
 
     def _analyze_class(self, decl: DeclaracaoClasse):
         for _, field_type in decl.campos:
-            if self.global_scope.lookup(field_type) is None:
+            if not self._type_defined(field_type):
                 line, col = self._get_coords(decl)
                 self.error_handler.report_error(SemanticError(
                     f"Tipo '{field_type}' do campo é indefinido (classe ou primitivo).",
@@ -188,21 +224,23 @@ class SemanticAnalyzer:
         self.found_return_in_current_function = False
 
         self.push_scope(f"func_{decl.nome}")
+        self.type_params = tuple(decl.type_params or ())
 
         if decl.parametros:
             for param_name, param_type in decl.parametros:
                 line, col = self._get_coords(decl)
-                if self.global_scope.lookup(param_type) is None:
+                if not self._type_defined(param_type):
                     self.error_handler.report_error(SemanticError(
                         f"Tipo '{param_type}' do parâmetro '{param_name}' é indefinido.",
                         line, col, "SEM027"
                     ))
 
-                param_symbol = Symbol(param_name, param_type, 'param', line, col)
+                param_symbol = Symbol(param_name, self._resolve_type(param_type), 'param', line, col)
                 self.current_scope.define(param_symbol, self.error_handler)
 
         for stmt in decl.corpo:
             self._analyze_stmt(stmt)
+        self.type_params = ()
 
         if (not self.current_function.is_procedure) and \
            (self.current_function.type != 'void') and \
@@ -221,15 +259,19 @@ class SemanticAnalyzer:
         self.current_function = self.current_scope.lookup(f"{decl.classe}_{decl.nome}")
         self.found_return_in_current_function = False
         self.push_scope(f"method_{decl.classe}_{decl.nome}")
+        type_params_classe = self.type_params
+        self.type_params += tuple(decl.type_params or ())
         # Self
-        self.current_scope.define(Symbol('self', decl.classe, 'param', -1, -1), self.error_handler)
+        self.current_scope.define(Symbol('self', tipo(decl.classe), 'param', -1, -1), self.error_handler)
         for param_name, param_type in decl.parametros or []:
-            if self.global_scope.lookup(param_type) is None:
+            if not self._type_defined(param_type):
                 self.error_handler.report_error(SemanticError(
                     f"Tipo '{param_type}' do parâmetro '{param_name}' é indefinido.", -1, -1, "SEM027"))
-            self.current_scope.define(Symbol(param_name, param_type, 'param', -1, -1), self.error_handler)
+            self.current_scope.define(Symbol(param_name, self._resolve_type(param_type), 'param', -1, -1),
+                                      self.error_handler)
         for stmt in decl.corpo:
             self._analyze_stmt(stmt)
+        self.type_params = type_params_classe
         if (not decl.is_procedure) and decl.tipo_retorno != 'void' and (not self.found_return_in_current_function):
             self.error_handler.report_error(SemanticError(
                 f"Método '{decl.nome}' da classe '{decl.classe}' requer 'return'.", -1, -1, "SEM008"))
@@ -245,8 +287,16 @@ class SemanticAnalyzer:
             self._analyze_while(node)
         elif isinstance(node, InstrucaoLoopFor):
             self._analyze_for(node)
+        elif isinstance(node, InstrucaoLoopForEach):
+            self._analyze_foreach(node)
+        elif isinstance(node, InstrucaoLoopInfinito):
+            self.push_scope("loop_body")
+            for s in node.corpo:
+                self._analyze_stmt(s)
+            self.pop_scope()
         elif isinstance(node, InstrucaoImpressao):
-            self._analyze_expr(node.expressao)
+            for e in node.expressoes:
+                self._analyze_expr(e)
         elif isinstance(node, InstrucaoRetorno):
             self._analyze_return(node)
         elif isinstance(node, (Variavel, ChamadaFuncao, ExpressaoBinaria, ExpressaoUnaria,
@@ -274,7 +324,7 @@ class SemanticAnalyzer:
                 line, col, "SEM006"))
             return
 
-        returned_type = 'void'
+        returned_type = VOID
         if node.expressao:
             returned_type = self._analyze_expr(node.expressao)
 
@@ -285,7 +335,7 @@ class SemanticAnalyzer:
                 self.error_handler.report_error(SemanticError(
                     f"Uma procedure não pode retornar um valor de tipo '{returned_type}'.",
                     line, col, "SEM013"))
-        elif returned_type != expected_type:
+        elif returned_type != expected_type and DESCONHECIDO not in (returned_type, expected_type):
             if not (expected_type == 'float' and returned_type == 'int'):
                 self.error_handler.report_error(SemanticError(
                     f"O tipo de retorno da função '{self.current_function.name}' é incompatível. "
@@ -305,10 +355,11 @@ class SemanticAnalyzer:
             var_symbol = self.current_scope.lookup(alvo.nome)
 
             if var_symbol is None:
-                self.current_scope.define(Symbol(
-                    alvo.nome, rhs_type, 'var', line, col
-                ), self.error_handler)
+                var_symbol = Symbol(alvo.nome, rhs_type, 'var', line, col)
+                self.current_scope.define(var_symbol, self.error_handler)
+                alvo.simbolo, alvo.tipo_resolvido = var_symbol, rhs_type
                 return
+            alvo.simbolo, alvo.tipo_resolvido = var_symbol, var_symbol.type
 
             if var_symbol.kind == 'const':
                 self.error_handler.report_error(SemanticError(
@@ -317,36 +368,23 @@ class SemanticAnalyzer:
                 return
 
             expected_type = var_symbol.type
-            if expected_type != 'unknown_type' and rhs_type != 'unknown_type':
-                if expected_type != rhs_type:
-                    numeric = {'int', 'float', 'decimal'}
-                    if expected_type in numeric and rhs_type in numeric:
-                        return
-                    if expected_type == 'Nbase' and rhs_type == 'char':
-                        return
-                    self.error_handler.report_error(SemanticError(
-                        f"Tipo incompatível na atribuição: '{expected_type}' := '{rhs_type}'",
-                        line, col, "SEM015"))
+            if not _compativel(expected_type, rhs_type):
+                self.error_handler.report_error(SemanticError(
+                    f"Tipo incompatível na atribuição: '{expected_type}' := '{rhs_type}'",
+                    line, col, "SEM015"))
 
         elif isinstance(alvo, (AcessoCampo, AcessoArray)):
             alvo_type = self._analyze_expr(alvo)
-            if alvo_type != 'unknown_type' and alvo_type is not None:
-                expected = alvo_type
-                if expected != rhs_type:
-                    numeric = {'int', 'float', 'decimal'}
-                    if expected in numeric and rhs_type in numeric:
-                        return
-                    if expected == 'Nbase' and rhs_type == 'char':
-                        return
-                    self.error_handler.report_error(SemanticError(
-                        f"Tipo incompatível na atribuição por acesso: '{expected}' := '{rhs_type}'",
-                        line, col, "SEM015"))
+            if alvo_type is not None and not _compativel(alvo_type, rhs_type):
+                self.error_handler.report_error(SemanticError(
+                    f"Tipo incompatível na atribuição por acesso: '{alvo_type}' := '{rhs_type}'",
+                    line, col, "SEM015"))
 
     def _analyze_if(self, node: InstrucaoIf):
         cond_type = self._analyze_expr(node.condicao)
         line, col = self._get_coords(node.condicao)
 
-        if cond_type != 'bool':
+        if cond_type not in (BOOL, DESCONHECIDO):
             self.error_handler.report_error(SemanticError(
                 "A condição da instrução 'if' deve ser do tipo 'bool'.",
                 line, col, "SEM018"))
@@ -359,7 +397,7 @@ class SemanticAnalyzer:
         for (cond, bloco) in node.elif_blocos:
             elif_cond_type = self._analyze_expr(cond)
             line, col = self._get_coords(cond)
-            if elif_cond_type != 'bool':
+            if elif_cond_type not in (BOOL, DESCONHECIDO):
                 self.error_handler.report_error(SemanticError(
                     "A condição da instrução 'elif' deve ser do tipo 'bool'.",
                     line, col, "SEM018"))
@@ -379,7 +417,7 @@ class SemanticAnalyzer:
         cond_type = self._analyze_expr(node.condicao)
         line, col = self._get_coords(node.condicao)
 
-        if cond_type != 'bool':
+        if cond_type not in (BOOL, DESCONHECIDO):
             self.error_handler.report_error(SemanticError(
                 "A condição do loop 'while' deve ser do tipo 'bool'.",
                 line, col, "SEM018"))
@@ -397,7 +435,7 @@ class SemanticAnalyzer:
         cond_type = self._analyze_expr(node.condicao)
         line, col = self._get_coords(node.condicao)
 
-        if cond_type != 'bool':
+        if cond_type not in (BOOL, DESCONHECIDO):
             self.error_handler.report_error(SemanticError(
                 "A condição do loop 'for' deve ser do tipo 'bool'.",
                 line, col, "SEM018"))
@@ -408,12 +446,46 @@ class SemanticAnalyzer:
 
         self.pop_scope()
 
-    def _analyze_expr(self, expr: ASTNode) -> str:
+    def _analyze_foreach(self, node: InstrucaoLoopForEach):
+        iter_type = self._analyze_expr(node.iterable)
+        if isinstance(node.iterable, LiteralRange):
+            elem_type = INT
+        else:
+            elem_type = _tipo_elemento(iter_type)
+        if elem_type is None:
+            if iter_type is not DESCONHECIDO:
+                line, col = self._get_coords(node.iterable)
+                self.error_handler.report_error(SemanticError(
+                    f"O loop 'for-in' requer um intervalo, array ou string, recebeu '{iter_type}'.",
+                    line, col, "SEM032"))
+            elem_type = DESCONHECIDO
+
+        self.push_scope("foreach_body")
+        line, col = self._get_coords(node)
+        self.current_scope.define(Symbol(node.iter_var, elem_type, 'var', line, col), self.error_handler)
+        for s in node.corpo:
+            self._analyze_stmt(s)
+        self.pop_scope()
+
+    def _analyze_expr(self, expr: ASTNode) -> Tipo:
+        """Tipo de `expr`, que também fica anotado no nó (`tipo_resolvido`) para o codegen."""
         if expr is None:
-            return 'void'
+            return VOID
+        t = self._infer_expr(expr)
+        expr.tipo_resolvido = t
+        return t
 
+    def _infer_expr(self, expr: ASTNode) -> Tipo:
         line, col = self._get_coords(expr)
 
+        if isinstance(expr, LiteralBio):
+            # o lexer já verificou o alfabeto: aqui só se consulta a marca
+            if not expr.alfabeto_valido:
+                self.error_handler.report_error(SemanticError(
+                    f"Literal {expr.tipo} com caracteres fora do alfabeto da sequência",
+                    line, col, "SEM031"))
+            return tipo(expr.tipo)
+
         if isinstance(expr, Literal):
             return _infer_literal_type(expr.valor)
 
@@ -423,7 +495,8 @@ class SemanticAnalyzer:
                 self.error_handler.report_error(SemanticError(
                     f"Uso de variável não definida: '{expr.nome}'",
                     line, col, "SEM003"))
-                return 'unknown_type'
+                return DESCONHECIDO
+            expr.simbolo = var_symbol
             return var_symbol.type
 
         if isinstance(expr, ExpressaoBinaria):
@@ -432,23 +505,33 @@ class SemanticAnalyzer:
 
             result_type = _get_binary_result_type(expr.operador, left_type, right_type)
 
+            if result_type is None and DESCONHECIDO in (left_type, right_type):
+                # O erro já foi reportado no operando (ou é uma construção que o
+                # analisador não tipa, como null e tuplas): não repete aqui.
+                if expr.operador in OPERADORES_COMPARACAO or expr.operador in OPERADORES_LOGICOS:
+                    return BOOL
+                return DESCONHECIDO
+
             if result_type is None:
                 self.error_handler.report_error(SemanticError(
                     f"Tipos incompatíveis '{left_type}' e '{right_type}' para o operador binário '{expr.operador}'.",
                     line, col, "SEM010"))
-                return 'unknown_type'
+                return DESCONHECIDO
 
             return result_type
 
         if isinstance(expr, ExpressaoUnaria):
             right_type = self._analyze_expr(expr.direita)
 
-            if expr.operador in {'+', '-'}:
-                if right_type not in {'int', 'float'}:
+            if right_type is DESCONHECIDO:
+                return BOOL if expr.operador == '!' else DESCONHECIDO
+
+            if expr.operador in {'+', '-', '++', '--'}:
+                if right_type not in NUMERICOS:
                     self.error_handler.report_error(SemanticError(
                         f"Operador unário '{expr.operador}' requer tipo numérico, recebeu '{right_type}'.",
                         line, col, "SEM011"))
-                    return 'unknown_type'
+                    return DESCONHECIDO
                 return right_type
 
             if expr.operador == '!':
@@ -456,10 +539,18 @@ class SemanticAnalyzer:
                     self.error_handler.report_error(SemanticError(
                         f"Operador unário '{expr.operador}' requer tipo 'bool', recebeu '{right_type}'.",
                         line, col, "SEM011"))
-                    return 'unknown_type'
-                return 'bool'
+                    return DESCONHECIDO
+                return BOOL
+
+            if expr.operador == '~':
+                if right_type is not INT:
+                    self.error_handler.report_error(SemanticError(
+                        f"Operador unário '~' requer tipo 'int', recebeu '{right_type}'.",
+                        line, col, "SEM011"))
+                    return DESCONHECIDO
+                return INT
 
-            return 'unknown_type'
+            return DESCONHECIDO
 
         if isinstance(expr, ChamadaFuncao):
             fn_name_node = expr.nome
@@ -473,6 +564,7 @@ class SemanticAnalyzer:
                 if func_symbol is None or func_symbol.kind != 'function':
                     class_symbol = self.current_scope.lookup(fn_name) or self.global_scope.lookup(fn_name)
                     if class_symbol and class_symbol.kind == 'class':
+                        expr.simbolo = class_symbol
                         for a in expr.argumentos:
                             self._analyze_expr(a)
                         return class_symbol.type
@@ -481,7 +573,8 @@ class SemanticAnalyzer:
                         line, col, "SEM005"))
                     func_symbol = None
                 else:
-                    expected = getattr(func_symbol, 'param_count', 0)
+                    expr.simbolo = func_symbol
+                    expected = func_symbol.param_count
                     got = len(expr.argumentos) if expr.argumentos else 0
                     if expected != got:
                         self.error_handler.report_error(SemanticError(
@@ -491,62 +584,120 @@ class SemanticAnalyzer:
             for a in expr.argumentos:
                 self._analyze_expr(a)
 
-            return func_symbol.type if func_symbol else 'unknown_type'
+            return func_symbol.type if func_symbol else DESCONHECIDO
 
         if isinstance(expr, AcessoArray):
             alvo_type = self._analyze_expr(expr.alvo)
             index_type = self._analyze_expr(expr.indice)
             line, col = self._get_coords(expr)
 
-            if index_type != 'int':
+            mapa = _tipos_mapa(alvo_type)
+            if mapa is not None:
+                chave, valor = mapa
+                if not _compativel(chave, index_type):
+                    self.error_handler.report_error(SemanticError(
+                        f"A chave do mapa deve ser do tipo '{chave}', recebeu '{index_type}'.",
+                        line, col, "SEM017"
+                    ))
+                return valor
+
+            fatia = isinstance(expr.indice, LiteralRange)
+            if not fatia and index_type not in (INT, DESCONHECIDO):
                 self.error_handler.report_error(SemanticError(
                     f"O índice do array deve ser do tipo 'int', recebeu '{index_type}'.",
                     line, col, "SEM017"
                 ))
 
-            if not alvo_type.startswith('Array<'):
+            if alvo_type is DESCONHECIDO:
+                return DESCONHECIDO
+            elem_type = _tipo_elemento(alvo_type)
+            if elem_type is None:
                 self.error_handler.report_error(SemanticError(
                     f"Tentativa de indexar um tipo não-array: '{alvo_type}'.",
                     line, col, "SEM029"
                 ))
-                return 'unknown_type'
+                return DESCONHECIDO
 
-            return alvo_type[6:-1]
+            # a[i..j] é uma fatia, do mesmo tipo que `a`
+            return alvo_type if fatia else elem_type
 
         if isinstance(expr, AcessoCampo):
             alvo_type = self._analyze_expr(expr.alvo)
             field_name = expr.campo
             line, col = self._get_coords(expr)
 
+            if alvo_type is DESCONHECIDO:
+                return DESCONHECIDO
+
+            if field_name == 'length' and _tipo_elemento(alvo_type) is not None:
+                return INT
+
             class_symbol = self.global_scope.lookup(alvo_type)
 
-            if class_symbol is None or class_symbol.kind != 'class':
+            if class_symbol is None or class_symbol.kind not in ('class', 'enum'):
                 self.error_handler.report_error(SemanticError(
                     f"Acesso a campo ('{field_name}') de tipo inválido ou indefinido: '{alvo_type}'.",
                     line, col, "SEM026"))
-                return 'unknown_type'
+                return DESCONHECIDO
 
-            class_fields = getattr(class_symbol, 'fields', {})
+            class_fields = class_symbol.fields or {}
             if field_name not in class_fields:
                 self.error_handler.report_error(SemanticError(
-                    f"Campo '{field_name}' não existe na classe '{alvo_type}'.",
+                    f"Campo '{field_name}' não existe {'no enum' if class_symbol.kind == 'enum' else 'na classe'} "
+                    f"'{alvo_type}'.",
                     line, col, "SEM028"))
-                return 'unknown_type'
+                return DESCONHECIDO
 
             return class_fields[field_name]
 
         if isinstance(expr, CriacaoClasse):
             for a in expr.argumentos:
                 self._analyze_expr(a)
-            return expr.classe
+            return tipo(expr.classe)
 
         if isinstance(expr, CriacaoArray):
             size_type = self._analyze_expr(expr.tamanho)
-            if size_type != 'int':
+            if size_type not in (INT, DESCONHECIDO):
                 self.error_handler.report_error(SemanticError(
                     f"O tamanho do array deve ser do tipo 'int', recebido '{size_type}'.",
                     line, col, "SEM030"
                 ))
-            return f'Array<{expr.tipo}>'
+            return tipo(f'Array<{expr.tipo}>')
+
+        if isinstance(expr, CriacaoArray2D):
+            for dim in (expr.linhas, expr.colunas):
+                size_type = self._analyze_expr(dim)
+                if size_type not in (INT, DESCONHECIDO):
+                    self.error_handler.report_error(SemanticError(
+                        f"O tamanho do array deve ser do tipo 'int', recebido '{size_type}'.",
+                        line, col, "SEM030"
+                    ))
+            return tipo(f'Array<Array<{expr.tipo}>>')
+
+        if isinstance(expr, LiteralArray):
+            tipos_elementos = [self._analyze_expr(e) for e in expr.elementos]
+            if not tipos_elementos or tipos_elementos[0] is DESCONHECIDO:
+                return DESCONHECIDO
+            return tipo(f'Array<{tipos_elementos[0]}>')
+
+        if isinstance(expr, CriacaoMapa):
+            self._analyze_expr(expr.capacidade)
+            return tipo(f'Map<{expr.tipo_chave},{expr.tipo_valor}>')
+
+        if isinstance(expr, LiteralRange):
+            for limite in (expr.inicio, expr.fim):
+                limite_type = self._analyze_expr(limite)
+                if limite_type not in (INT, DESCONHECIDO):
+                    self.error_handler.report_error(SemanticError(
+                        f"Os limites do intervalo devem ser do tipo 'int', recebeu '{limite_type}'.",
+                        line, col, "SEM017"
+                    ))
+            return DESCONHECIDO
+
+        if isinstance(expr, LiteralTuple):
+            # tuplas são heterogêneas e não têm tipo próprio no analisador
+            for e in expr.elementos:
+                self._analyze_expr(e)
+            return DESCONHECIDO
 
-        return 'unknown_type'
\ No newline at end of file
+        return DESCONHECIDO
\ No newline at end of file
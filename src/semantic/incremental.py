@@ -0,0 +1,195 @@
+"""
+Análise semântica incremental por declaração de topo.
+
+A unidade de reanálise é cada `DeclaracaoFuncao` e cada `DeclaracaoClasse`
+(com seus métodos). Para cada uma guardamos, sob a impressão digital do seu
+texto (o trecho do fonte coberto pelo span do nó):
+
+- as leituras globais: os nomes que o corpo consultou e que resolveram no
+  escopo global, ou em nenhum, com a assinatura do símbolo encontrado;
+- os diagnósticos, com a linha relativa ao início da declaração, para que
+  continuem valendo quando o código acima dela muda de tamanho.
+
+Numa nova análise, o registro das declarações e as instruções de topo (que
+definem as variáveis globais, na ordem do fonte) são sempre refeitos. Uma
+declaração cujo texto não mudou e cujas leituras globais resolvem para as
+mesmas assinaturas reaproveita os diagnósticos guardados. As demais são
+reanalisadas (em paralelo, com `jobs` > 1; ver `src.semantic.paralelo`):
+as que mudaram e as que dependem de um símbolo global que mudou (uma função
+que passou a receber outro número de parâmetros, um campo novo numa
+classe...).
+
+O estado fica em um arquivo por fonte no diretório de `diretorio_padrao()`,
+ao lado do cache de ASTs. As declarações reaproveitadas não recebem as
+anotações de tipo/símbolo no AST (o modo incremental serve ao `check`, não
+ao codegen).
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.parser.ast.ast_base import ASTNode, Programa
+from src.parser.cache_ast import assinatura_frontend, diretorio_padrao as diretorio_cache_ast
+from src.utils.erros import ErrorHandler
+from .paralelo import AnalisadorParalelo, Erro, Leitura
+
+EXTENSAO = '.sem'
+
+_DIR_SEMANTICA = os.path.dirname(os.path.abspath(__file__))
+_assinatura: Optional[bytes] = None
+
+# (código, mensagem, linha relativa ao início da declaração, coluna); na
+# primeira linha da declaração a coluna também é relativa
+DiagnosticoRelativo = Tuple[str, str, int, int]
+
+
+def diretorio_padrao() -> str:
+    return os.path.join(diretorio_cache_ast(), 'semantica')
+
+
+def assinatura_analisador() -> bytes:
+    """Hash do front-end e do código-fonte do analisador semântico."""
+    global _assinatura
+    if _assinatura is None:
+        h = hashlib.sha256(assinatura_frontend())
+        for nome in sorted(os.listdir(_DIR_SEMANTICA)):
+            if nome.endswith('.py'):
+                with open(os.path.join(_DIR_SEMANTICA, nome), 'rb') as f:
+                    h.update(nome.encode())
+                    h.update(f.read())
+        _assinatura = h.digest()
+    return _assinatura
+
+
+def impressao_digital(fonte: str, decl: ASTNode) -> str:
+    h = hashlib.sha256(assinatura_analisador())
+    h.update(type(decl).__name__.encode())
+    h.update(fonte[decl.span_start:decl.span_end].encode('utf-8'))
+    return h.hexdigest()
+
+
+@dataclass
+class ResultadoUnidade:
+    leituras: Tuple[Leitura, ...]
+    diagnosticos: Tuple[DiagnosticoRelativo, ...]
+
+
+@dataclass
+class EstadoIncremental:
+    """Resultados das declarações de um fonte, por impressão digital."""
+    unidades: Dict[str, ResultadoUnidade] = field(default_factory=dict)
+
+    @classmethod
+    def carregar(cls, caminho: str) -> 'EstadoIncremental':
+        try:
+            with open(caminho, 'rb') as f:
+                estado = pickle.loads(zlib.decompress(f.read()))
+        except Exception:
+            # ausente, corrompido ou de um formato antigo: começa do zero
+            return cls()
+        return estado if isinstance(estado, cls) else cls()
+
+    def salvar(self, caminho: str) -> bool:
+        temporario = None
+        try:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            fd, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(pickle.dumps(self, pickle.HIGHEST_PROTOCOL)))
+            os.replace(temporario, caminho)
+        except OSError:
+            if temporario is not None:
+                try:
+                    os.remove(temporario)
+                except OSError:
+                    pass
+            return False
+        return True
+
+
+def caminho_estado(arquivo: str, diretorio: Optional[str] = None) -> str:
+    chave = hashlib.sha256(os.path.abspath(arquivo).encode('utf-8')).hexdigest()
+    return os.path.join(diretorio or diretorio_padrao(), chave + EXTENSAO)
+
+
+class AnalisadorIncremental(AnalisadorParalelo):
+    """
+    Analisador que reaproveita, de `estado`, os resultados das declarações de
+    topo que não mudaram; as demais são reanalisadas como em
+    `AnalisadorParalelo`, em `jobs` processos. Depois de `analyze`, `estado`
+    tem só as declarações do programa analisado; `reanalisadas` e
+    `reaproveitadas` contam as declarações de cada tipo.
+    """
+    com_leituras = True
+
+    def __init__(self, fonte: str, estado: Optional[EstadoIncremental] = None,
+                 error_handler: Optional[ErrorHandler] = None, jobs: int = 1):
+        super().__init__(error_handler, jobs)
+        self.fonte = fonte
+        self.anterior = estado or EstadoIncremental()
+        self.estado = EstadoIncremental()
+        self.reanalisadas = 0
+        self.reaproveitadas = 0
+        self._chaves: Dict[int, str] = {}  # id(decl) -> impressão digital
+
+    def _reaproveitar(self, decl: ASTNode) -> Optional[List[Erro]]:
+        if decl.span_end < 0:
+            return None
+        chave = self._chaves[id(decl)] = impressao_digital(self.fonte, decl)
+        resultado = self.estado.unidades.get(chave) or self.anterior.unidades.get(chave)
+        if resultado is None or not self._leituras_valem(resultado.leituras):
+            return None
+        self.estado.unidades[chave] = resultado
+        self.reaproveitadas += 1
+        return [_absoluto(d, decl) for d in resultado.diagnosticos]
+
+    def _unidade_analisada(self, decl: ASTNode, erros: List[Erro], leituras: Tuple[Leitura, ...]):
+        self.reanalisadas += 1
+        chave = self._chaves.get(id(decl))
+        if chave is not None:
+            self.estado.unidades[chave] = ResultadoUnidade(leituras, tuple(_relativo(e, decl) for e in erros))
+
+    def _leituras_valem(self, leituras) -> bool:
+        lookup = self.global_scope.lookup
+        for nome, assinatura in leituras:
+            simbolo = lookup(nome)
+            if (simbolo.assinatura() if simbolo else None) != assinatura:
+                return False
+        return True
+
+
+def _relativo(erro: Erro, decl: ASTNode) -> DiagnosticoRelativo:
+    codigo, mensagem, linha, coluna = erro
+    if linha < 0:
+        return erro
+    if linha == decl.line:
+        # na linha da própria declaração a coluna também é relativa
+        return codigo, mensagem, 0, coluna - decl.col
+    return codigo, mensagem, linha - decl.line, coluna
+
+
+def _absoluto(diagnostico: DiagnosticoRelativo, decl: ASTNode) -> Erro:
+    codigo, mensagem, linha, coluna = diagnostico
+    if linha < 0:
+        return diagnostico
+    if linha == 0:
+        coluna += decl.col
+    return codigo, mensagem, linha + decl.line, coluna
+
+
+def analisar_incremental(programa: Programa, fonte: str, arquivo: str,
+                         error_handler: Optional[ErrorHandler] = None,
+                         diretorio: Optional[str] = None, jobs: int = 1) -> AnalisadorIncremental:
+    """
+    Analisa `programa` (de `fonte`, lido de `arquivo`) reaproveitando o estado
+    gravado na última análise do mesmo arquivo, e grava o estado novo.
+    """
+    caminho = caminho_estado(arquivo, diretorio)
+    analisador = AnalisadorIncremental(fonte, EstadoIncremental.carregar(caminho), error_handler, jobs)
+    analisador.analyze(programa)
+    analisador.estado.salvar(caminho)
+    return analisador
@@ -0,0 +1,176 @@
+"""
+Análise semântica em paralelo por declaração de topo.
+
+Depois que `_register_declarations` preenche o escopo global, a análise do
+corpo de uma função (ou de uma classe e seus métodos) só lê o estado global:
+nada do que ela define escapa do próprio escopo. O processo principal faz o
+registro e analisa, em ordem, as instruções de topo, que são as únicas que
+acrescentam globais. Cada função recebe o retrato (`versao`) da lista de
+globais vigente na sua posição do fonte, e as funções são distribuídas em
+lotes contíguos entre os workers de um `ProcessPoolExecutor`. Os workers
+recebem o `Programa` e os retratos uma única vez (no inicializador) e
+devolvem os diagnósticos de cada declaração, que o processo principal
+reporta na ordem do fonte: a saída é a mesma da análise sequencial.
+
+Com poucas declarações, ou `jobs=1`, as mesmas etapas rodam no próprio
+processo. As declarações analisadas em outro processo não recebem as
+anotações de tipo/símbolo no AST; para o codegen, use `SemanticAnalyzer`.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.parser.ast.ast_base import ASTNode, DeclaracaoClasse, DeclaracaoFuncao, Programa
+from src.parser.paralelo import agrupar_faixas
+from src.utils.erros import ErrorHandler, SemanticError
+from .analyzer import SemanticAnalyzer
+from .tabela_simbolos import Symbol, SymbolTable
+
+UNIDADES = (DeclaracaoFuncao, DeclaracaoClasse)
+
+# A análise de um corpo é barata: abaixo disso subir os workers não compensa.
+MIN_UNIDADES_PARALELO = 256
+# Lotes por worker: mais de um para equilibrar corpos de tamanhos diferentes.
+LOTES_POR_WORKER = 4
+
+# (código, mensagem, linha, coluna)
+Erro = Tuple[str, str, int, int]
+# (nome, assinatura do símbolo global encontrado, ou None)
+Leitura = Tuple[str, Optional[tuple]]
+# (índice da declaração em `Programa.declaracoes`, índice do retrato das globais)
+Unidade = Tuple[int, int]
+
+
+def _erros(eh: ErrorHandler) -> List[Erro]:
+    return [(e.code, e.message, e.line, e.col) for e in eh.errors]
+
+
+def _analisador_com_globais(globais: Sequence[Symbol]) -> SemanticAnalyzer:
+    analisador = SemanticAnalyzer(ErrorHandler(buffered=True))
+    escopo = SymbolTable(scope_name="global")
+    for simbolo in globais:
+        escopo.define(simbolo, analisador.error_handler)
+    analisador.global_scope = analisador.current_scope = escopo
+    return analisador
+
+
+def analisar_unidades(programa: Programa, versoes: Sequence[Sequence[Symbol]], lote: Sequence[Unidade],
+                      com_leituras: bool = False) -> List[Tuple[int, List[Erro], Tuple[Leitura, ...]]]:
+    """
+    Analisa as declarações de `lote`, cada uma sobre o seu retrato das
+    globais. Com `com_leituras`, devolve também os nomes globais que cada uma
+    consultou (ver `SymbolTable.registrar_leituras`).
+    """
+    analisadores: Dict[int, SemanticAnalyzer] = {}
+    saida = []
+    for indice, versao in lote:
+        analisador = analisadores.get(versao)
+        if analisador is None:
+            analisador = analisadores[versao] = _analisador_com_globais(versoes[versao])
+        analisador.error_handler = ErrorHandler(buffered=True)
+        leituras: Optional[Dict[str, Optional[Symbol]]] = {} if com_leituras else None
+        analisador.global_scope.registrar_leituras(leituras)
+        try:
+            analisador._analyze_declaration(programa.declaracoes[indice])
+        finally:
+            analisador.global_scope.registrar_leituras(None)
+        lidas = tuple((nome, s.assinatura() if s else None) for nome, s in leituras.items()) if leituras else ()
+        saida.append((indice, _erros(analisador.error_handler), lidas))
+    return saida
+
+
+# ---------- lado do worker ----------
+
+_programa_worker: Optional[Programa] = None
+_versoes_worker: Sequence[Sequence[Symbol]] = ()
+_leituras_worker = False
+
+
+def _iniciar_worker(programa: Programa, versoes: Sequence[Sequence[Symbol]], com_leituras: bool):
+    global _programa_worker, _versoes_worker, _leituras_worker
+    _programa_worker = programa
+    _versoes_worker = versoes
+    _leituras_worker = com_leituras
+
+
+def _analisar_lote(lote: Sequence[Unidade]):
+    return analisar_unidades(_programa_worker, _versoes_worker, lote, _leituras_worker)
+
+
+# ---------- lado do processo principal ----------
+
+def distribuir_unidades(programa: Programa, versoes: Sequence[Sequence[Symbol]], unidades: Sequence[Unidade],
+                        jobs: int = 1, com_leituras: bool = False):
+    """`analisar_unidades` sobre `unidades`, em `jobs` processos se houver unidades suficientes."""
+    if jobs <= 1 or len(unidades) < MIN_UNIDADES_PARALELO:
+        return analisar_unidades(programa, versoes, unidades, com_leituras)
+    # pesos pelo tamanho do fonte de cada declaração, em faixas fictícias [0, peso)
+    declaracoes = programa.declaracoes
+    faixas = [(0, max(1, declaracoes[i].span_end - declaracoes[i].span_start)) for i, _ in unidades]
+    lotes, inicio = [], 0
+    for grupo in agrupar_faixas(faixas, jobs * LOTES_POR_WORKER):
+        lotes.append(unidades[inicio:inicio + len(grupo)])
+        inicio += len(grupo)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(lotes)), initializer=_iniciar_worker,
+                             initargs=(programa, versoes, com_leituras)) as pool:
+        return [r for parte in pool.map(_analisar_lote, lotes) for r in parte]
+
+
+class AnalisadorParalelo(SemanticAnalyzer):
+    """
+    `SemanticAnalyzer` que distribui as declarações de topo entre `jobs`
+    processos (padrão: `os.cpu_count()`). Os diagnósticos saem na mesma ordem
+    da análise sequencial.
+    """
+    com_leituras = False
+
+    def __init__(self, error_handler: Optional[ErrorHandler] = None, jobs: Optional[int] = None):
+        super().__init__(error_handler)
+        self.jobs = jobs or os.cpu_count() or 1
+
+    def analyze(self, program: Programa):
+        self._register_declarations(program)
+
+        erros: Dict[int, List[Erro]] = {}
+        versoes: List[List[Symbol]] = []
+        pendentes: List[Unidade] = []
+        real = self.error_handler
+        for indice, decl in enumerate(program.declaracoes):
+            if isinstance(decl, UNIDADES):
+                # as globais só crescem: um tamanho novo é um retrato novo
+                if not versoes or len(self.global_scope.slots) != len(versoes[-1]):
+                    versoes.append(list(self.global_scope.slots))
+                reaproveitados = self._reaproveitar(decl)
+                if reaproveitados is None:
+                    pendentes.append((indice, len(versoes) - 1))
+                else:
+                    erros[indice] = reaproveitados
+            else:
+                self.error_handler = ErrorHandler(buffered=True)
+                try:
+                    self._analyze_declaration(decl)
+                finally:
+                    erros[indice], self.error_handler = _erros(self.error_handler), real
+
+        for indice, erros_unidade, leituras in distribuir_unidades(program, versoes, pendentes, self.jobs,
+                                                                   self.com_leituras):
+            erros[indice] = erros_unidade
+            self._unidade_analisada(program.declaracoes[indice], erros_unidade, leituras)
+
+        for indice in sorted(erros):
+            for codigo, mensagem, linha, coluna in erros[indice]:
+                real.report_error(SemanticError(mensagem, linha, coluna, codigo))
+
+    def _reaproveitar(self, decl: ASTNode) -> Optional[List[Erro]]:
+        """Diagnósticos já conhecidos de `decl` no estado global atual; None para analisá-la."""
+        return None
+
+    def _unidade_analisada(self, decl: ASTNode, erros: List[Erro], leituras: Tuple[Leitura, ...]):
+        pass
+
+
+def analisar_paralelo(programa: Programa, error_handler: Optional[ErrorHandler] = None,
+                      jobs: Optional[int] = None) -> AnalisadorParalelo:
+    analisador = AnalisadorParalelo(error_handler, jobs)
+    analisador.analyze(programa)
+    return analisador
@@ -1,25 +1,61 @@
+import sys
+from dataclasses import dataclass
 from typing import Optional, Dict, List
 from src.utils.erros import ErrorHandler, SemanticError
 
+
+@dataclass(slots=True)
 class Symbol:
     """Representa um símbolo (variável, função, etc.) na Tabela de Símbolos."""
-    def __init__(self, name: str, type_: str, kind: str, line: int = -1, col: int = -1, **kwargs):
-        self.name = name
-        self.type = type_
-        self.kind = kind
-        self.line = line
-        self.col = col
+    name: str
+    type: str
+    kind: str
+    line: int = -1
+    col: int = -1
+    # funções e métodos
+    param_count: int = 0
+    is_procedure: bool = False
+    # classes: campo -> tipo
+    fields: Optional[Dict[str, str]] = None
+    # Endereço léxico (profundidade do escopo, posição nele), dado por `SymbolTable.define`
+    profundidade: int = -1
+    slot: int = -1
+
+    def __post_init__(self):
+        # nomes vindos do lexer já são internados; isto cobre os criados em outros pontos
+        self.name = sys.intern(self.name)
+
+    def assinatura(self) -> tuple:
+        """O que a análise de outra declaração pode observar deste símbolo."""
+        campos = tuple(self.fields.items()) if self.fields else None
+        return self.kind, self.type, self.param_count, self.is_procedure, campos
 
-        for k, v in kwargs.items():
-            setattr(self, k, v)
 
 class SymbolTable:
-    """Gerencia a Tabela de Símbolos e escopos aninhados."""
+    """
+    Gerencia a Tabela de Símbolos e escopos aninhados.
+
+    Cada escopo guarda seus símbolos em `slots`, na ordem de declaração, e dá a
+    cada um o endereço (profundidade, slot). Os escopos abertos de uma mesma
+    árvore compartilham uma tabela plana, nome -> pilha dos símbolos visíveis
+    com esse nome, ordenada por profundidade (o do escopo mais interno no
+    topo, mesmo se definido num escopo externo depois): resolver um nome é um
+    acesso a dicionário, sem subir a cadeia de pais. Só escopos já fechados
+    (consultados depois da análise) resolvem pela cadeia.
+    """
+    __slots__ = ('parent', 'scope_name', 'symbols', 'children', 'profundidade', 'slots',
+                 '_visiveis', '_aberto', '_leituras')
+
     def __init__(self, parent: Optional['SymbolTable'] = None, scope_name: str = "global"):
         self.parent = parent
         self.scope_name = scope_name
         self.symbols: Dict[str, Symbol] = {} # name -> Symbol
         self.children: List['SymbolTable'] = [] # Child SymbolTable objects
+        self.profundidade = parent.profundidade + 1 if parent else 0
+        self.slots: List[Symbol] = []
+        self._visiveis: Dict[str, List[Symbol]] = parent._visiveis if parent else {}
+        self._aberto = True
+        self._leituras: Optional[Dict[str, Optional[Symbol]]] = parent._leituras if parent else None
 
     def define(self, symbol: Symbol, error_handler: ErrorHandler) -> bool:
         """Define um novo símbolo no escopo atual, verificando redeclaração (SEM001)."""
@@ -29,16 +65,52 @@ class SymbolTable:
                 symbol.line, symbol.col, "SEM001"
             ))
             return False
+        symbol.profundidade = self.profundidade
+        symbol.slot = len(self.slots)
+        self.slots.append(symbol)
         self.symbols[symbol.name] = symbol
+        if self._aberto:
+            pilha = self._visiveis.get(symbol.name)
+            if pilha is None:
+                self._visiveis[symbol.name] = [symbol]
+            else:
+                # A pilha fica ordenada por profundidade: definir num escopo
+                # externo com um filho ainda aberto não pode cobrir o símbolo
+                # do filho (nem ser o removido quando o filho fechar).
+                i = len(pilha)
+                while i and pilha[i - 1].profundidade > self.profundidade:
+                    i -= 1
+                pilha.insert(i, symbol)
         return True
 
     def lookup(self, name: str) -> Optional[Symbol]:
         """Procura um símbolo, começando no escopo atual e subindo para os pais."""
-        if name in self.symbols:
-            return self.symbols[name]
-        if self.parent:
-            return self.parent.lookup(name)
-        return None
+        if not self._aberto:
+            if name in self.symbols:
+                return self.symbols[name]
+            if self.parent:
+                return self.parent.lookup(name)
+            return None
+        encontrado = None
+        pilha = self._visiveis.get(name)
+        if pilha:
+            # Os escopos abertos formam uma cadeia só: entre os visíveis, os de
+            # profundidade <= a deste escopo são os declarados nele ou nos pais.
+            for symbol in reversed(pilha):
+                if symbol.profundidade <= self.profundidade:
+                    encontrado = symbol
+                    break
+        if self._leituras is not None and (encontrado is None or encontrado.profundidade == 0):
+            self._leituras[name] = encontrado
+        return encontrado
+
+    def registrar_leituras(self, destino: Optional[Dict[str, Optional[Symbol]]]):
+        """
+        Anota em `destino` cada nome consultado a partir deste escopo (e dos
+        filhos abertos depois da chamada) que resolve no escopo global ou em
+        nenhum, com o símbolo encontrado. `None` desliga o registro.
+        """
+        self._leituras = destino
 
     def enter_scope(self, scope_name: str = "local") -> 'SymbolTable':
         """Cria e entra em um novo escopo aninhado."""
@@ -50,4 +122,11 @@ class SymbolTable:
         """Retorna ao escopo pai."""
         if self.parent is None:
             raise Exception("Não é possível sair do escopo global.")
-        return self.parent
\ No newline at end of file
+        if self._aberto:
+            for symbol in self.slots:
+                pilha = self._visiveis[symbol.name]
+                pilha.pop()
+                if not pilha:
+                    del self._visiveis[symbol.name]
+            self._aberto = False
+        return self.parent
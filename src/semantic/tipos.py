@@ -0,0 +1,127 @@
+"""
+Universo de tipos internados.
+
+Cada nome de tipo ('int', 'dna', 'Ponto', 'Array<int>'...) corresponde a um
+único objeto `Tipo`, criado na primeira vez que o nome aparece, com um `id`
+inteiro sequencial. Os primitivos têm ids fixos, os de `PRIMITIVOS`. `Tipo`
+herda de `str`: `tipo('int') == 'int'`, as mensagens de erro continuam
+mostrando o nome e o código que compara tipos com strings continua valendo.
+
+O resultado dos operadores binários entre primitivos é calculado uma vez, na
+importação, para uma tabela indexada por (operador, tipo da esquerda, tipo da
+direita), só com as combinações válidas. Verificar um operador vira uma
+consulta a um dicionário (o hash de um `Tipo` é o da string, já calculado),
+sem os testes de pertinência a conjuntos que as regras fazem
+(`_regra_binaria`). Qualquer operação que envolva um tipo não primitivo
+(classe, array, genérico) fica fora da tabela e é inválida, como nas regras.
+Com 'unknown_type' também, mas o analisador não acusa esse caso: o operando
+desconhecido já teve o seu erro reportado (ou é algo que ele não tipa).
+"""
+from typing import Dict, List, Optional, Tuple
+
+
+class Tipo(str):
+    """Nome de tipo canônico. Compare com `is` ou pelo `id`."""
+    id: int
+
+    def __reduce__(self):
+        # desserializar (cache, outros processos) reinterna no universo local
+        return tipo, (str(self),)
+
+
+PRIMITIVOS = ('unknown_type', 'void', 'int', 'float', 'decimal', 'bool', 'char', 'string',
+              'dna', 'rna', 'prot', 'Nbase', 'double')
+
+_universo: List[Tipo] = []
+_por_nome: Dict[str, Tipo] = {}
+
+
+def tipo(nome: Optional[str]) -> Optional[Tipo]:
+    """O `Tipo` canônico de `nome`, criado na primeira consulta. None continua None."""
+    if nome is None or type(nome) is Tipo:
+        return nome
+    t = _por_nome.get(nome)
+    if t is None:
+        t = Tipo(nome)
+        t.id = len(_universo)
+        _universo.append(t)
+        _por_nome[str(nome)] = t
+    return t
+
+
+def por_id(id_: int) -> Tipo:
+    return _universo[id_]
+
+
+DESCONHECIDO, VOID, INT, FLOAT, DECIMAL, BOOL, CHAR, STRING, DNA, RNA, PROT, NBASE, DOUBLE = \
+    map(tipo, PRIMITIVOS)
+
+N_PRIMITIVOS = len(PRIMITIVOS)
+
+NUMERICOS = frozenset((INT, FLOAT, DECIMAL, DOUBLE))
+BIOLOGICOS = frozenset((DNA, RNA, PROT))
+# Um literal de um caractere é 'char', mas no código gerado é uma string como as outras.
+TEXTUAIS = frozenset((STRING, CHAR))
+
+OPERADORES_ARITMETICOS = ('+', '-', '*', '/', '%', '**')
+OPERADORES_BIT_A_BIT = ('&', '|', '^', '<<', '>>')
+OPERADORES_COMPARACAO = ('==', '!=', '>', '<', '>=', '<=')
+OPERADORES_LOGICOS = ('&&', '||')
+OPERADORES_BINARIOS = (OPERADORES_ARITMETICOS + OPERADORES_BIT_A_BIT + OPERADORES_COMPARACAO +
+                       OPERADORES_LOGICOS + ('->',))
+
+
+def _regra_binaria(op: str, esq: Tipo, dir_: Tipo) -> Optional[Tipo]:
+    """As regras de tipagem dos operadores binários, de onde sai a tabela."""
+    if op in OPERADORES_ARITMETICOS:
+        if esq in NUMERICOS and dir_ in NUMERICOS:
+            if DECIMAL in (esq, dir_):
+                return DECIMAL
+            if FLOAT in (esq, dir_):
+                return FLOAT
+            if DOUBLE in (esq, dir_):
+                return DOUBLE
+            return INT
+        # Concatenação de strings (e chars) e de tipos biológicos
+        if op == '+' and esq in TEXTUAIS and dir_ in TEXTUAIS:
+            return STRING
+        if op == '+' and esq is dir_ and esq in BIOLOGICOS:
+            return esq
+        return None
+
+    if op in OPERADORES_BIT_A_BIT:
+        if esq is INT and dir_ is INT:
+            return INT
+        return None
+
+    if op in OPERADORES_COMPARACAO:
+        if (esq in NUMERICOS and dir_ in NUMERICOS) or \
+           (esq in TEXTUAIS and dir_ in TEXTUAIS) or \
+           (esq is dir_ and esq in BIOLOGICOS):
+            return BOOL
+        return None
+
+    if op in OPERADORES_LOGICOS:
+        if esq is BOOL and dir_ is BOOL:
+            return BOOL
+        return None
+
+    if op == '->' and esq is DNA and dir_ is RNA:
+        return RNA
+
+    return None
+
+
+_RESULTADOS: Dict[Tuple[str, Tipo, Tipo], Tipo] = {}
+for _op in OPERADORES_BINARIOS:
+    for _esq in _universo[:N_PRIMITIVOS]:
+        for _dir in _universo[:N_PRIMITIVOS]:
+            _res = _regra_binaria(_op, _esq, _dir)
+            if _res is not None:
+                _RESULTADOS[_op, _esq, _dir] = _res
+del _op, _esq, _dir, _res
+
+
+def resultado_binario(op: str, esq: Tipo, dir_: Tipo) -> Optional[Tipo]:
+    """Tipo de `esq op dir_`, ou None se a operação é inválida."""
+    return _RESULTADOS.get((op, esq, dir_))
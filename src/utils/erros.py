@@ -1,14 +1,22 @@
+from typing import List, Optional
+
+
 class BaseError(Exception):
-    def __init__(self, message: str, line: int, col: int, code: str):
+    def __init__(self, message: str, line: int, col: int, code: str,
+                 end_line: Optional[int] = None, end_col: Optional[int] = None):
         self.message = message
         self.line = line
         self.col = col
         self.code = code
+        # fim (exclusivo) do trecho, quando o erro cobre mais de um caractere
+        self.end_line = end_line
+        self.end_col = end_col
         super().__init__(f"{code}: {message} (Linha: {line}, Coluna: {col})")
 
 class LexicalError(BaseError):
-    def __init__(self, message: str, line: int, col: int, code: str = "LEX000"):
-        super().__init__(message, line, col, code)
+    def __init__(self, message: str, line: int, col: int, code: str = "LEX000",
+                 end_line: Optional[int] = None, end_col: Optional[int] = None):
+        super().__init__(message, line, col, code, end_line, end_col)
 
 class SyntaxError(BaseError):
     def __init__(self, message: str, line: int, col: int, code: str = "SYN000"):
@@ -18,13 +26,53 @@ class SemanticError(BaseError):
     def __init__(self, message: str, line: int, col: int, code: str = "SEM000"):
         super().__init__(message, line, col, code)
 
+class CompilationError(Exception):
+    """
+    Compilação interrompida por erros de uma etapa (`stage`). Os erros já
+    foram reportados ao `ErrorHandler` da etapa; `errors` guarda a lista.
+    """
+    def __init__(self, stage: str, errors: List[BaseError]):
+        self.stage = stage
+        self.errors = list(errors)
+        super().__init__(f"{len(self.errors)} erro(s) na {stage}")
+
 class ErrorHandler:
-    def __init__(self):
+    """
+    Acumula os erros reportados pelas etapas do compilador.
+
+    Por padrão cada erro é impresso ao ser reportado. Com `buffered=True`
+    nada é impresso até `flush()`. Com `max_errors`, erros além do limite são
+    apenas contados e `limit_reached()` sinaliza às etapas que devem parar.
+    """
+    def __init__(self, buffered: bool = False, max_errors: Optional[int] = None):
         self.errors = []
+        self.buffered = buffered
+        self.max_errors = max_errors
+        self.suppressed = 0
+        self._emitted = 0
 
     def report_error(self, error: BaseError):
+        if self.limit_reached():
+            self.suppressed += 1
+            return
         self.errors.append(error)
-        print(error)
+        if not self.buffered:
+            print(error)
+            self._emitted = len(self.errors)
 
     def has_errors(self) -> bool:
-        return bool(self.errors)
\ No newline at end of file
+        return bool(self.errors)
+
+    def limit_reached(self) -> bool:
+        return self.max_errors is not None and len(self.errors) >= self.max_errors
+
+    def flush(self) -> List[BaseError]:
+        """Imprime os erros ainda não emitidos e os retorna."""
+        pending = self.errors[self._emitted:]
+        for error in pending:
+            print(error)
+        self._emitted = len(self.errors)
+        if self.suppressed:
+            print(f"... {self.suppressed} erro(s) omitido(s): limite de {self.max_errors} atingido")
+            self.suppressed = 0
+        return pending
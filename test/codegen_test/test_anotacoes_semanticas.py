@@ -0,0 +1,141 @@
+import copy
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import codon
+from src.codegen.llvm_codegen import LLVMCodeGenerator
+from src.compilador import compile_cd
+from src.frontend import analisar
+from src.parser.ast.ast_base import ExpressaoBinaria, InstrucaoRetorno
+from src.semantic.analyzer import SemanticAnalyzer
+from src.utils.erros import CompilationError, ErrorHandler
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+
+# compila (o codegen aceita condição int), mas tem um erro semântico (SEM018)
+COM_ERRO_SEMANTICO = 'function main(): int {\n    if (1) { print("oi"); }\n    return 0;\n}\n'
+
+FONTE = """
+function media(total: decimal, n: int): decimal {
+    return total / n;
+}
+
+function main(): void {
+    nome = "Ana";
+    saudacao = "Oi, " + nome;
+    m = media(7.0, 2);
+    if (m > 3) {
+        print(saudacao, m);
+    }
+}
+"""
+
+
+def programa_anotado(fonte=FONTE):
+    programa = analisar(fonte, ErrorHandler(buffered=True))
+    sem_anotacoes = copy.deepcopy(programa)
+    eh = ErrorHandler(buffered=True)
+    SemanticAnalyzer(eh).analyze(programa)
+    return programa, sem_anotacoes, eh
+
+
+class TestAnotacoesSemanticas(unittest.TestCase):
+
+    def test_expressoes_anotadas(self):
+        programa, _, eh = programa_anotado()
+        self.assertFalse(eh.has_errors(), eh.errors)
+        ret = programa.declaracoes[0].corpo[0]
+        self.assertIsInstance(ret, InstrucaoRetorno)
+        divisao = ret.expressao
+        self.assertIsInstance(divisao, ExpressaoBinaria)
+        self.assertEqual(divisao.tipo_resolvido, 'decimal')
+        self.assertEqual(divisao.direita.tipo_resolvido, 'int')
+        self.assertEqual(divisao.esquerda.simbolo.kind, 'param')
+
+        chamada = programa.declaracoes[1].corpo[2].valor
+        self.assertEqual(chamada.tipo_resolvido, 'decimal')
+        self.assertEqual(chamada.simbolo.name, 'media')
+
+    def test_anotacoes_fora_da_igualdade_e_do_repr(self):
+        programa, sem_anotacoes, _ = programa_anotado()
+        self.assertEqual(programa, sem_anotacoes)
+        self.assertEqual(repr(programa), repr(sem_anotacoes))
+
+    def test_ir_igual_com_e_sem_anotacoes(self):
+        programa, sem_anotacoes, _ = programa_anotado()
+        anotado = LLVMCodeGenerator().generate(programa)
+        self.assertEqual(anotado, LLVMCodeGenerator().generate(sem_anotacoes))
+        self.assertIn('sitofp', anotado)
+        self.assertIn('fdiv', anotado)
+        self.assertIn('fcmp', anotado)
+        self.assertIn('strcat', anotado)
+
+    def test_classe_pelas_anotacoes(self):
+        # vale a anotação, não o tipo declarado; sem ela o codegen olha o IR
+        programa = analisar("function f(a: int, b: int): int { return a + b; }", ErrorHandler(buffered=True))
+        soma = programa.declaracoes[0].corpo[0].expressao
+        soma.esquerda.tipo_resolvido = 'float'
+        soma.direita.tipo_resolvido = 'int'
+        self.assertEqual(LLVMCodeGenerator()._classe_operandos(soma), 'float')
+        soma.esquerda.tipo_resolvido = None
+        self.assertIsNone(LLVMCodeGenerator()._classe_operandos(soma))
+
+
+def exemplos_validos():
+    """Os .cd de `examples/`, exceto os que existem para mostrar erros."""
+    for root, _, files in os.walk(EXAMPLES_DIR):
+        for fname in sorted(files):
+            if fname.endswith('.cd') and 'erro' not in fname:
+                yield os.path.join(root, fname)
+
+
+class TestDiagnosticosSemanticosNaCompilacao(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.com_erro = os.path.join(self._tmp.name, 'com_erro.cd')
+        with open(self.com_erro, 'w', encoding='utf-8') as f:
+            f.write(COM_ERRO_SEMANTICO)
+
+    def test_exemplos_validos_sem_avisos(self):
+        for caminho in exemplos_validos():
+            with self.subTest(exemplo=os.path.relpath(caminho, EXAMPLES_DIR)):
+                erros = io.StringIO()
+                with redirect_stdout(io.StringIO()), redirect_stderr(erros):
+                    compile_cd(caminho, estrito=True)
+                self.assertNotIn('[AVISO]', erros.getvalue())
+
+    def test_erros_viram_avisos(self):
+        erros = io.StringIO()
+        with redirect_stdout(io.StringIO()), redirect_stderr(erros):
+            llvm_ir = compile_cd(self.com_erro)
+        self.assertIn('define', llvm_ir)
+        self.assertIn('[AVISO]', erros.getvalue())
+        self.assertIn('SEM018', erros.getvalue())
+
+    def test_modo_estrito_interrompe(self):
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            with self.assertRaises(CompilationError) as ctx:
+                compile_cd(self.com_erro, estrito=True)
+        self.assertEqual(ctx.exception.stage, 'análise semântica')
+        self.assertEqual([e.code for e in ctx.exception.errors], ['SEM018'])
+
+    def test_build_strict_falha(self):
+        saida, erros = io.StringIO(), io.StringIO()
+        argv = ['codon', 'build', self.com_erro, '--quiet', '--no-cache', '--strict']
+        with mock.patch.object(sys, 'argv', argv), redirect_stdout(saida), redirect_stderr(erros):
+            with self.assertRaises(SystemExit) as ctx:
+                codon.main()
+        self.assertEqual(ctx.exception.code, 1)
+        self.assertNotIn('define', saida.getvalue())
+        self.assertIn('Falha na compilação', erros.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
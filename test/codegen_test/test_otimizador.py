@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from src.codegen.otimizador import dobrar_constantes
+from src.compilador import compile_cd
+from src.lexer.analisador_lexico_completo import Lexer, TokenStreamIndexado
+from src.parser.ast.arena import Arena
+from src.parser.ast.ast_base import ExpressaoBinaria, Literal, Variavel
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.utils.erros import ErrorHandler
+
+
+def dobrar(expr):
+    src = f"x = {expr};"
+    eh = ErrorHandler(buffered=True)
+    programa = ParserPratt(TokenStreamIndexado(Lexer(src, eh)), eh).parse()
+    return dobrar_constantes(Arena.do_programa(programa)).para_programa().declaracoes[0].valor, src
+
+
+class TestDobramentoConstantes(unittest.TestCase):
+
+    def test_aritmetica_inteira(self):
+        self.assertEqual(dobrar("2 * 3 + 4")[0], Literal(10))
+        self.assertEqual(dobrar("-(2 - 5)")[0], Literal(3))
+        self.assertEqual(dobrar("7 / -2")[0], Literal(-3))
+        self.assertEqual(dobrar("-7 % 2")[0], Literal(-1))
+
+    def test_wrap_i32(self):
+        self.assertEqual(dobrar("2147483647 + 1")[0], Literal(-2147483648))
+        self.assertEqual(dobrar("65536 * 65536")[0], Literal(0))
+
+    def test_float(self):
+        self.assertEqual(dobrar("1.5 * 2.0")[0], Literal(3.0))
+        self.assertIsInstance(dobrar("1.5 * 2.0")[0].valor, float)
+
+    def test_nao_dobra(self):
+        for expr in ("1 / 0", "1 % 0", "1 + 2.0", "a + 1", "1 < 2", '"a" + "b"', "true && false"):
+            with self.subTest(expr=expr):
+                self.assertNotIsInstance(dobrar(expr)[0], Literal)
+
+    def test_dobra_parcial_e_spans(self):
+        valor, src = dobrar("a * (2 + 3)")
+        self.assertEqual(valor, ExpressaoBinaria(Variavel("a"), "*", Literal(5)))
+        self.assertEqual(src[valor.direita.span_start:valor.direita.span_end], "2 + 3")
+        self.assertEqual(src[valor.span_start:valor.span_end], "a * (2 + 3)")
+
+    def test_compile_cd_dobra(self):
+        with tempfile.TemporaryDirectory() as d:
+            caminho = os.path.join(d, 'prog.cd')
+            with open(caminho, 'w', encoding='utf-8') as f:
+                f.write("function main(): int {\n    x = 2 * 3 + 4;\n    print(x);\n    return 0;\n}\n")
+            ir = compile_cd(caminho, otimizar=True)
+            sem_otimizar = compile_cd(caminho)
+        self.assertIn('store i32 10, i32* %"x"', ir)
+        self.assertNotIn('mul i32', ir)
+        self.assertIn('mul i32', sem_otimizar)
+
+
+if __name__ == '__main__':
+    unittest.main()
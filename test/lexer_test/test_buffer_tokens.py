@@ -0,0 +1,53 @@
+import os
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer, TokenStream
+from src.lexer.buffer_tokens import TIPOS_TOKEN, TokenBuffer, TokenView
+from src.parser.ast.ast_base import Parser
+from src.utils.erros import ErrorHandler
+from test.lexer_test.test_lexer_afd import CASOS, EXAMPLES_DIR
+
+
+def exemplos():
+    for root, _, files in os.walk(EXAMPLES_DIR):
+        for fname in sorted(files):
+            if fname.endswith('.cd'):
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    yield fname, f.read()
+
+
+class TestTokenBuffer(unittest.TestCase):
+    """O buffer em colunas deve expor os mesmos tokens do Lexer."""
+
+    def test_mesmos_tokens(self):
+        for src in CASOS + [src for _, src in exemplos()]:
+            with self.subTest(src=src[:40]):
+                esperado = Lexer(src, error_handler=ErrorHandler()).tokenize_all()
+                buf = TokenBuffer.tokenizar(src, ErrorHandler())
+                self.assertEqual(len(buf), len(esperado))
+                self.assertEqual(buf.para_tokens(), esperado)
+                self.assertEqual(list(buf), esperado)
+
+    def test_visao(self):
+        buf = TokenBuffer.tokenizar('var x = "oi";')
+        v = buf[-2]
+        self.assertIsInstance(v, TokenView)
+        self.assertEqual((v.tipo, v.valor, v.linha, v.coluna), ('STRING', '"oi"', 1, 9))
+        self.assertEqual(buf.tipo(0), 'KWD')
+        self.assertEqual(buf.tipos.typecode, 'B')
+        self.assertLess(len(TIPOS_TOKEN), 256)
+        with self.assertRaises(IndexError):
+            buf[len(buf)]
+
+    def test_parser_consome_buffer(self):
+        for fname, src in exemplos():
+            if fname.startswith('erro') or 'error' in fname:
+                continue
+            with self.subTest(arquivo=fname):
+                ast_lexer = Parser(TokenStream(Lexer(src))).parse()
+                ast_buffer = Parser(TokenStream(TokenBuffer.tokenizar(src))).parse()
+                self.assertEqual(ast_lexer, ast_buffer)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import unittest
+from unittest import mock
+
+from src import frontend
+from src.lexer import tokens as tokens_legados
+from src.lexer.analisador_lexico import analise_lexica
+from src.lexer.analisador_lexico_completo import Lexer, LexerRegexMestre, TokenStream, TokenStreamIndexado
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.buffer_tokens import TIPOS_TOKEN
+from src.lexer.protocolo import FluxoTokens, TipoToken
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.utils.erros import ErrorHandler
+from test.lexer_test.test_lexer_afd import EXAMPLES_DIR
+
+
+def exemplos():
+    for root, _, files in os.walk(EXAMPLES_DIR):
+        for fname in sorted(files):
+            if fname.endswith('.cd'):
+                with open(os.path.join(root, fname), encoding='utf-8') as f:
+                    yield fname, f.read()
+
+
+class TestFrontend(unittest.TestCase):
+
+    def test_tipo_token_e_str(self):
+        self.assertEqual(TipoToken.SEMI, 'SEMI')
+        self.assertEqual(str(TipoToken.KWD), 'KWD')
+        self.assertEqual(TIPOS_TOKEN, [t.value for t in TipoToken])
+
+    def test_todos_os_lexers_usam_os_mesmos_tipos(self):
+        for fname, src in exemplos():
+            for lexer_cls in (Lexer, LexerRegexMestre, LexerAFD):
+                with self.subTest(arquivo=fname, lexer=lexer_cls.__name__):
+                    tipos = {t.tipo for t in lexer_cls(src, ErrorHandler(buffered=True)).tokenize_all()}
+                    self.assertLessEqual(tipos, set(TipoToken))
+
+    def test_fluxos_seguem_o_protocolo(self):
+        for fluxo in (TokenStream(Lexer('x;')), TokenStreamIndexado([]), frontend.fluxo('x;')):
+            self.assertIsInstance(fluxo, FluxoTokens)
+
+    def test_analisar_igual_ao_parser_sobre_lexer(self):
+        for fname, src in exemplos():
+            with self.subTest(arquivo=fname):
+                eh = ErrorHandler(buffered=True)
+                try:
+                    esperado = ParserPratt(TokenStreamIndexado(Lexer(src, eh)), eh).parse()
+                except Exception:
+                    continue
+                self.assertEqual(frontend.analisar(src, ErrorHandler(buffered=True)), esperado)
+
+    def test_analise_lexica_delega(self):
+        src = 'function main(): int { var int x = 10; return x; }'
+        esperado = [(t.tipo, t.valor, t.linha, t.coluna) for t in frontend.tokenizar(src)]
+        self.assertEqual([tuple(t) for t in analise_lexica(src)], esperado)
+        with mock.patch('builtins.print'):
+            erro = analise_lexica('var x = 1; $')
+        self.assertEqual([t.tipo for t in erro], ['LEXICAL_ERROR'])
+
+    def test_token_stream_legado(self):
+        self.assertIn('procedure', tokens_legados.KEYWORDS)
+        self.assertIn(TipoToken.CHAR_LIT, tokens_legados.TOKEN_KINDS)
+        ts = tokens_legados.TokenStream.do_fonte('x = 42 + 1.5;')
+        self.assertEqual(ts.expect('ID').valor, 'x')
+        ts.expect('ASSIGN')
+        self.assertEqual(ts.next().literal, 42)
+        ts.next()
+        self.assertEqual(ts.next().literal, 1.5)
+        ts.expect('SEMI')
+        self.assertEqual(ts.peek().tipo, 'EOF')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import pickle
+import unittest
+
+from src.lexer.analisador_lexico_completo import PALAVRAS_CHAVE, Lexer, TokenStream
+from src.lexer.buffer_tokens import TokenBuffer
+from src.lexer.identificadores import TabelaIdentificadores
+
+
+class TestTabelaIdentificadores(unittest.TestCase):
+
+    def test_palavras_chave_pre_resolvidas(self):
+        tabela = TabelaIdentificadores(PALAVRAS_CHAVE)
+        self.assertEqual(tabela.total_palavras_chave, len(PALAVRAS_CHAVE))
+        tipo, codigo, nome = tabela.resolver('while')
+        self.assertEqual((tipo, nome), ('KWD', 'while'))
+        self.assertTrue(tabela.e_palavra_chave(codigo))
+        self.assertEqual(len(tabela), len(PALAVRAS_CHAVE))
+
+    def test_codigos_estaveis_e_nomes_internados(self):
+        tabela = TabelaIdentificadores(PALAVRAS_CHAVE)
+        src = 'var contador = 0; contador = contador + outro;'
+        toks = Lexer(src, tabela_ids=tabela).tokenize_all()
+        ids = [t for t in toks if t.tipo == 'ID']
+        self.assertEqual([t.valor for t in ids], ['contador', 'contador', 'contador', 'outro'])
+        self.assertEqual(len({t.codigo_id for t in ids}), 2)
+        self.assertIs(ids[0].valor, ids[1].valor)
+        self.assertIs(ids[0].valor, tabela.nome(ids[0].codigo_id))
+        self.assertFalse(tabela.e_palavra_chave(ids[0].codigo_id))
+        self.assertIsNone(toks[3].codigo_id)  # literal numérico
+
+    def test_buffer_guarda_codigos(self):
+        tabela = TabelaIdentificadores(PALAVRAS_CHAVE)
+        buf = TokenBuffer.tokenizar('x = y + x;', lexer_cls=lambda s, error_handler: Lexer(s, error_handler, tabela))
+        self.assertEqual([v.codigo_id for v in buf], [tabela.codigo('x'), None, tabela.codigo('y'), None,
+                                                      tabela.codigo('x'), None])
+        ts = TokenStream(buf)
+        self.assertEqual(ts.next().codigo_id, tabela.codigo('x'))
+
+    def test_tabela_por_lexer(self):
+        # sem tabela explícita, cada lexer parte só das palavras-chave
+        Lexer('nome_de_um_arquivo = 1;').tokenize_all()
+        lexer = Lexer('outro = 2;')
+        lexer.tokenize_all()
+        self.assertNotIn('nome_de_um_arquivo', lexer.tabela_ids)
+        self.assertEqual(len(lexer.tabela_ids), len(PALAVRAS_CHAVE) + 1)
+
+    def test_buffer_leva_a_tabela(self):
+        buf = pickle.loads(pickle.dumps(TokenBuffer.tokenizar('alfa = beta + alfa;')))
+        self.assertEqual([buf.tabela_ids.nome(v.codigo_id) for v in buf if v.tipo == 'ID'],
+                         ['alfa', 'beta', 'alfa'])
+
+
+if __name__ == "__main__":
+    unittest.main()
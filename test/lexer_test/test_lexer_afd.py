@@ -0,0 +1,59 @@
+import json
+import os
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.tabelas import ARQUIVO_AFD, assinatura_regras
+from src.utils.erros import ErrorHandler
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+
+CASOS = [
+    'var x = 42;\nif (x > 0) x = x - 1;',
+    '/" bloco\n com "aspas" "/ x /" sem fechar',
+    'a <<= 1; b >>= 2; c ** d; e++ --f; g...h..i',
+    '1.5e-3 2E+7 3.14 10 1. 1.e5 1..2',
+    'dna"ACGT" rna"AC\\"GU" prot"MK\\\\" dna"sem fechar',
+    '"texto \\" com escape" "linha\nquebrada" "\\\\"',
+    "'a' 'n' '\\n' '''",
+    'x $ y @ z # w',
+    'identificador_1 _x dnax rna ação',
+]
+
+
+def tokenizar(lexer_cls, src):
+    eh = ErrorHandler()
+    toks = lexer_cls(src, error_handler=eh).tokenize_all()
+    return toks, [str(e) for e in eh.errors]
+
+
+class TestLexerAFD(unittest.TestCase):
+    """O lexer dirigido por tabela deve produzir os mesmos tokens do Lexer por regex."""
+
+    def test_casos_limite(self):
+        for src in CASOS:
+            with self.subTest(src=src):
+                self.assertEqual(tokenizar(Lexer, src), tokenizar(LexerAFD, src))
+
+    def test_exemplos(self):
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if not fname.endswith('.cd'):
+                    continue
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    src = f.read()
+                with self.subTest(arquivo=fname):
+                    self.assertEqual(tokenizar(Lexer, src), tokenizar(LexerAFD, src))
+
+    def test_tabelas_atualizadas(self):
+        with open(ARQUIVO_AFD, 'r', encoding='utf-8') as f:
+            tabelas = json.load(f)
+        self.assertEqual(
+            tabelas['assinatura'], assinatura_regras(),
+            "Tabelas desatualizadas: execute 'python tools/gerador_tabelas.py'"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import contextlib
+import io
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer
+from src.utils.erros import ErrorHandler, LexicalError
+
+
+class TestLexerRecuperacao(unittest.TestCase):
+    """Sequências de caracteres inválidos, limite de erros e modo bufferizado."""
+
+    def test_sequencia_vira_um_erro(self):
+        eh = ErrorHandler(buffered=True)
+        toks = Lexer('x = 1 $@#\n$$ y', error_handler=eh).tokenize_all()
+        self.assertEqual([t.valor for t in toks], ['x', '=', '1', 'y'])
+        self.assertEqual(len(eh.errors), 2)
+        primeiro, segundo = eh.errors
+        self.assertIsInstance(primeiro, LexicalError)
+        self.assertIn("3 caracteres não reconhecidos '$@#'", primeiro.message)
+        self.assertEqual((primeiro.line, primeiro.col, primeiro.end_line, primeiro.end_col), (1, 7, 1, 10))
+        self.assertEqual((segundo.line, segundo.end_line), (2, 2))
+
+    def test_caractere_isolado_mantem_mensagem(self):
+        eh = ErrorHandler(buffered=True)
+        Lexer('a $ b', error_handler=eh).tokenize_all()
+        self.assertEqual(eh.errors[0].message, "Caractere não reconhecido '$'")
+
+    def test_limite_interrompe(self):
+        eh = ErrorHandler(buffered=True, max_errors=3)
+        toks = Lexer('a $ b $ c $ d $ e $ f', error_handler=eh).tokenize_all()
+        self.assertEqual(len(eh.errors), 3)
+        self.assertTrue(eh.limit_reached())
+        self.assertEqual([t.valor for t in toks], ['a', 'b', 'c'])
+
+    def test_modo_bufferizado_so_imprime_no_flush(self):
+        eh = ErrorHandler(buffered=True, max_errors=1)
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            Lexer('$ a', error_handler=eh).tokenize_all()
+            eh.report_error(LexicalError("extra", 1, 1))
+        self.assertEqual(saida.getvalue(), '')
+        self.assertEqual(eh.suppressed, 1)
+        with contextlib.redirect_stdout(saida):
+            emitidos = eh.flush()
+        self.assertEqual(len(emitidos), 1)
+        self.assertIn('LEX000', saida.getvalue())
+        self.assertIn('1 erro(s) omitido(s)', saida.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import os
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer, LexerRegexMestre
+from test.lexer_test.test_lexer_afd import CASOS, EXAMPLES_DIR, tokenizar
+
+
+class TestLexerRegexMestre(unittest.TestCase):
+    """A regex mestre deve reproduzir exatamente os tokens do Lexer regra a regra."""
+
+    def test_casos_limite(self):
+        for src in CASOS:
+            with self.subTest(src=src):
+                self.assertEqual(tokenizar(Lexer, src), tokenizar(LexerRegexMestre, src))
+
+    def test_exemplos(self):
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if not fname.endswith('.cd'):
+                    continue
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    src = f.read()
+                with self.subTest(arquivo=fname):
+                    self.assertEqual(tokenizar(Lexer, src), tokenizar(LexerRegexMestre, src))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.frontend import analisar, analisar_arquivo
+from src.lexer.analisador_lexico_completo import Lexer
+from src.lexer.analisador_lexico_streaming import LexerStreaming
+from src.parser import parser as modulo_parser
+from src.parser.cache_ast import CacheAST
+from src.parser.parser import parse_cd
+from src.utils.erros import ErrorHandler
+from test.lexer_test.test_lexer_afd import CASOS, EXAMPLES_DIR
+
+
+def tokenizar(src):
+    eh = ErrorHandler()
+    return Lexer(src, error_handler=eh).tokenize_all(), [str(e) for e in eh.errors]
+
+
+def tokenizar_em_blocos(src, tamanho_bloco):
+    eh = ErrorHandler()
+    lexer = LexerStreaming(io.StringIO(src), error_handler=eh, tamanho_bloco=tamanho_bloco)
+    return lexer.tokenize_all(), [str(e) for e in eh.errors]
+
+
+class TestLexerStreaming(unittest.TestCase):
+    """Ler o fonte em blocos não pode alterar tokens, posições nem erros."""
+
+    def fontes(self):
+        yield from CASOS
+        yield 'var s = dna"' + 'ACGT' * 500 + '";\n/" ' + 'x\n' * 300 + '"/ fim'
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if fname.endswith('.cd'):
+                    with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                        yield f.read()
+
+    def test_blocos_pequenos(self):
+        for src in self.fontes():
+            esperado = tokenizar(src)
+            for tamanho in (1, 7, 64):
+                with self.subTest(src=src[:40], tamanho=tamanho):
+                    self.assertEqual(tokenizar_em_blocos(src, tamanho), esperado)
+
+    def test_parse_cd_streaming(self):
+        caminho = os.path.join(EXAMPLES_DIR, 'basicos', 'hello_world.cd')
+        self.assertEqual(parse_cd(caminho, streaming=True, cache=False),
+                         parse_cd(caminho, streaming=False, cache=False))
+
+    def test_diagnosticos_no_mesmo_handler(self):
+        src = 'function main(): int {\n  x = 1 @ 2;\n  return 0\n}\n'
+        em_blocos, inteiro = ErrorHandler(buffered=True), ErrorHandler(buffered=True)
+        programa = analisar_arquivo(io.StringIO(src), em_blocos)
+        self.assertEqual(programa, analisar(src, inteiro))
+        # erros léxicos e sintáticos, na mesma ordem da análise do fonte inteiro
+        self.assertEqual([str(e) for e in em_blocos.errors], [str(e) for e in inteiro.errors])
+        self.assertTrue({'LEX', 'SYN'} <= {e.code[:3] for e in em_blocos.errors})
+
+    def test_streaming_usa_o_cache(self):
+        caminho = os.path.join(EXAMPLES_DIR, 'basicos', 'hello_world.cd')
+        with tempfile.TemporaryDirectory() as d, mock.patch.dict(os.environ, {'CODON_CACHE_DIR': d}):
+            primeiro = parse_cd(caminho, streaming=True, cache=True)
+            with open(caminho, encoding='utf-8') as f:
+                self.assertEqual(CacheAST().carregar(f.read()), primeiro)
+            with mock.patch.object(modulo_parser, 'analisar_arquivo') as analisar_mock:
+                self.assertEqual(parse_cd(caminho, streaming=True, cache=True), primeiro)
+            analisar_mock.assert_not_called()
+
+    def test_streaming_nao_aceita_jobs(self):
+        caminho = os.path.join(EXAMPLES_DIR, 'basicos', 'hello_world.cd')
+        with self.assertRaises(ValueError):
+            parse_cd(caminho, streaming=True, jobs=2)
+
+    def test_quebras_crlf(self):
+        with tempfile.TemporaryDirectory() as d:
+            caminho = os.path.join(d, 'crlf.cd')
+            with open(caminho, 'wb') as f:
+                f.write(b'function main(): int {\r\n  print("oi");\r\n  return 0;\r\n}\r\n')
+            self.assertEqual(parse_cd(caminho, streaming=True, cache=False),
+                             parse_cd(caminho, streaming=False, cache=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
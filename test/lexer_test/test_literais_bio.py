@@ -0,0 +1,79 @@
+import random
+import re
+import unittest
+
+from src.lexer.analisador_lexico_completo import (
+    REGRAS, Lexer, LexerRegexMestre, escanear_literal_bio,
+)
+from src.frontend import analisar
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.buffer_tokens import TokenBuffer
+from src.parser.ast.ast_base import LiteralBio
+from src.parser.ast.parser_iterativo import ParserIterativo
+from src.semantic.analyzer import SemanticAnalyzer
+from src.utils.erros import ErrorHandler
+
+
+class TestLiteraisBio(unittest.TestCase):
+    """O scanner dedicado de literais biológicos deve seguir a regex de REGRAS."""
+
+    def test_equivale_a_regex(self):
+        regras = [(re.compile(r), t) for r, t in REGRAS if t in ('DNA_LIT', 'RNA_LIT', 'PROT_LIT')]
+        rnd = random.Random(11)
+        pedacos = ['dna"', 'rna"', 'prot"', '"', '\\', 'A', '\n', 'x']
+        for _ in range(1000):
+            src = ''.join(rnd.choice(pedacos) for _ in range(rnd.randint(0, 10)))
+            for pos in range(len(src)):
+                esperado = None
+                for regex, tipo in regras:
+                    m = regex.match(src, pos)
+                    if m:
+                        esperado = (m.end(), tipo)
+                with self.subTest(src=src, pos=pos):
+                    self.assertEqual(escanear_literal_bio(src, pos), esperado)
+
+    def test_tamanho_e_alfabeto(self):
+        src = 'dna"ACGTacgt" rna"ACGT" prot"MKVL" dna"" prot"MK*" x'
+        for lexer_cls in (Lexer, LexerRegexMestre, LexerAFD):
+            toks = lexer_cls(src).tokenize_all()
+            with self.subTest(lexer=lexer_cls.__name__):
+                self.assertEqual(
+                    [(t.tipo, t.tamanho, t.alfabeto_valido) for t in toks],
+                    [('DNA_LIT', 8, True), ('RNA_LIT', 4, False), ('PROT_LIT', 4, True),
+                     ('DNA_LIT', 0, True), ('PROT_LIT', 3, False), ('ID', None, None)],
+                )
+
+    def test_buffer_de_tokens(self):
+        src = 'dna"ACGT" prot"MK*" rna"A\nC"'
+        esperado = [(t.tamanho, t.alfabeto_valido) for t in Lexer(src).tokenize_all()]
+        self.assertEqual([(v.tamanho, v.alfabeto_valido) for v in TokenBuffer.tokenizar(src)], esperado)
+
+    def test_literal_invalido_com_quebra_de_linha(self):
+        toks = Lexer('dna"AC\nGT" x').tokenize_all()
+        self.assertFalse(toks[0].alfabeto_valido)
+        self.assertEqual((toks[1].linha, toks[1].coluna), (2, 4))
+
+    def test_ast_e_semantica_usam_as_marcas_do_lexer(self):
+        src = 'function f(): int {\n  var a = dna"ACGT";\n  var b = rna"ACGT";\n  return 0;\n}\n'
+        for parser_cls in (None, ParserIterativo):
+            with self.subTest(parser=parser_cls):
+                programa = analisar(src, ErrorHandler(buffered=True), *((parser_cls,) if parser_cls else ()))
+                a, b = (d.valor for d in programa.declaracoes[0].corpo[:2])
+                self.assertEqual(a, LiteralBio('ACGT', 'dna', 4, True))
+                self.assertEqual(b, LiteralBio('ACGT', 'rna', 4, False))
+        eh = ErrorHandler(buffered=True)
+        SemanticAnalyzer(eh).analyze(programa)
+        self.assertEqual([(e.code, e.line) for e in eh.errors], [('SEM031', 3)])
+        self.assertEqual((a.tipo_resolvido, b.tipo_resolvido), ('dna', 'rna'))
+
+    def test_literal_longo(self):
+        seq = 'ACGT' * 250_000
+        toks = Lexer(f'var s = dna"{seq}";').tokenize_all()
+        self.assertEqual(toks[3].tipo, 'DNA_LIT')
+        self.assertEqual(toks[3].tamanho, len(seq))
+        self.assertTrue(toks[3].alfabeto_valido)
+        self.assertEqual(toks[4].tipo, 'SEMI')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer
+from src.lote import coletar_arquivos, executar_lote, fragmentar_por_tamanho
+from src.utils.erros import ErrorHandler
+from test.lexer_test.test_lexer_afd import EXAMPLES_DIR
+
+
+class TestLote(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        arquivos = {
+            'ok.cd': 'function main(): int { return 0; }\n',
+            'lexico.cd': 'var x = 1; $\n',
+            'sintaxe.cd': 'function main(): int {\n  var x = 1\n  return x;\n}\n',
+            os.path.join('sub', 'grande.cd'): 'var x = 1;\n' * 500,
+        }
+        for nome, conteudo in arquivos.items():
+            caminho = os.path.join(self.dir, nome)
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            with open(caminho, 'w', encoding='utf-8') as f:
+                f.write(conteudo)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fragmentos_equilibrados(self):
+        arquivos = coletar_arquivos([self.dir])
+        self.assertEqual(len(arquivos), 4)
+        fragmentos = fragmentar_por_tamanho(arquivos, 2)
+        self.assertEqual(sorted(sum(fragmentos, [])), sorted(arquivos))
+        # o arquivo grande fica sozinho
+        self.assertIn([os.path.join(self.dir, 'sub', 'grande.cd')], fragmentos)
+
+    def test_check(self):
+        por_nome = {os.path.basename(r.arquivo): r for r in executar_lote([self.dir], 'check', jobs=2)}
+        self.assertEqual(por_nome['ok.cd'].diagnosticos, [])
+        self.assertEqual([d.codigo for d in por_nome['lexico.cd'].diagnosticos], ['LEX000'])
+        sintaxe = por_nome['sintaxe.cd'].diagnosticos
+        self.assertEqual([(d.codigo, d.linha) for d in sintaxe], [('SYN000', 3)])
+        self.assertEqual(por_nome['grande.cd'].tokens, 2500)
+
+    def test_lex_com_tokens_igual_sequencial(self):
+        paralelo = executar_lote([EXAMPLES_DIR], 'lex', jobs=3, com_tokens=True)
+        sequencial = executar_lote([EXAMPLES_DIR], 'lex', jobs=1)
+        self.assertEqual([r.arquivo for r in paralelo], [r.arquivo for r in sequencial])
+        self.assertEqual([r.diagnosticos for r in paralelo], [r.diagnosticos for r in sequencial])
+        for r in paralelo:
+            with open(r.arquivo, 'r', encoding='utf-8') as f:
+                esperado = Lexer(f.read(), ErrorHandler()).tokenize_all()
+            self.assertEqual(r.buffer.para_tokens(), esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
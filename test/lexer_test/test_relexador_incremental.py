@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer
+from src.lexer.relexador_incremental import _aberto_sem_fim, relexar
+from src.utils.erros import ErrorHandler
+from test.lexer_test.test_lexer_afd import CASOS
+
+FONTE = '''function main(): int {
+    var s = dna"ACGT";
+    /" comentário
+       de bloco "/
+    var x = 1.5e3 + 2;
+    print("ok");
+    return 0;
+}
+'''
+
+EDICOES = [
+    (FONTE.index('1.5e3'), 5, '42'),
+    (FONTE.index('ACGT'), 0, 'TT\nAA'),
+    (FONTE.index('"/'), 2, ''),            # desfaz o fechamento do comentário
+    (FONTE.index('return'), 0, '"/ '),     # volta a fechar mais adiante
+    (FONTE.index('"ok"'), 1, ''),          # string sem abertura
+    (FONTE.index('ACGT') + 4, 1, '\\"'),   # literal bio sem fechamento
+    (0, 0, '/" '),
+    (len(FONTE), 0, 'x'),
+]
+
+
+def campos(tokens):
+    return [(t.tipo, t.valor, t.linha, t.coluna, t.start_pos, t.end_pos) for t in tokens]
+
+
+def tokenizar(src):
+    return Lexer(src, error_handler=ErrorHandler()).tokenize_all()
+
+
+class TestRelexadorIncremental(unittest.TestCase):
+    """A re-tokenização incremental deve coincidir com re-tokenizar o arquivo inteiro."""
+
+    def verificar(self, src, offset, removidos, inserido):
+        novo, tokens = relexar(src, tokenizar(src), offset, removidos, inserido, ErrorHandler())
+        self.assertEqual(novo, src[:offset] + inserido + src[offset + removidos:])
+        self.assertEqual(campos(tokens), campos(tokenizar(novo)))
+
+    def test_edicoes(self):
+        for offset, removidos, inserido in EDICOES:
+            with self.subTest(offset=offset, inserido=inserido):
+                self.verificar(FONTE, offset, removidos, inserido)
+
+    def test_edicoes_aleatorias(self):
+        rnd = random.Random(3)
+        pedacos = list('ad"\\/\'n\n =<>-.+e1_$') + ['dna"', '/"', '"/', '1.5e']
+        for src in CASOS + [FONTE]:
+            for _ in range(200):
+                offset = rnd.randint(0, len(src))
+                removidos = rnd.randint(0, min(4, len(src) - offset))
+                inserido = ''.join(rnd.choice(pedacos) for _ in range(rnd.randint(0, 3)))
+                with self.subTest(src=src, offset=offset, removidos=removidos, inserido=inserido):
+                    self.verificar(src, offset, removidos, inserido)
+
+    def test_reaproveita_cauda(self):
+        src = 'var a = 1;\n' * 50
+        antigos = tokenizar(src)
+        _, novos = relexar(src, antigos, 4, 1, 'b')
+        self.assertEqual(campos(novos), campos(tokenizar('var b = 1;\n' + src[11:])))
+        # com deslocamento zero a cauda é reaproveitada sem cópia
+        self.assertIs(novos[-1], antigos[-1])
+
+    def test_edicoes_em_sequencia(self):
+        # cada edição parte do resultado da anterior, sem voltar a uma lista
+        rnd = random.Random(5)
+        pedacos = list('ad"\\/n\n =1') + ['dna"', '/"', '"/', 'var x = 1;\n']
+        src, tokens = FONTE * 3, tokenizar(FONTE * 3)
+        for _ in range(300):
+            offset = rnd.randint(0, len(src))
+            removidos = rnd.randint(0, min(4, len(src) - offset))
+            inserido = ''.join(rnd.choice(pedacos) for _ in range(rnd.randint(0, 3)))
+            src, tokens = relexar(src, tokens, offset, removidos, inserido, ErrorHandler(buffered=True))
+            self.assertEqual(campos(tokens), campos(tokenizar(src)))
+            self.assertEqual(tokens.abertos, [t.start_pos for t in tokenizar(src)
+                                              if _aberto_sem_fim(t, src)] if tokens.abertos is not None else None)
+
+    def test_cauda_deslocada_sem_copia(self):
+        src = 'var a = 1;\n' * 50
+        antigos = tokenizar(src)
+        _, novos = relexar(src, antigos, 4, 1, 'bb')
+        self.assertEqual(campos(novos), campos(tokenizar('var bb = 1;\n' + src[11:])))
+        # a cauda continua sendo a lista antiga, ajustada só no acesso
+        base, _, fim, d_pos, _ = novos._trechos[-1]
+        self.assertIs(base, antigos)
+        self.assertEqual((fim, d_pos), (len(antigos), 1))
+
+    def test_edicao_fora_dos_limites(self):
+        with self.assertRaises(ValueError):
+            relexar('abc', tokenizar('abc'), 2, 5, '')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import unittest
+
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.analisador_lexico_completo import Lexer, TokenStreamIndexado
+from src.parser.ast.arena import ENTRADA, SAIDA, Arena
+from src.parser.ast.ast_base import ExpressaoBinaria, Literal, Programa
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.parser.ast.parser_iterativo import ParserIterativo
+from src.utils.erros import ErrorHandler
+from test.parser_test.test_spans_ast import EXAMPLES_DIR, nos
+
+
+def analisar(src, parser_cls=ParserPratt, lexer_cls=Lexer):
+    eh = ErrorHandler(buffered=True)
+    return parser_cls(TokenStreamIndexado(lexer_cls(src, eh)), eh).parse()
+
+
+class TestArena(unittest.TestCase):
+
+    def test_ida_e_volta_nos_exemplos(self):
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if not fname.endswith('.cd'):
+                    continue
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    src = f.read()
+                with self.subTest(arquivo=fname):
+                    try:
+                        programa = analisar(src)
+                    except Exception:
+                        continue
+                    volta = Arena.do_programa(programa).para_programa()
+                    self.assertEqual(volta, programa)
+                    self.assertEqual(nos(volta), nos(programa))
+
+    def test_literais_distintos(self):
+        programa = Programa([Literal(1), Literal(1.0), Literal(True), Literal([1]), Literal((1,))])
+        arena = Arena.do_programa(programa)
+        self.assertEqual(arena.para_programa(), programa)
+        self.assertEqual([type(d.valor) for d in arena.para_programa().declaracoes],
+                         [int, float, bool, list, tuple])
+
+    def test_layout_e_consultas(self):
+        arena = Arena.do_programa(analisar("x = a + 2;"))
+        # Programa, InstrucaoAtribuicao, Variavel x, ExpressaoBinaria, Variavel a, Literal 2
+        self.assertEqual([arena.classe(i).__name__ for i in range(len(arena))],
+                         ['Programa', 'InstrucaoAtribuicao', 'Variavel', 'ExpressaoBinaria', 'Variavel', 'Literal'])
+        self.assertEqual(list(arena.filhos(1)), [2, 3])
+        self.assertEqual(list(arena.filhos(3)), [4, 5])
+        self.assertEqual(arena.pais[5], 3)
+        self.assertEqual(arena.campo(3, 'operador'), '+')
+        self.assertEqual(arena.campo(5, 'valor'), 2)
+        self.assertEqual(arena.forma(2), arena.forma(2))
+
+    def test_formas_compartilhadas(self):
+        arena = Arena.do_programa(analisar("x = a + b + c + d;"))
+        somas = [i for i in range(len(arena)) if arena.classe(i) is ExpressaoBinaria]
+        self.assertEqual(len(somas), 3)
+        self.assertEqual(len({arena.formas[i] for i in somas}), 1)
+
+    def test_percorrer(self):
+        arena = Arena.do_programa(analisar("function f(): int { if (a) { b = 1; } return c; }"))
+        eventos = list(arena.percorrer())
+        self.assertEqual([i for e, i in eventos if e == ENTRADA], list(range(len(arena))))
+        profundidade, abertos = 0, []
+        for evento, i in eventos:
+            if evento == ENTRADA:
+                if abertos:
+                    self.assertEqual(arena.pais[i], abertos[-1])
+                abertos.append(i)
+            else:
+                self.assertEqual(abertos.pop(), i)
+        self.assertEqual(abertos, [])
+        # subárvore de um nó
+        funcao = 1
+        sub = [i for e, i in arena.percorrer(funcao) if e == SAIDA]
+        self.assertEqual(sorted(sub), list(range(funcao, arena.fim[funcao])))
+
+    def test_arvore_profunda(self):
+        profundidade = 20000
+        src = "x = " + "(" * profundidade + "1 + 2" + ")" * profundidade + " * y;"
+        programa = analisar(src, ParserIterativo, LexerAFD)
+        arena = Arena.do_programa(programa)
+        self.assertEqual(len(arena), 8)
+        self.assertEqual(nos(arena.para_programa()), nos(programa))
+        src = "x = " + "- " * profundidade + "y;"
+        arena = Arena.do_programa(analisar(src, ParserIterativo, LexerAFD))
+        self.assertEqual(len(arena), profundidade + 4)
+        self.assertEqual(sum(1 for _ in arena.percorrer()), 2 * len(arena))
+
+
+if __name__ == '__main__':
+    unittest.main()
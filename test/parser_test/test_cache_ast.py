@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.parser import parser as modulo_parser
+from src.parser.cache_ast import EXTENSAO, CacheAST
+from src.parser.parser import parse_cd
+from src.utils.erros import CompilationError
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+HELLO = os.path.join(EXAMPLES_DIR, 'basicos', 'hello_world.cd')
+
+
+def entradas(diretorio):
+    return sorted(n for n in os.listdir(diretorio) if n.endswith(EXTENSAO)) if os.path.isdir(diretorio) else []
+
+
+class TestCacheAST(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.diretorio = self._tmp.name
+        patcher = mock.patch.dict(os.environ, {'CODON_CACHE_DIR': self.diretorio})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_ida_e_volta(self):
+        programa = parse_cd(HELLO, cache=False)
+        cache = CacheAST(self.diretorio)
+        with open(HELLO, encoding='utf-8') as f:
+            fonte = f.read()
+        self.assertIsNone(cache.carregar(fonte))
+        self.assertTrue(cache.salvar(fonte, programa))
+        self.assertEqual(cache.carregar(fonte), programa)
+        self.assertIsNone(cache.carregar(fonte + "\n"))
+
+    def test_parse_cd_usa_o_cache(self):
+        primeiro = parse_cd(HELLO, cache=True)
+        self.assertEqual(len(entradas(self.diretorio)), 1)
+        with mock.patch.object(modulo_parser, 'analisar', side_effect=AssertionError("não deveria tokenizar")):
+            self.assertEqual(parse_cd(HELLO, cache=True), primeiro)
+
+    def test_sem_cache(self):
+        parse_cd(HELLO, cache=False)
+        self.assertEqual(entradas(self.diretorio), [])
+
+    def test_cache_desligado_por_padrao(self):
+        # só a CLI liga o cache; chamadas da biblioteca não escrevem em disco
+        parse_cd(HELLO)
+        self.assertEqual(entradas(self.diretorio), [])
+
+    def test_programa_com_erros_nao_e_gravado(self):
+        caminho = os.path.join(self.diretorio, 'erro.cd')
+        with open(caminho, 'w', encoding='utf-8') as f:
+            f.write('var x = 1; $\n')
+        with mock.patch('builtins.print'), self.assertRaises(CompilationError):
+            parse_cd(caminho, cache=True)
+        self.assertEqual(entradas(self.diretorio), [])
+
+    def test_entrada_corrompida(self):
+        cache = CacheAST(self.diretorio)
+        fonte = 'var x = 1;'
+        os.makedirs(self.diretorio, exist_ok=True)
+        caminho = os.path.join(self.diretorio, cache.chave(fonte) + EXTENSAO)
+        with open(caminho, 'wb') as f:
+            f.write(b'lixo')
+        self.assertIsNone(cache.carregar(fonte))
+        self.assertFalse(os.path.exists(caminho))
+
+    def test_despejo_lru(self):
+        programa = parse_cd(HELLO, cache=False)
+        cache = CacheAST(self.diretorio)
+        fontes = [f'var x{i} = {i};' for i in range(3)]
+        for i, fonte in enumerate(fontes):
+            cache.salvar(fonte, programa)
+            os.utime(os.path.join(self.diretorio, cache.chave(fonte) + EXTENSAO), (1000 + i, 1000 + i))
+        cache.carregar(fontes[0])  # acerto: vira a mais recente
+
+        tamanho = os.path.getsize(os.path.join(self.diretorio, entradas(self.diretorio)[0]))
+        cache.limite_bytes = 2 * tamanho
+        cache.despejar()
+        self.assertIsNotNone(cache.carregar(fontes[0]))
+        self.assertIsNone(cache.carregar(fontes[1]))
+        self.assertIsNotNone(cache.carregar(fontes[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import random
+import unittest
+
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.analisador_lexico_completo import TokenStreamIndexado
+from src.parser.ast.ast_base import ExpressaoBinaria, InstrucaoIf, Literal
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.parser.ast.parser_iterativo import ParserIterativo
+from src.utils.erros import ErrorHandler
+from test.parser_test.test_parser_pratt import EXAMPLES_DIR, analisar, expressao_aleatoria
+
+PROFUNDIDADE = 20000
+
+
+def analisar_profundo(src):
+    eh = ErrorHandler(buffered=True)
+    programa = ParserIterativo(TokenStreamIndexado(LexerAFD(src, eh)), eh).parse()
+    return programa, eh
+
+
+class TestParserIterativo(unittest.TestCase):
+    """O modo com pilha explícita deve gerar as mesmas árvores do ParserPratt, sem limite de aninhamento."""
+
+    def test_exemplos(self):
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if not fname.endswith('.cd'):
+                    continue
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    src = f.read()
+                with self.subTest(arquivo=fname):
+                    self.assertEqual(analisar(ParserPratt, src), analisar(ParserIterativo, src))
+
+    def test_expressoes_aleatorias(self):
+        rnd = random.Random(13)
+        for _ in range(500):
+            src = f"function f(): int {{ x = {expressao_aleatoria(rnd)}; return 0; }}"
+            with self.subTest(src=src):
+                self.assertEqual(analisar(ParserPratt, src), analisar(ParserIterativo, src))
+
+    def test_erros_de_sintaxe(self):
+        for src in ("x = (1 + ;", "if (a { }", "function f(): int { return ) ; }", "print(1, new 3);",
+                    "while (x) { y = [1, 2; }", "for (var i = 0; i < n; i++) { z = f(; }"):
+            with self.subTest(src=src):
+                self.assertEqual(analisar(ParserPratt, src), analisar(ParserIterativo, src))
+
+    def test_parenteses_profundos(self):
+        src = "x = " + "(" * PROFUNDIDADE + "1 + 2" + ")" * PROFUNDIDADE + ";"
+        programa, eh = analisar_profundo(src)
+        self.assertFalse(eh.has_errors())
+        soma = programa.declaracoes[0].valor
+        self.assertIsInstance(soma, ExpressaoBinaria)
+        self.assertEqual((soma.esquerda, soma.direita), (Literal(1), Literal(2)))
+
+    def test_operadores_profundos(self):
+        src = "x = " + "- " * PROFUNDIDADE + "a" + " ** a" * PROFUNDIDADE + ";"
+        programa, eh = analisar_profundo(src)
+        self.assertFalse(eh.has_errors())
+        node, niveis = programa.declaracoes[0].valor, 0
+        while hasattr(node, 'direita'):
+            node, niveis = node.direita, niveis + 1
+        self.assertEqual(niveis, PROFUNDIDADE)
+
+    def test_ifs_aninhados(self):
+        src = "if (a) { " * PROFUNDIDADE + "x = 1;" + " } else { y = 2; }" * PROFUNDIDADE
+        programa, eh = analisar_profundo(src)
+        self.assertFalse(eh.has_errors())
+        node, niveis = programa.declaracoes[0], 0
+        while isinstance(node, InstrucaoIf):
+            self.assertEqual(len(node.bloco_else), 1)
+            node, niveis = node.bloco_if[0], niveis + 1
+        self.assertEqual(niveis, PROFUNDIDADE)
+
+    def test_cadeia_else_aninhada(self):
+        src = "if (a) { x = 1; } else { " * PROFUNDIDADE + "y = 2;" + " }" * PROFUNDIDADE
+        programa, eh = analisar_profundo(src)
+        self.assertFalse(eh.has_errors())
+        node, niveis = programa.declaracoes[0], 0
+        while isinstance(node, InstrucaoIf):
+            node, niveis = node.bloco_else[0], niveis + 1
+        self.assertEqual(niveis, PROFUNDIDADE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import unittest
+from unittest import mock
+
+from src.lexer.analisador_lexico_afd import LexerAFD
+from src.lexer.buffer_tokens import TokenBuffer
+from src.parser import paralelo
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.parser.paralelo import agrupar_faixas, faixas_declaracoes, parse_paralelo
+from src.utils.erros import ErrorHandler
+
+from test.parser_test.test_spans_ast import EXAMPLES_DIR, analisar, nos
+
+
+def gerar_fonte(n_funcoes: int) -> str:
+    partes = ['var int total = 0;\n', 'enum Cor { Vermelho, Verde };\n']
+    for i in range(n_funcoes):
+        partes.append(
+            f'function f{i}(a: int): int {{\n'
+            f'    var int x = a * {i} + 1;\n'
+            f'    if (x > {i}) {{ while (x > 0) {{ x = x - 1; }} }} else {{ x = 2; }}\n'
+            f'    return x;\n'
+            f'}}\n'
+        )
+        if i % 10 == 0:
+            partes.append(f'total = total + f{i}({i});\n')
+    partes.append('class Ponto { x: int; y: int; }\n')
+    return ''.join(partes)
+
+
+class TestParserParalelo(unittest.TestCase):
+
+    def test_faixas_por_declaracao(self):
+        src = 'var int a = 1; function f() { if (a) { a = 2; } } a = 3; enum E { A, B }; x = f();'
+        buf = TokenBuffer.tokenizar(src, ErrorHandler(buffered=True), lexer_cls=LexerAFD)
+        faixas = faixas_declaracoes(buf)
+        textos = [src[buf[i].start_pos:buf[f - 1].end_pos] for i, f in faixas]
+        self.assertEqual(textos, [
+            'var int a = 1;',
+            'function f() { if (a) { a = 2; } }',
+            'a = 3;',
+            'enum E { A, B };',
+            'x = f();',
+        ])
+
+    def test_agrupar_preserva_ordem(self):
+        faixas = [(i * 10, i * 10 + 10) for i in range(25)]
+        lotes = agrupar_faixas(faixas, 4)
+        self.assertLessEqual(len(lotes), 4)
+        self.assertEqual([f for lote in lotes for f in lote], faixas)
+
+    def test_igual_ao_sequencial(self):
+        src = gerar_fonte(200)
+        paralelo_ = parse_paralelo(src, jobs=2)
+        sequencial = analisar(ParserPratt, src)
+        self.assertEqual(paralelo_, sequencial)
+        self.assertEqual(nos(paralelo_), nos(sequencial))
+
+    def test_exemplos(self):
+        with mock.patch.object(paralelo, 'MIN_DECLARACOES_PARALELO', 1):
+            for root, _, files in os.walk(EXAMPLES_DIR):
+                for nome in sorted(files):
+                    if not nome.endswith('.cd'):
+                        continue
+                    with open(os.path.join(root, nome), encoding='utf-8') as f:
+                        src = f.read()
+                    with self.subTest(exemplo=nome):
+                        try:
+                            esperado = nos(analisar(ParserPratt, src))
+                        except Exception:
+                            continue
+                        obtido = parse_paralelo(src, jobs=2, error_handler=ErrorHandler(buffered=True))
+                        self.assertEqual(nos(obtido), esperado)
+
+    def test_erro_cai_no_sequencial(self):
+        src = gerar_fonte(100).replace('function f50(a: int): int {', 'function f50(a: int): int { x = * ;', 1)
+
+        def resultado(analisar_):
+            eh = ErrorHandler(buffered=True)
+            try:
+                arvore = analisar_(eh)
+            except Exception as e:
+                return type(e), str(e)
+            return nos(arvore), [str(e) for e in eh.flush()]
+
+        sequencial = resultado(lambda eh: ParserPratt(paralelo.TokenStreamIndexado(
+            TokenBuffer.tokenizar(src, eh, lexer_cls=LexerAFD)), eh).parse())
+        self.assertEqual(resultado(lambda eh: parse_paralelo(src, jobs=2, error_handler=eh)), sequencial)
+
+
+if __name__ == '__main__':
+    unittest.main()
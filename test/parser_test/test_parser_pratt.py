@@ -0,0 +1,66 @@
+import os
+import random
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer, TokenStream
+from src.parser.ast.ast_base import Parser
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.utils.erros import ErrorHandler
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+
+OPERADORES = ['||', '&&', '==', '!=', '<', '>', '<=', '>=', '<<', '>>', '+', '-', '|', '^',
+              '*', '/', '%', '&', '**', '..']
+PREFIXOS = ['', '', '', '-', '+', '!', '~']
+
+
+def analisar(parser_cls, src):
+    eh = ErrorHandler(buffered=True)
+    try:
+        ast = parser_cls(TokenStream(Lexer(src, eh)), eh).parse()
+    except Exception as e:
+        return ('exceção', type(e).__name__, str(e))
+    return ast, [str(e) for e in eh.errors]
+
+
+def expressao_aleatoria(rnd, profundidade=0):
+    if profundidade > 3 or rnd.random() < 0.3:
+        atomo = rnd.choice(['a', 'b', '1', '2.5', '"s"', 'f(x)', 'v[i]', 'p.c', 'n++'])
+        return rnd.choice(PREFIXOS) + atomo
+    esq = expressao_aleatoria(rnd, profundidade + 1)
+    dir_ = expressao_aleatoria(rnd, profundidade + 1)
+    texto = f"{esq} {rnd.choice(OPERADORES)} {dir_}"
+    return f"({texto})" if rnd.random() < 0.2 else texto
+
+
+class TestParserPratt(unittest.TestCase):
+    """O parser de expressões por precedência deve gerar as mesmas árvores do descendente recursivo."""
+
+    def test_exemplos(self):
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if not fname.endswith('.cd'):
+                    continue
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    src = f.read()
+                with self.subTest(arquivo=fname):
+                    self.assertEqual(analisar(Parser, src), analisar(ParserPratt, src))
+
+    def test_expressoes_aleatorias(self):
+        rnd = random.Random(4)
+        for _ in range(500):
+            src = f"function f(): int {{ x = {expressao_aleatoria(rnd)}; return 0; }}"
+            with self.subTest(src=src):
+                self.assertEqual(analisar(Parser, src), analisar(ParserPratt, src))
+
+    def test_precedencia_e_associatividade(self):
+        src = "function f(): int { x = -a ** b ** c * d - e < f && g || h .. i; }"
+        esperado = analisar(Parser, src)
+        self.assertEqual(esperado, analisar(ParserPratt, src))
+        atribuicao = esperado[0].declaracoes[0].corpo[0]
+        self.assertEqual(atribuicao.valor.operador, '..')
+        self.assertEqual(atribuicao.valor.esquerda.operador, '||')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import codon
+from src.lexer.analisador_lexico_completo import Lexer, TokenStreamIndexado
+from src.parser.ast.ast_base import (
+    LIMITE_ERROS_SINTATICOS, DeclaracaoFuncao, InstrucaoImpressao, InstrucaoRetorno, Parser,
+)
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.parser.ast.parser_iterativo import ParserIterativo
+from src.parser.parser import parse_cd
+from src.utils.erros import CompilationError, ErrorHandler
+
+ERRO_SINTAXE = os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'testes_manual',
+                            'erro_sintaxe_semicolon.cd')
+
+PARSERS = (Parser, ParserPratt, ParserIterativo)
+
+
+def analisar(parser_cls, src):
+    eh = ErrorHandler(buffered=True)
+    parser = parser_cls(TokenStreamIndexado(Lexer(src, eh)), eh)
+    return parser.parse(), eh.errors, parser
+
+
+class TestRecuperacaoErros(unittest.TestCase):
+
+    def test_ponto_e_virgula_faltando(self):
+        src = 'function main(): int {\n  var x = 1\n  print(x);\n  return x;\n}\nprocedure p() { print(2); }\n'
+        for cls in PARSERS:
+            with self.subTest(parser=cls.__name__):
+                programa, erros, _ = analisar(cls, src)
+                self.assertEqual([(e.code, e.line) for e in erros], [('SYN000', 3)])
+                main, p = programa.declaracoes
+                self.assertIsInstance(main, DeclaracaoFuncao)
+                # a instrução com erro some, as seguintes continuam no corpo
+                self.assertEqual([type(i) for i in main.corpo], [InstrucaoImpressao, InstrucaoRetorno])
+                self.assertEqual(p.nome, 'p')
+
+    def test_lixo_nao_gera_um_erro_por_token(self):
+        src = 'procedure f() { x = 1; }\n' + ') ] , ' * 2000 + '\nprocedure g() { return; }\n'
+        for cls in PARSERS:
+            with self.subTest(parser=cls.__name__):
+                programa, erros, parser = analisar(cls, src)
+                self.assertLessEqual(len(erros), 3)
+                self.assertGreater(parser.erros_em_cascata + len(erros), 0)
+                self.assertEqual([d.nome for d in programa.declaracoes if isinstance(d, DeclaracaoFuncao)],
+                                 ['f', 'g'])
+
+    def test_chave_faltando_no_bloco_interno(self):
+        src = 'procedure f() {\n  if (a) { x = ; \n  y = 2;\n}\nprocedure g() { return; }\n'
+        for cls in PARSERS:
+            with self.subTest(parser=cls.__name__):
+                programa, erros, _ = analisar(cls, src)
+                self.assertTrue(erros)
+                self.assertIn('g', [getattr(d, 'nome', None) for d in programa.declaracoes])
+
+    def test_limite_de_erros(self):
+        src = 'x = 1 +;\ny = 2;\n' * (LIMITE_ERROS_SINTATICOS * 2)
+        programa, erros, parser = analisar(ParserPratt, src)
+        self.assertEqual(len(erros), LIMITE_ERROS_SINTATICOS)
+
+    def test_mesmos_erros_nos_tres_parsers(self):
+        src = ('function f(a: int): int {\n  var b = a +* 2;\n  while (b > 0 { b = b - 1; }\n'
+               '  return b\n}\nenum E { A, B }\nclass C { x: int; }\nprint(f(1);\n')
+        esperado = [str(e) for e in analisar(Parser, src)[1]]
+        self.assertTrue(esperado)
+        for cls in PARSERS[1:]:
+            with self.subTest(parser=cls.__name__):
+                self.assertEqual([str(e) for e in analisar(cls, src)[1]], esperado)
+
+
+class TestErroSintaxeInterrompeCompilacao(unittest.TestCase):
+    """A recuperação serve para reportar todos os erros, não para compilar o programa recuperado."""
+
+    def test_parse_cd_levanta(self):
+        with redirect_stdout(io.StringIO()) as saida:
+            with self.assertRaises(CompilationError) as ctx:
+                parse_cd(ERRO_SINTAXE, cache=False)
+        self.assertEqual([e.code for e in ctx.exception.errors], ['SYN000'])
+        self.assertIn('SYN000', saida.getvalue())
+
+    def test_build_e_run_falham(self):
+        for cmd in ('build', 'run'):
+            with self.subTest(cmd=cmd):
+                saida, erros = io.StringIO(), io.StringIO()
+                with mock.patch.object(sys, 'argv', ['codon', cmd, ERRO_SINTAXE, '--quiet', '--no-cache']), \
+                        redirect_stdout(saida), redirect_stderr(erros):
+                    with self.assertRaises(SystemExit) as ctx:
+                        codon.main()
+                self.assertEqual(ctx.exception.code, 1)
+                self.assertNotIn('define', saida.getvalue())  # nenhum IR impresso
+                self.assertIn('Falha na compilação', erros.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import dataclasses
+import os
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer, TokenStreamIndexado
+from src.parser.ast.ast_base import ASTNode, ExpressaoBinaria, Parser, Variavel
+from src.parser.ast.expressao_pratt import ParserPratt
+from src.parser.ast.parser_iterativo import ParserIterativo
+from src.utils.erros import ErrorHandler
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+
+
+def analisar(parser_cls, src):
+    eh = ErrorHandler(buffered=True)
+    return parser_cls(TokenStreamIndexado(Lexer(src, eh)), eh).parse()
+
+
+def nos(arvore):
+    """Nós em pré-ordem, com (classe, line, col, span_start, span_end)."""
+    pilha, saida = [arvore], []
+    while pilha:
+        v = pilha.pop()
+        if isinstance(v, ASTNode):
+            saida.append((type(v).__name__, v.line, v.col, v.span_start, v.span_end))
+            pilha.extend(reversed([getattr(v, f.name) for f in dataclasses.fields(v)]))
+        elif isinstance(v, (list, tuple)):
+            pilha.extend(reversed(v))
+    return saida
+
+
+class TestSpansAST(unittest.TestCase):
+
+    def test_nos_sem_dict(self):
+        self.assertFalse(hasattr(Variavel('x'), '__dict__'))
+        with self.assertRaises(AttributeError):
+            Variavel('x').outro = 1
+
+    def test_posicao_fora_da_igualdade(self):
+        a, b = Variavel('x'), Variavel('x')
+        a.span_start, a.span_end = 3, 4
+        self.assertEqual(a, b)
+        self.assertEqual(repr(a), "Variavel(nome='x')")
+
+    def test_spans_cobrem_o_fonte(self):
+        src = "function f(): int {\n  x = a + b * c;\n  return g(x)[1].y;\n}\n"
+        for parser_cls in (Parser, ParserPratt, ParserIterativo):
+            with self.subTest(parser=parser_cls.__name__):
+                func = analisar(parser_cls, src).declaracoes[0]
+                self.assertEqual(src[func.span_start:func.span_end], src.rstrip('\n'))
+                atribuicao, retorno = func.corpo
+                self.assertEqual(src[atribuicao.span_start:atribuicao.span_end], "x = a + b * c;")
+                soma = atribuicao.valor
+                self.assertIsInstance(soma, ExpressaoBinaria)
+                self.assertEqual(src[soma.span_start:soma.span_end], "a + b * c")
+                self.assertEqual(src[soma.direita.span_start:soma.direita.span_end], "b * c")
+                tok_a = next(t for t in Lexer(src).tokenize_all() if t.valor == 'a')
+                self.assertEqual((soma.line, soma.col), (tok_a.linha, tok_a.coluna))
+                acesso = retorno.expressao
+                self.assertEqual(src[acesso.span_start:acesso.span_end], "g(x)[1].y")
+                self.assertEqual(src[acesso.alvo.span_start:acesso.alvo.span_end], "g(x)[1]")
+
+    def test_mesmos_spans_nos_tres_parsers(self):
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if not fname.endswith('.cd'):
+                    continue
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    src = f.read()
+                with self.subTest(arquivo=fname):
+                    try:
+                        esperado = nos(analisar(Parser, src))
+                    except Exception:
+                        continue
+                    self.assertEqual(esperado, nos(analisar(ParserPratt, src)))
+                    self.assertEqual(esperado, nos(analisar(ParserIterativo, src)))
+
+
+if __name__ == '__main__':
+    unittest.main()
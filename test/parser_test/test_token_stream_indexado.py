@@ -0,0 +1,77 @@
+import os
+import unittest
+
+from src.lexer.analisador_lexico_completo import Lexer, TokenStream, TokenStreamIndexado
+from src.lexer.buffer_tokens import TokenBuffer
+from src.parser.ast.ast_base import Parser
+from src.utils.erros import ErrorHandler
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+
+
+def analisar(criar_stream, src):
+    eh = ErrorHandler(buffered=True)
+    try:
+        ast = Parser(criar_stream(Lexer(src, eh)), eh).parse()
+    except Exception as e:
+        return ('exceção', type(e).__name__, str(e))
+    return ast, [str(e) for e in eh.errors]
+
+
+class TestTokenStreamIndexado(unittest.TestCase):
+
+    def test_peek_arbitrario(self):
+        ts = TokenStreamIndexado(Lexer('var x = 10;'))
+        self.assertEqual([ts.peek(i).tipo for i in range(1, 6)], ['KWD', 'ID', 'ASSIGN', 'DEC_INT', 'SEMI'])
+        self.assertIsNone(ts.peek(6))
+        self.assertEqual(ts.next().valor, 'var')
+        self.assertEqual(ts.peek(4).tipo, 'SEMI')
+        self.assertEqual(ts.expect('ID').valor, 'x')
+        self.assertIsNone(ts.accept('SEMI'))
+        self.assertEqual(ts.match('PLUS', 'ASSIGN').tipo, 'ASSIGN')
+
+    def test_mark_reset(self):
+        ts = TokenStreamIndexado(Lexer('a b c d'))
+        ts.next()
+        marca = ts.mark()
+        self.assertEqual([ts.next().valor, ts.next().valor], ['b', 'c'])
+        ts.reset(marca)
+        self.assertEqual(ts.next().valor, 'b')
+        ts.reset(0)
+        self.assertEqual(ts.peek().valor, 'a')
+
+    def test_fim_e_expect(self):
+        ts = TokenStreamIndexado([])
+        self.assertIsNone(ts.peek())
+        self.assertIsNone(ts.next())
+        with self.assertRaises(SyntaxError):
+            ts.expect('ID')
+
+    def test_push_back(self):
+        ts = TokenStreamIndexado(Lexer('a b'))
+        a = ts.next()
+        ts.push_back(a)
+        self.assertEqual(ts.mark(), 0)
+        extra = Lexer('z').next()
+        ts.push_back(extra)
+        self.assertEqual([ts.next().valor for _ in range(3)], ['z', 'a', 'b'])
+
+    def test_sobre_token_buffer(self):
+        buf = TokenBuffer.tokenizar('func f() { return 1; }')
+        ts = TokenStreamIndexado(buf)
+        self.assertEqual(ts.peek(3).tipo, 'LPAREN')
+        self.assertEqual([t for t in iter(ts.next, None)], list(buf))
+
+    def test_exemplos_mesma_ast(self):
+        for root, _, files in os.walk(EXAMPLES_DIR):
+            for fname in sorted(files):
+                if not fname.endswith('.cd'):
+                    continue
+                with open(os.path.join(root, fname), 'r', encoding='utf-8') as f:
+                    src = f.read()
+                with self.subTest(arquivo=fname):
+                    self.assertEqual(analisar(TokenStream, src), analisar(TokenStreamIndexado, src))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+
+from src.frontend import analisar
+from src.lote import executar_lote
+from src.semantic.analyzer import SemanticAnalyzer
+from src.semantic.incremental import analisar_incremental, caminho_estado
+from src.utils.erros import ErrorHandler
+
+BASE = """
+function dobro(x: int): int {
+    return x * 2;
+}
+
+function usa(a: int): int {
+    return dobro(a) + 1;
+}
+
+function errada(a: int): int {
+    return "texto";
+}
+
+function isolada(a: int): int {
+    return a;
+}
+"""
+
+
+def diagnosticos(eh):
+    return [(e.code, e.message, e.line, e.col) for e in eh.errors]
+
+
+class TestAnaliseIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = self._tmp.name
+
+    def analisar(self, fonte):
+        """Roda o modo incremental e confere que os diagnósticos são os da análise completa."""
+        eh = ErrorHandler(buffered=True)
+        analisador = analisar_incremental(analisar(fonte, ErrorHandler(buffered=True)), fonte,
+                                          'prog.cd', eh, self.dir)
+        completo = ErrorHandler(buffered=True)
+        SemanticAnalyzer(completo).analyze(analisar(fonte, ErrorHandler(buffered=True)))
+        self.assertEqual(diagnosticos(eh), diagnosticos(completo))
+        return analisador, eh
+
+    def test_primeira_execucao_analisa_tudo(self):
+        a, eh = self.analisar(BASE)
+        self.assertEqual((a.reanalisadas, a.reaproveitadas), (4, 0))
+        self.assertEqual([e.code for e in eh.errors], ['SEM012'])
+        self.assertTrue(os.path.exists(caminho_estado('prog.cd', self.dir)))
+
+    def test_sem_mudancas_reaproveita_tudo(self):
+        self.analisar(BASE)
+        a, eh = self.analisar(BASE)
+        self.assertEqual((a.reanalisadas, a.reaproveitadas), (0, 4))
+        self.assertEqual([e.code for e in eh.errors], ['SEM012'])
+
+    def test_so_a_declaracao_editada(self):
+        self.analisar(BASE)
+        a, _ = self.analisar(BASE.replace("return a;", "return a + 1;"))
+        self.assertEqual((a.reanalisadas, a.reaproveitadas), (1, 3))
+
+    def test_diagnosticos_acompanham_linhas_inseridas_acima(self):
+        self.analisar(BASE)
+        a, eh = self.analisar("\n\n\nx = 1;\n" + BASE)
+        self.assertEqual(a.reanalisadas, 0)
+        self.assertEqual(eh.errors[0].line, 15)
+
+    def test_dependentes_de_assinatura_alterada(self):
+        self.analisar(BASE)
+        editado = BASE.replace("function dobro(x: int): int", "function dobro(x: int, y: int): int")
+        a, eh = self.analisar(editado)
+        # `dobro` mudou e `usa` lê `dobro`: as duas são reanalisadas
+        self.assertEqual((a.reanalisadas, a.reaproveitadas), (2, 2))
+        self.assertIn('SEM009', [e.code for e in eh.errors])
+
+    def test_global_definida_no_topo(self):
+        fonte = "procedure p() {\n    print(total);\n}\n"
+        _, eh = self.analisar(fonte)
+        self.assertEqual([e.code for e in eh.errors], ['SEM003'])
+        a, eh = self.analisar("total = 3;\n" + fonte)
+        self.assertEqual(a.reanalisadas, 1)
+        self.assertFalse(eh.has_errors())
+
+    def test_estado_corrompido(self):
+        self.analisar(BASE)
+        with open(caminho_estado('prog.cd', self.dir), 'wb') as f:
+            f.write(b'lixo')
+        a, _ = self.analisar(BASE)
+        self.assertEqual(a.reanalisadas, 4)
+
+    def test_check_em_lote(self):
+        arquivo = os.path.join(self.dir, 'prog.cd')
+        with open(arquivo, 'w', encoding='utf-8') as f:
+            f.write(BASE)
+        for _ in range(2):
+            res, = executar_lote([arquivo], jobs=1, semantica=True, dir_semantico=self.dir)
+            self.assertEqual([d.codigo for d in res.diagnosticos], ['SEM012'])
+            self.assertEqual(res.diagnosticos[0].linha, 11)
+        res, = executar_lote([arquivo], jobs=1)
+        self.assertEqual(res.diagnosticos, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.frontend import analisar
+from src.lote import executar_lote
+from src.semantic import paralelo
+from src.semantic.analyzer import SemanticAnalyzer
+from src.semantic.incremental import analisar_incremental
+from src.semantic.paralelo import analisar_paralelo
+from src.utils.erros import ErrorHandler
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'examples')
+
+
+def gerar_fonte(n_funcoes: int) -> str:
+    partes = []
+    for i in range(n_funcoes):
+        # algumas funções com erro, e globais definidas entre elas
+        retorno = '"x"' if i % 7 == 0 else f'c + total{i // 10 * 10}'
+        partes.append(
+            f'function f{i}(a: int): int {{\n'
+            f'    c = a * {i};\n'
+            f'    if (c > 3) {{ c = c - f{max(i - 1, 0)}(a); }}\n'
+            f'    return {retorno};\n'
+            f'}}\n'
+        )
+        if i % 10 == 9:
+            partes.append(f'total{i - 9} = {i};\n')
+    return ''.join(partes)
+
+
+def diagnosticos(eh):
+    return [(e.code, e.message, e.line, e.col) for e in eh.errors]
+
+
+def sequencial(fonte):
+    eh = ErrorHandler(buffered=True)
+    SemanticAnalyzer(eh).analyze(analisar(fonte, ErrorHandler(buffered=True)))
+    return diagnosticos(eh)
+
+
+class TestSemanticaParalela(unittest.TestCase):
+
+    def comparar(self, fonte, jobs=2):
+        eh = ErrorHandler(buffered=True)
+        analisar_paralelo(analisar(fonte, ErrorHandler(buffered=True)), eh, jobs)
+        esperado = sequencial(fonte)
+        self.assertEqual(diagnosticos(eh), esperado)
+        return esperado
+
+    def test_igual_ao_sequencial(self):
+        with mock.patch.object(paralelo, 'MIN_UNIDADES_PARALELO', 1):
+            esperado = self.comparar(gerar_fonte(60))
+        # os erros de retorno e os de globais ainda não definidas, em ordem de linha
+        self.assertIn('SEM012', [d[0] for d in esperado])
+        self.assertIn('SEM003', [d[0] for d in esperado])
+        self.assertEqual([d[2] for d in esperado], sorted(d[2] for d in esperado))
+
+    def test_no_proprio_processo(self):
+        self.comparar(gerar_fonte(30), jobs=1)
+
+    def test_exemplos(self):
+        with mock.patch.object(paralelo, 'MIN_UNIDADES_PARALELO', 1):
+            for raiz, _, nomes in os.walk(EXAMPLES_DIR):
+                for nome in sorted(n for n in nomes if n.endswith('.cd')):
+                    with self.subTest(arquivo=nome):
+                        with open(os.path.join(raiz, nome), encoding='utf-8') as f:
+                            self.comparar(f.read())
+
+    def test_incremental_em_paralelo(self):
+        fonte = gerar_fonte(40)
+        with tempfile.TemporaryDirectory() as d, mock.patch.object(paralelo, 'MIN_UNIDADES_PARALELO', 1):
+            for texto in (fonte, fonte.replace('c = a * 5;', 'c = a * 6;')):
+                eh = ErrorHandler(buffered=True)
+                a = analisar_incremental(analisar(texto, ErrorHandler(buffered=True)), texto, 'p.cd', eh, d, jobs=2)
+                self.assertEqual(diagnosticos(eh), sequencial(texto))
+            self.assertEqual((a.reanalisadas, a.reaproveitadas), (1, 39))
+
+    def test_check_de_um_arquivo(self):
+        fonte = gerar_fonte(20)
+        with tempfile.TemporaryDirectory() as d, mock.patch.object(paralelo, 'MIN_UNIDADES_PARALELO', 1):
+            arquivo = os.path.join(d, 'p.cd')
+            with open(arquivo, 'w', encoding='utf-8') as f:
+                f.write(fonte)
+            res, = executar_lote([arquivo], jobs=2, semantica=True)
+        self.assertEqual([(x.codigo, x.mensagem, x.linha, x.coluna) for x in res.diagnosticos], sequencial(fonte))
+
+
+if __name__ == '__main__':
+    unittest.main()
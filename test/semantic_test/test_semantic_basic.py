@@ -12,8 +12,7 @@ class TestSemanticBasic(unittest.TestCase):
     # Ajudante corrigido: Usando is_procedure
     def make_func(self, name, params, return_type, corpo, is_proc=False):
         params_typed = [(p, 'int') for p in params]
-        # CORREÇÃO: Usar is_procedure=is_proc
-        return DeclaracaoFuncao(name, params_typed, return_type, corpo, is_procedure=is_proc)
+        return DeclaracaoFuncao(name, params_typed, corpo, is_proc, return_type)
 
     def run_analyzer(self, decls):
         eh = ErrorHandler()
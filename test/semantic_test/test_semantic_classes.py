@@ -42,12 +42,12 @@ class TestSemanticClasses(unittest.TestCase):
         main_func = DeclaracaoFuncao(
             "main",
             [],
-            "void", # Tipo de retorno
             [
                 InstrucaoAtribuicao(Variavel("a"), "=", Literal(10)), # 'a' se torna 'int'
                 AcessoCampo(Variavel("a"), "x") # Tenta acessar 'x' em 'a' (int)
             ],
-            is_procedure=True
+            is_procedure=True,
+            tipo_retorno="void"
         )
 
         prog = Programa([cls, main_func])
@@ -40,15 +40,15 @@ class TestSemanticFunctions(unittest.TestCase):
     # ----------------------------------------------------------
     def test_function_call_wrong_arity(self):
         # A aridade de 'f' é 2 (a, b)
-        f = DeclaracaoFuncao("f", [("a", "int"), ("b", "int")], "int", [InstrucaoRetorno(Literal(1))])
+        f = DeclaracaoFuncao("f", [("a", "int"), ("b", "int")], [InstrucaoRetorno(Literal(1))], False, "int")
 
         # Colocamos a chamada em uma função procedure para isolar o SEM009
         main = DeclaracaoFuncao(
             "main",
             [],
-            "void", # CORREÇÃO: Adicionar tipo_retorno
             [InstrucaoAtribuicao(Variavel("x"), "<-", ChamadaFuncao(Variavel("f"), [Literal(1)]))], # Só 1 argumento
-            is_procedure=True
+            is_procedure=True,
+            tipo_retorno="void"
         )
 
         prog = Programa([f, main])
@@ -66,9 +66,9 @@ class TestSemanticFunctions(unittest.TestCase):
         call = DeclaracaoFuncao(
             "main",
             [],
-            "void", # CORREÇÃO: Adicionar tipo_retorno
             [InstrucaoAtribuicao(Variavel("x"), "<-", ChamadaFuncao(Variavel("g"), []))],
-            is_procedure=True
+            is_procedure=True,
+            tipo_retorno="void"
         )
 
         prog = Programa([call])
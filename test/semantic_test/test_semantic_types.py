@@ -1,4 +1,5 @@
 import unittest
+from src.frontend import analisar
 from src.semantic.analyzer import SemanticAnalyzer
 from src.parser.ast.ast_base import (
     Programa, DeclaracaoFuncao, InstrucaoAtribuicao,
@@ -19,8 +20,8 @@ class TestSemanticTypes(unittest.TestCase):
     # Função auxiliar corrigida: usa is_procedure
     def make_func(self, nome, corpo, is_proc=False):
         tipo_retorno = "void" if is_proc else "int"
-        # O campo correto na AST é 'is_procedure'
-        return DeclaracaoFuncao(nome, [], tipo_retorno, corpo, is_procedure=is_proc)
+        # Ordem da AST: nome, parametros, corpo, is_procedure, tipo_retorno
+        return DeclaracaoFuncao(nome, [], corpo, is_proc, tipo_retorno)
 
     # ----------------------------------------------------------
     # 1. Checagem de Tipo em Expressão Binária (SEM010)
@@ -113,7 +114,8 @@ class TestSemanticTypes(unittest.TestCase):
             tipo_retorno="int",
             corpo=[
                 InstrucaoRetorno(Literal("nao sou int")) # Retorna string
-            ]
+            ],
+            is_procedure=False
         )
         eh = self.run_analyzer([func])
         self.assertEqual(len(eh.errors), 1)
@@ -139,5 +141,50 @@ class TestSemanticTypes(unittest.TestCase):
         self.assertEqual(eh.errors[0].code, "SEM013")
 
 
+
+def codigos(fonte):
+    eh = ErrorHandler(buffered=True)
+    SemanticAnalyzer(eh).analyze(analisar(fonte, ErrorHandler(buffered=True)))
+    return [e.code for e in eh.errors]
+
+
+class TestConstrucoesTipadas(unittest.TestCase):
+    """Construções que o codegen aceita: tipadas sem falsos positivos, com os erros reais ainda acusados."""
+
+    def test_operadores_bit_a_bit_e_potencia(self):
+        self.assertEqual(codigos("procedure p() { a = 6 & 3; b = a << 2; c = 2 ** 3 + b; }"), [])
+        self.assertEqual(codigos("procedure p() { a = 1.5 & 3; }"), ['SEM010'])
+
+    def test_builtins_e_length(self):
+        fonte = 'procedure p() { s = input(); n = inputInt() + s.length; printInt(n); t = substring(s, 0, n); }'
+        self.assertEqual(codigos(fonte), [])
+        self.assertEqual(codigos("procedure p() { printInt(1, 2); }"), ['SEM009'])
+
+    def test_mapas_arrays_e_foreach(self):
+        fonte = """
+procedure p() {
+    m = new map[string, int](8);
+    m["a"] = 1;
+    a = [1, 2, 3];
+    for (x in a[0..2]) { m["b"] = x + 1; }
+    g = new int[2][3];
+    g[0][1] = m["a"];
+}
+"""
+        self.assertEqual(codigos(fonte), [])
+        self.assertEqual(codigos('procedure p() { m = new map[string, int](8); m[1] = 2; }'), ['SEM017'])
+        self.assertEqual(codigos('procedure p() { for (x in 3) { print(x); } }'), ['SEM032'])
+
+    def test_enum_e_genericos(self):
+        fonte = """
+enum Cor { Verde = 1, Azul = 2 };
+class Caixa<T> { valor: T; }
+function id<T>(x: T): T { return x; }
+procedure p() { c = Cor.Verde; if (c == Cor.Azul) { print(id<int>(c)); } }
+"""
+        self.assertEqual(codigos(fonte), [])
+        self.assertEqual(codigos("enum Cor { Verde = 1 };\nprocedure p() { c = Cor.Roxo; }"), ['SEM028'])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
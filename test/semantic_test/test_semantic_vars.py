@@ -75,9 +75,6 @@ class TestSemanticVariables(unittest.TestCase):
 
         an.analyze(prog)
 
-        # CORREÇÃO: Esperar 2 erros (SEM003 por 'x' e SEM010 por tipo desconhecido)
-        self.assertEqual(len(eh.errors), 2, msg=f"Esperado 2 erros. Erros: {eh.errors}")
-
-        error_codes = {e.code for e in eh.errors}
-        self.assertIn("SEM003", error_codes)
-        self.assertIn("SEM010", error_codes) # Erro em cascata devido ao tipo 'unknown' de 'x'
\ No newline at end of file
+        # Só o SEM003 por 'x': a soma com o operando de tipo desconhecido não gera
+        # um SEM010 em cascata
+        self.assertEqual([e.code for e in eh.errors], ['SEM003'], msg=f"Erros: {eh.errors}")
\ No newline at end of file
@@ -0,0 +1,102 @@
+import unittest
+
+from src.frontend import analisar
+from src.semantic.analyzer import SemanticAnalyzer
+from src.semantic.tabela_simbolos import Symbol, SymbolTable
+from src.utils.erros import ErrorHandler
+
+
+class TestTabelaSimbolos(unittest.TestCase):
+
+    def setUp(self):
+        self.eh = ErrorHandler(buffered=True)
+        self.glob = SymbolTable()
+
+    def test_enderecos(self):
+        a = Symbol('a', 'int', 'var')
+        b = Symbol('b', 'int', 'var')
+        self.glob.define(a, self.eh)
+        self.glob.define(b, self.eh)
+        interno = self.glob.enter_scope("f")
+        c = Symbol('c', 'float', 'var')
+        interno.define(c, self.eh)
+        self.assertEqual((a.profundidade, a.slot), (0, 0))
+        self.assertEqual((b.profundidade, b.slot), (0, 1))
+        self.assertEqual((c.profundidade, c.slot), (1, 0))
+        self.assertEqual(interno.slots, [c])
+
+    def test_sombreamento_e_saida(self):
+        fora = Symbol('x', 'int', 'var')
+        self.glob.define(fora, self.eh)
+        f = self.glob.enter_scope("f")
+        dentro = Symbol('x', 'string', 'var')
+        f.define(dentro, self.eh)
+        bloco = f.enter_scope("if_block")
+        self.assertIs(bloco.lookup('x'), dentro)
+        # consultar um escopo externo ainda aberto não enxerga os internos
+        self.assertIs(self.glob.lookup('x'), fora)
+        self.assertIs(bloco.exit_scope().exit_scope(), self.glob)
+        self.assertIs(self.glob.lookup('x'), fora)
+        # escopo fechado continua consultável pela cadeia de pais
+        self.assertIs(f.lookup('x'), dentro)
+        self.assertIsNone(self.glob.lookup('y'))
+
+    def test_define_no_externo_com_filho_aberto(self):
+        f = self.glob.enter_scope("f")
+        dentro = Symbol('x', 'string', 'var')
+        f.define(dentro, self.eh)
+        fora = Symbol('x', 'int', 'var')
+        self.glob.define(fora, self.eh)
+        self.assertIs(f.lookup('x'), dentro)
+        self.assertIs(self.glob.lookup('x'), fora)
+        f.exit_scope()
+        self.assertIs(self.glob.lookup('x'), fora)
+        self.assertIs(self.glob.enter_scope("g").lookup('x'), fora)
+
+    def test_irmaos_nao_se_enxergam(self):
+        primeiro = self.glob.enter_scope("if_block")
+        primeiro.define(Symbol('t', 'int', 'var'), self.eh)
+        primeiro.exit_scope()
+        segundo = self.glob.enter_scope("else_block")
+        self.assertIsNone(segundo.lookup('t'))
+        self.assertIsNotNone(primeiro.lookup('t'))
+
+    def test_redeclaracao(self):
+        self.assertTrue(self.glob.define(Symbol('a', 'int', 'var'), self.eh))
+        self.assertFalse(self.glob.define(Symbol('a', 'int', 'var'), self.eh))
+        self.assertEqual([e.code for e in self.eh.errors], ['SEM001'])
+        self.assertEqual(len(self.glob.slots), 1)
+
+    def test_symbol_sem_dict(self):
+        s = Symbol('f', 'int', 'function', param_count=2)
+        self.assertFalse(hasattr(s, '__dict__'))
+        with self.assertRaises(AttributeError):
+            s.qualquer = 1
+
+    def test_usos_apontam_para_a_declaracao(self):
+        programa = analisar("""
+procedure p(n: int) {
+    a = n;
+    if (a < 3) {
+        b = a + n;
+        a = b;
+    }
+}
+""", ErrorHandler(buffered=True))
+        SemanticAnalyzer(self.eh).analyze(programa)
+        self.assertFalse(self.eh.has_errors(), self.eh.errors)
+        corpo = programa.declaracoes[0].corpo
+        a = corpo[0].alvo.simbolo
+        n = corpo[0].valor.simbolo
+        self.assertEqual((n.kind, n.profundidade, n.slot), ('param', 1, 0))
+        self.assertEqual((a.profundidade, a.slot), (1, 1))
+        bloco = corpo[1].bloco_if
+        soma = bloco[0].valor
+        self.assertIs(soma.esquerda.simbolo, a)
+        self.assertIs(soma.direita.simbolo, n)
+        self.assertEqual((bloco[0].alvo.simbolo.profundidade, bloco[0].alvo.simbolo.slot), (2, 0))
+        self.assertIs(bloco[1].alvo.simbolo, a)
+
+
+if __name__ == '__main__':
+    unittest.main()
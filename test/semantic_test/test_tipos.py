@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+from llvmlite import ir
+
+from src.codegen.llvm_codegen import LLVMCodeGenerator
+from src.semantic import tipos
+from src.semantic.tipos import BOOL, DNA, FLOAT, INT, RNA, STRING, Tipo, resultado_binario, tipo
+
+
+class TestUniversoDeTipos(unittest.TestCase):
+
+    def test_internado(self):
+        self.assertIs(tipo('int'), INT)
+        self.assertIs(tipo(''.join(['Pon', 'to'])), tipo('Ponto'))
+        self.assertIsNone(tipo(None))
+        self.assertIs(tipos.por_id(INT.id), INT)
+
+    def test_continua_string(self):
+        self.assertIsInstance(INT, str)
+        self.assertEqual(INT, 'int')
+        self.assertEqual(f"{STRING}", 'string')
+        self.assertEqual(hash(tipo('Array<int>')), hash('Array<int>'))
+
+    def test_pickle_reinterna(self):
+        copia = pickle.loads(pickle.dumps((DNA, tipo('Ponto'))))
+        self.assertIs(copia[0], DNA)
+        self.assertIs(copia[1], tipo('Ponto'))
+        self.assertIs(type(copia[1]), Tipo)
+
+    def test_tabela_igual_as_regras(self):
+        primitivos = [tipo(n) for n in tipos.PRIMITIVOS]
+        for op in tipos.OPERADORES_BINARIOS:
+            for esq in primitivos:
+                for dir_ in primitivos:
+                    self.assertIs(resultado_binario(op, esq, dir_), tipos._regra_binaria(op, esq, dir_),
+                                  (op, esq, dir_))
+
+    def test_resultados(self):
+        self.assertIs(resultado_binario('+', INT, FLOAT), FLOAT)
+        self.assertIs(resultado_binario('<', INT, FLOAT), BOOL)
+        self.assertIs(resultado_binario('->', DNA, RNA), RNA)
+        self.assertIsNone(resultado_binario('+', STRING, INT))
+        self.assertIsNone(resultado_binario('+', tipo('Ponto'), tipo('Ponto')))
+        self.assertIs(resultado_binario('**', INT, INT), INT)
+        self.assertIs(resultado_binario('<<', INT, INT), INT)
+        self.assertIsNone(resultado_binario('&', INT, FLOAT))
+        self.assertIs(resultado_binario('+', STRING, tipo('char')), STRING)
+
+    def test_tipos_llvm(self):
+        gen = LLVMCodeGenerator()
+        self.assertEqual(gen._type_from_name('int'), ir.IntType(32))
+        self.assertEqual(gen._type_from_name(tipo('double')), ir.DoubleType())
+        self.assertEqual(gen._type_from_name('decimal'), ir.DoubleType())
+        self.assertEqual(gen._type_from_name('bool'), ir.IntType(1))
+        self.assertEqual(gen._type_from_name('string'), ir.IntType(8).as_pointer())
+        self.assertEqual(gen._type_from_name('dna'), ir.IntType(8).as_pointer())
+
+
+if __name__ == '__main__':
+    unittest.main()